@@ -0,0 +1,68 @@
+"""Standalone benchmark runner, not requiring pytest-benchmark:
+
+```bash
+python -m benchmarks --output benchmark.json
+```
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from benchmarks.cases import MEMORY_GROUP, all_cases, memory_implementations, memory_per_instance
+from compclasses import __version__
+
+
+def time_case(stmt, repeat: int) -> Dict[str, float]:
+    """Times `stmt` using `timeit`, returning min/median nanoseconds per call."""
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    timings = sorted(t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number))
+    return {"min_ns": timings[0], "median_ns": timings[len(timings) // 2], "number": number}
+
+
+def run(filter_: str = "", repeat: int = 5) -> Dict[str, Any]:
+    """Runs every benchmark case whose group contains `filter_`, memory measurements included (see `MEMORY_GROUP`),
+    returning the results as a JSON-serialisable dict."""
+    timings: List[Dict[str, Any]] = []
+    for case in all_cases():
+        if filter_ in case.group:
+            timings.append({"group": case.group, "name": case.name, **time_case(case.setup(), repeat)})
+            print(f"{case.group:<32} {case.name:<24} {timings[-1]['min_ns']:>14.1f} ns", file=sys.stderr)
+
+    memory: List[Dict[str, Any]] = []
+    if filter_ in MEMORY_GROUP:
+        for name, factory in memory_implementations().items():
+            memory.append({"group": MEMORY_GROUP, "name": name, "bytes_per_instance": memory_per_instance(factory)})
+            print(f"{MEMORY_GROUP:<32} {name:<24} {memory[-1]['bytes_per_instance']:>14.1f} B", file=sys.stderr)
+
+    return {
+        "compclasses_version": __version__,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "timings": timings,
+        "memory": memory,
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark compclasses delegation overhead.")
+    parser.add_argument("-o", "--output", default="-", help="JSON output file, '-' for stdout (default).")
+    parser.add_argument("-k", "--filter", default="", help="Only run groups containing this string.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of timing repetitions per case.")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat)
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
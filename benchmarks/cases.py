@@ -0,0 +1,400 @@
+"""Benchmark cases measuring the overhead of delegation.
+
+Each case is a `Case(group, name, setup)` where `setup()` builds whatever is needed and returns the zero-arguments
+callable to time. Cases are shared by the pytest-benchmark suite (`benchmarks/delegation_test.py`) and by the
+standalone runner (`python -m benchmarks`).
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Type
+
+from compclasses import CompclassMeta, call_all, clear_cache, compclass, delegatee, gather
+
+
+class Case(NamedTuple):
+    """Single benchmark case."""
+
+    group: str
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+class Foo:
+    """Delegatee class used in the benchmarks."""
+
+    a: int = 1
+
+    def __init__(self, value: int = 1):
+        self.value = value
+        self.items = list(range(10))
+
+    def zero(self):
+        """Method without arguments."""
+        return self.value
+
+    def one(self, x):
+        """Method with one argument."""
+        return x
+
+    def three(self, x, y, z):
+        """Method with three arguments."""
+        return x
+
+    def kw(self, x, *, y=1):
+        """Method with a keyword argument."""
+        return y
+
+    def __len__(self):
+        return 10
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+METHODS = ("zero", "one", "three", "kw")
+DUNDERS = ("__len__", "__iter__")
+DELEGATES = {"_foo": delegatee(Foo, ("a", "value", *METHODS, *DUNDERS))}
+CACHED_DELEGATES = {"_foo": delegatee(Foo, ("a", "value", *METHODS, *DUNDERS), cache_bound=True)}
+PROTOCOL_DELEGATES = {"_foo": delegatee(Foo, ("a", "value", *METHODS), protocols=("container",))}
+# Group of the memory measurements, see `memory_per_instance`.
+MEMORY_GROUP = "memory_per_instance"
+
+
+class Inherited(Foo):
+    """Reference: the same interface obtained via inheritance."""
+
+
+class HandWritten:
+    """Reference: hand-written forwarding wrapper."""
+
+    def __init__(self, foo: Foo):
+        self._foo = foo
+
+    @property
+    def a(self):
+        return self._foo.a
+
+    @property
+    def value(self):
+        return self._foo.value
+
+    @value.setter
+    def value(self, value):
+        self._foo.value = value
+
+    @value.deleter
+    def value(self):
+        del self._foo.value
+
+    def zero(self):
+        return self._foo.zero()
+
+    def one(self, x):
+        return self._foo.one(x)
+
+    def three(self, x, y, z):
+        return self._foo.three(x, y, z)
+
+    def kw(self, x, *, y=1):
+        return self._foo.kw(x, y=y)
+
+    def __len__(self):
+        return len(self._foo)
+
+    def __iter__(self):
+        return iter(self._foo)
+
+
+def make_composed(delegates: Dict[str, delegatee] = DELEGATES, **options: Any) -> Type:
+    """Creates a class composed with `compclass` over `Foo`, forwarding `DELEGATES` by default."""
+
+    class Composed:
+        def __init__(self, foo: Foo):
+            self._foo = foo
+
+    return compclass(Composed, delegates=delegates, verbose=False, **options)
+
+
+def implementations() -> Dict[str, Callable[[], Any]]:
+    """Returns a factory for an instance of each implementation to compare."""
+    composed = make_composed()
+    compiled = make_composed(compiled=True)
+    slotted = make_composed(compiled=True, slots=True)
+    cached = make_composed(CACHED_DELEGATES)
+    protocols = make_composed(PROTOCOL_DELEGATES, compiled=True)
+
+    return {
+        "inheritance": lambda: Inherited(),
+        "hand_written": lambda: HandWritten(Foo()),
+        "compclass": lambda: composed(Foo()),
+        "compclass_compiled": lambda: compiled(Foo()),
+        "compclass_slots": lambda: slotted(Foo()),
+        "compclass_cache_bound": lambda: cached(Foo()),
+        "compclass_protocols": lambda: protocols(Foo()),
+    }
+
+
+def attribute_cases() -> List[Case]:
+    """Attribute get/set/delete through the forwarding properties."""
+
+    def get_setup(factory: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+            return lambda: obj.value
+
+        return setup
+
+    def set_setup(factory: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+
+            def stmt():
+                obj.value = 2
+
+            return stmt
+
+        return setup
+
+    def del_setup(factory: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+
+            def stmt():
+                obj.value = 2
+                del obj.value
+
+            return stmt
+
+        return setup
+
+    return [
+        Case(f"attribute_{op}", name, make_setup(factory))
+        for op, make_setup in (("get", get_setup), ("set", set_setup), ("set_del", del_setup))
+        for name, factory in implementations().items()
+    ]
+
+
+def method_cases() -> List[Case]:
+    """Method calls with various arities."""
+    calls: Dict[str, Callable[[Any], Any]] = {
+        "zero": lambda obj: obj.zero(),
+        "one": lambda obj: obj.one(1),
+        "three": lambda obj: obj.three(1, 2, 3),
+        "kw": lambda obj: obj.kw(1, y=2),
+    }
+
+    def make_setup(factory: Callable[[], Any], call: Callable[[Any], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+            return lambda: call(obj)
+
+        return setup
+
+    return [
+        Case(f"method_{arity}", name, make_setup(factory, call))
+        for arity, call in calls.items()
+        for name, factory in implementations().items()
+    ]
+
+
+def dunder_cases() -> List[Case]:
+    """Dunder protocol calls, i.e. `len()` and iteration."""
+
+    def len_setup(factory: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+            return lambda: len(obj)
+
+        return setup
+
+    def iter_setup(factory: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = factory()
+            return lambda: list(obj)
+
+        return setup
+
+    return [
+        Case(f"dunder_{op}", name, make_setup(factory))
+        for op, make_setup in (("len", len_setup), ("iter", iter_setup))
+        for name, factory in implementations().items()
+    ]
+
+
+def batch_cases(n_objs: int = 1000) -> List[Case]:
+    """Attribute reads and method calls over a list of composed instances, per object vs batched."""
+    composed = make_composed()
+
+    def make_setup(stmt: Callable[[List[Any]], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            objs = [composed(Foo()) for _ in range(n_objs)]
+            return lambda: stmt(objs)
+
+        return setup
+
+    return [
+        Case(f"batch_get_{n_objs}", "list_comprehension", make_setup(lambda objs: [obj.value for obj in objs])),
+        Case(f"batch_get_{n_objs}", "gather", make_setup(lambda objs: gather(objs, "value", as_array=False))),
+        Case(f"batch_call_{n_objs}", "list_comprehension", make_setup(lambda objs: [obj.one(1) for obj in objs])),
+        Case(f"batch_call_{n_objs}", "call_all", make_setup(lambda objs: call_all(objs, "one", 1))),
+    ]
+
+
+def make_nested(depth: int, **options: Any) -> Type:
+    """Creates `depth` nested classes composed with `compclass`, each forwarding `value` and `one` to the previous one
+    (the innermost to `Foo`)."""
+    inner: Type = Foo
+    for _ in range(depth):
+
+        class Nested:
+            def __init__(self, inner: Type = inner):
+                self._inner = inner()
+
+        inner = compclass(
+            Nested, delegates={"_inner": delegatee(inner, ("value", "one"), flatten=True)}, verbose=False, **options
+        )
+    return inner
+
+
+def make_hand_written_nested(depth: int) -> Type:
+    """Reference: `depth` nested hand-written forwarding wrappers, as composed classes were before flattening."""
+    inner: Type = Foo
+    for _ in range(depth):
+
+        class Nested:
+            def __init__(self, inner: Type = inner):
+                self._inner = inner()
+
+            @property
+            def value(self):
+                return self._inner.value
+
+            def one(self, x):
+                return self._inner.one(x)
+
+        inner = Nested
+    return inner
+
+
+def chain_cases(depths: Tuple[int, ...] = (2, 3, 4, 5)) -> List[Case]:
+    """Attribute reads and method calls forwarded through `depth` nested composed classes, which are flattened into a
+    single forwarder of the innermost delegate."""
+
+    def make_setup(cls: Type, stmt: Callable[[Any], Any]) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            obj = cls()
+            return lambda: stmt(obj)
+
+        return setup
+
+    cases = []
+    for depth in depths:
+        classes = {
+            "hand_written_nested": make_hand_written_nested(depth),
+            "compclass": make_nested(depth),
+            "compclass_compiled": make_nested(depth, compiled=True),
+        }
+        for name, cls in classes.items():
+            cases.append(Case(f"chain_get_{depth}", name, make_setup(cls, lambda obj: obj.value)))
+            cases.append(Case(f"chain_call_{depth}", name, make_setup(cls, lambda obj: obj.one(1))))
+    return cases
+
+
+def make_wide_cls(n_members: int) -> Type:
+    """Creates a class with `n_members` members: half methods and half instance attributes."""
+    n_methods = n_members // 2
+    n_attrs = n_members - n_methods
+
+    namespace: Dict[str, Any] = {f"method_{i}": lambda self: None for i in range(n_methods)}
+    init_source = "def __init__(self):\n" + "".join(f"    self.attr_{i} = {i}\n" for i in range(n_attrs))
+    exec(init_source, {}, namespace)
+
+    return type(f"Wide{n_members}", (), namespace)
+
+
+def class_creation_cases(sizes: Tuple[int, ...] = (10, 100, 1000)) -> List[Case]:
+    """Class creation time with `"*"` delegation, for `compclass` and `CompclassMeta`, with cold and warm caches."""
+
+    def decorator_setup(wide_cls: Type, cold: bool) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            def stmt():
+                if cold:
+                    clear_cache()
+
+                class Composed:
+                    pass
+
+                return compclass(Composed, delegates={"_w": delegatee(wide_cls, ("*",))}, verbose=False)
+
+            return stmt
+
+        return setup
+
+    def meta_setup(wide_cls: Type, cold: bool) -> Callable[[], Callable[[], Any]]:
+        def setup():
+            def stmt():
+                if cold:
+                    clear_cache()
+
+                class Composed(metaclass=CompclassMeta, delegates={"_w": delegatee(wide_cls, ("*",))}, verbose=False):
+                    pass
+
+                return Composed
+
+            return stmt
+
+        return setup
+
+    cases = []
+    for size in sizes:
+        wide_cls = make_wide_cls(size)
+        for cache in ("cold", "warm"):
+            group, cold = f"class_creation_{cache}_{size}", cache == "cold"
+            cases.append(Case(group, "compclass", decorator_setup(wide_cls, cold)))
+            cases.append(Case(group, "CompclassMeta", meta_setup(wide_cls, cold)))
+    return cases
+
+
+def all_cases() -> List[Case]:
+    """Returns every timing case."""
+    return [
+        *attribute_cases(),
+        *method_cases(),
+        *dunder_cases(),
+        *batch_cases(),
+        *chain_cases(),
+        *class_creation_cases(),
+    ]
+
+
+def memory_per_instance(factory: Callable[[], Any], n_instances: int = 10_000) -> float:
+    """Measures the average number of bytes allocated per instance created by `factory`, excluding the delegate.
+
+    Delegates are created upfront, hence only the composed object (and its `__dict__`, if any) is accounted for.
+    """
+    import tracemalloc
+
+    foos = [Foo() for _ in range(n_instances)]
+    factories = [lambda foo=foo: factory(foo) for foo in foos]
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objs = [make() for make in factories]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del objs
+    return (after - before) / n_instances
+
+
+def memory_implementations() -> Dict[str, Callable[[Foo], Any]]:
+    """Returns a factory, given the delegate, for an instance of each implementation to compare memory of."""
+    composed = make_composed()
+    slotted = make_composed(slots=True)
+
+    return {
+        "hand_written": HandWritten,
+        "compclass": composed,
+        "compclass_slots": slotted,
+    }
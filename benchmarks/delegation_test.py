@@ -0,0 +1,27 @@
+"""pytest-benchmark suite, run it with:
+
+```bash
+pytest benchmarks --benchmark-json=benchmark.json
+```
+"""
+
+import pytest
+
+from benchmarks.cases import MEMORY_GROUP, Case, all_cases, memory_implementations, memory_per_instance
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("case", all_cases(), ids=lambda case: f"{case.group}-{case.name}")
+def test_timing(benchmark, case: Case):
+    """Times each benchmark case"""
+    benchmark.group = case.group
+    benchmark(case.setup())
+
+
+@pytest.mark.parametrize("name, factory", memory_implementations().items())
+def test_memory_per_instance(benchmark, name, factory):
+    """Records bytes allocated per composed instance in the benchmark extra info"""
+    benchmark.group = MEMORY_GROUP
+    benchmark.extra_info["bytes_per_instance"] = memory_per_instance(factory)
+    benchmark.pedantic(lambda: None, rounds=1)
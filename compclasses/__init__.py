@@ -1,10 +1,44 @@
 from importlib import metadata
 
+from compclasses._async import acall_all
+from compclasses._batch import call_all, gather, scatter
+from compclasses._cache import cache_info, clear_cache
 from compclasses._decorator import compclass
 from compclasses._delegatee import delegatee
+from compclasses._discovery import register_discoverer
+from compclasses._instrument import reset_stats, stats
+from compclasses._lazy import finalize
 from compclasses._meta import CompclassMeta
+from compclasses._pickling import CopyPolicy, PicklePolicy, RebuildPolicy, SharePolicy
+from compclasses._spec import Delegation, delegated_names, resolve
+from compclasses._swap import rebind, swap_delegate
+from compclasses._update import update
 
 __title__ = __name__
 __version__ = metadata.version(__title__)
 
-__all__ = ("compclass", "CompclassMeta", "delegatee")
+__all__ = (
+    "acall_all",
+    "cache_info",
+    "call_all",
+    "clear_cache",
+    "compclass",
+    "CompclassMeta",
+    "CopyPolicy",
+    "delegated_names",
+    "delegatee",
+    "Delegation",
+    "finalize",
+    "gather",
+    "PicklePolicy",
+    "rebind",
+    "RebuildPolicy",
+    "register_discoverer",
+    "reset_stats",
+    "resolve",
+    "scatter",
+    "SharePolicy",
+    "stats",
+    "swap_delegate",
+    "update",
+)
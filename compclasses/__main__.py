@@ -0,0 +1,37 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Union
+
+from compclasses._aot import build
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """Command line entry point, e.g. `python -m compclasses build pkg.mod`, see `compclasses._aot.build`."""
+    parser = argparse.ArgumentParser(prog="python -m compclasses", description="compclasses command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser(
+        "build",
+        help="Generate the forwarding code of the composed classes of modules ahead of time.",
+    )
+    build_parser.add_argument("modules", nargs="+", help="Names of the modules to build, e.g. `pkg.mod`.")
+    build_parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory of the generated files, by default next to each module.",
+    )
+
+    args = parser.parse_args(argv)
+    for module_name in args.modules:
+        source_path, stub_path, skipped = build(module_name, args.output_dir)
+        print(f"{module_name}: generated {source_path} and {stub_path}")
+        for qualname, reason in skipped.items():
+            print(f"{module_name}: {qualname} is not prebuilt, since {reason}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
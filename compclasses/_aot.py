@@ -0,0 +1,405 @@
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import sys
+from functools import update_wrapper
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
+
+from compclasses._attribute import ClassLevelAttribute, DelegatedAttribute
+from compclasses._bound import BoundMethodCache
+from compclasses._chain import Chain, flatten_chain
+from compclasses._core import _generate_descriptors, _is_identifier, _literal, forwarder_source
+from compclasses._delegatee import delegatee
+from compclasses._logging import Injection, is_reporting, log_injection
+from compclasses._protocols import protocol_source
+
+Delegates = Dict[str, Union[Iterable[str], delegatee]]
+
+# Suffix of the module generated by `build` for a module, e.g. `pkg/mod.py` -> `pkg/mod_compclasses.py`.
+ARTIFACT_SUFFIX = "_compclasses"
+
+# Bumped whenever the generated code changes, so that artifacts generated by other versions are ignored.
+FORMAT_VERSION = 4
+
+# Module name -> its prebuilt artifact module (or `None` if there is none), looked up once per module.
+_artifacts: Dict[str, Union[ModuleType, None]] = {}
+
+# Composed classes which can be prebuilt, as (cls, delegates, compiled), recorded only while `build` runs.
+_recorded: Union[List[Tuple[Type, Delegates, bool]], None] = None
+
+
+class _NotPrebuildable(Exception):
+    """Raised by `build` for a forwarded name which cannot be reproduced by generated source code."""
+
+
+def _member_fingerprint(delegatee_cls: Type, name: str) -> Tuple[Any, ...]:
+    """Describes the member `name` of `delegatee_cls` (its kind, signature or value) without importing its source."""
+    member = inspect.getattr_static(delegatee_cls, name, None)
+    if isinstance(member, property):
+        return name, "property", member.fset is not None, member.fdel is not None
+
+    func = getattr(member, "__func__", member)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return name, type(member).__name__, _literal(member)
+
+    n_args = code.co_argcount + code.co_kwonlyargcount
+    defaults = (repr(func.__defaults__), repr(func.__kwdefaults__))
+    return name, type(member).__name__, code.co_varnames[:n_args], code.co_flags, defaults
+
+
+def _chain(delegatee_name: str, delegatee_instance: Union[Iterable[str], delegatee], attr_name: str) -> Chain:
+    """Returns the source of the forwarded `delegatee_name.attr_name`, flattened as `_make_descriptor` does when
+    the delegatee has `flatten=True` (see `compclasses._chain.flatten_chain`)."""
+    if not isinstance(delegatee_instance, delegatee):
+        return Chain(delegatee_name, None, attr_name, True)
+
+    delegatee_cls = delegatee_instance.delegatee_cls
+    writable = delegatee_instance._is_writable(attr_name)
+    if (
+        delegatee_instance._flatten
+        and not delegatee_instance._cache_bound
+        and not delegatee._is_dunder_method(attr_name)
+    ):
+        return flatten_chain(delegatee_name, delegatee_cls, attr_name, writable)
+    return Chain(delegatee_name, delegatee_cls, attr_name, writable)
+
+
+def _source_fingerprint(delegatee_name: str, delegatee_instance: delegatee, attr_name: str) -> Tuple[Any, ...]:
+    """Describes the (flattened, see `_chain`) source of the forwarded `delegatee_name.attr_name`, including the
+    member of the innermost delegatee class (see `_member_fingerprint`)."""
+    chain = _chain(delegatee_name, delegatee_instance, attr_name)
+    if chain.delegatee_cls is None:  # e.g. the class of an inner delegate is unknown
+        return chain.delegatee_name, chain.attr_name, chain.writable
+    inner_cls = chain.delegatee_cls
+    fingerprint = _member_fingerprint(inner_cls, chain.attr_name)
+    return chain.delegatee_name, inner_cls.__module__, inner_cls.__qualname__, chain.writable, fingerprint
+
+
+def _forwarded_method(delegatee_name: str, delegatee_instance: Union[Iterable[str], delegatee], attr_name: str) -> Any:
+    """Returns the method forwarded by the generated function of `delegatee_name.attr_name` (flattened, see `_chain`),
+    or `None` if the function forwards a protocol dunder (or the class is unknown)."""
+    if isinstance(delegatee_instance, delegatee) and attr_name in delegatee_instance._protocol_dunders():
+        return None
+    chain = _chain(delegatee_name, delegatee_instance, attr_name)
+    if chain.delegatee_cls is None:
+        return None
+    return inspect.getattr_static(chain.delegatee_cls, chain.attr_name)
+
+
+def spec_hash(delegates: Delegates, compiled: bool) -> Union[str, None]:
+    """Returns the content hash of the delegation specification of a composed class, namely of its delegates (names,
+    options and the relevant members of each delegatee class) and of the `compiled` flag.
+
+    Names of delegatees with `flatten=True` are hashed together with their flattened source (see `_chain`), hence a
+    change in the delegation of an inner composed class invalidates the prebuilt entry as well.
+
+    Arguments:
+        delegates: Delegates whose descriptors are generated for the class, see `diff_delegates`.
+        compiled: Whether methods are forwarded using generated functions.
+
+    Returns:
+        Hex digest, or `None` if the specification cannot be prebuilt (e.g. fan-out delegates, or `"*"` in the attrs
+            of a lazy delegatee, which are only known once parsed).
+    """
+    spec: List[Any] = [FORMAT_VERSION, compiled]
+    for delegatee_name, delegatee_instance in delegates.items():
+        if not isinstance(delegatee_instance, delegatee):
+            if not isinstance(delegatee_instance, (tuple, list)):  # e.g. a generator, which cannot be read twice
+                return None
+            spec.append((delegatee_name, tuple(delegatee_instance)))
+            continue
+
+        parsed = delegatee_instance._attrs  # `None` for lazy delegatees not parsed yet
+        attrs = delegatee_instance._raw_attrs if parsed is None else parsed
+        if delegatee_instance._fanout or "*" in attrs:
+            return None
+
+        delegatee_cls = delegatee_instance.delegatee_cls
+        readonly = delegatee_instance._readonly
+        spec.append(
+            (
+                delegatee_name,
+                None if delegatee_cls is None else (delegatee_cls.__module__, delegatee_cls.__qualname__),
+                tuple(attrs),
+                delegatee_instance._prefix,
+                delegatee_instance._suffix,
+                readonly if isinstance(readonly, bool) else sorted(readonly),
+                delegatee_instance._protocols,
+                delegatee_instance._cache_bound,
+                delegatee_instance._flatten,
+                None
+                if delegatee_cls is None
+                else tuple(_source_fingerprint(delegatee_name, delegatee_instance, a) for a in attrs),
+            )
+        )
+    return hashlib.sha256(repr(spec).encode()).hexdigest()
+
+
+def _artifact(module_name: str) -> Union[ModuleType, None]:
+    """Imports the artifact generated by `build` for `module_name`, if any."""
+    if module_name in _artifacts:
+        return _artifacts[module_name]
+
+    artifact_name = f"{module_name}{ARTIFACT_SUFFIX}"
+    try:
+        found = importlib.util.find_spec(artifact_name) is not None
+    except (ImportError, ValueError):
+        found = False
+
+    artifact = importlib.import_module(artifact_name) if found else None
+    _artifacts[module_name] = artifact
+    return artifact
+
+
+def load_prebuilt(
+    module_name: str,
+    qualname: str,
+    delegates: Delegates,
+    compiled: bool,
+    verbose: bool = False,
+    log_func: Union[Callable[[str], None], None] = None,
+) -> Union[Dict[str, Any], None]:
+    """Returns the forwarding descriptors of the composed class `module_name.qualname` from the artifact generated by
+    `build`, provided that it exists and it was generated from the same delegation specification (see `spec_hash`).
+
+    Arguments:
+        module_name: Module of the composed class.
+        qualname: Qualified name of the composed class.
+        delegates: Delegates whose descriptors are generated for the class, see `diff_delegates`.
+        compiled: Whether methods are forwarded using generated functions.
+        verbose: Whether to report the injected names, see `generate_properties`.
+        log_func: Custom function used to report, see `generate_properties`.
+
+    Returns:
+        Mapping from forwarded name to descriptor, or `None` if there is no matching prebuilt artifact, in which case
+            the descriptors have to be generated.
+    """
+    if _recorded is not None:  # `build` is running, artifacts may be outdated
+        return None
+
+    artifact = _artifact(module_name)
+    entry = None if artifact is None else getattr(artifact, "PREBUILT", {}).get(qualname)
+    if entry is None:
+        return None
+
+    digest, namespace_cls, injected = entry
+    if digest != spec_hash(delegates, compiled):
+        return None
+
+    descriptors = {}
+    for new_attr_name, delegatee_name, attr_name in injected:
+        descriptor = descriptors[new_attr_name] = namespace_cls.__dict__[new_attr_name]
+        if not isinstance(descriptor, FunctionType):
+            continue
+        method = _forwarded_method(delegatee_name, delegates[delegatee_name], attr_name)
+        if method is not None:
+            # Same as `method_from_delegator`, the function keeps the docstring and signature of the method
+            update_wrapper(descriptor, method)
+            descriptor.__name__ = descriptor.__qualname__ = new_attr_name
+
+    if is_reporting(verbose, log_func):
+        log_injection(f"{module_name}.{qualname}", injected, log_func)
+    return descriptors
+
+
+def record_prebuildable(cls: Type, delegates: Delegates, compiled: bool) -> None:
+    """Records a composed class for `build`, no-op unless it is running."""
+    if _recorded is not None:
+        _recorded.append((cls, delegates, compiled))
+
+
+class _Default:
+    """Default value of a stub parameter, whose `repr` is its source code."""
+
+    def __init__(self, value: Any):
+        self.source = _literal(value) or "..."
+
+    def __repr__(self) -> str:
+        return self.source
+
+
+def _stub_def(source: str, method: Union[Callable, None] = None) -> str:
+    """Returns the stub of a generated function, e.g. `def f(self, x, y=1) -> Any: ...`, reproducing the parameters of
+    the original `method` (if it is a python function) rather than the ones of the generated function, without
+    annotations and with non-literal defaults as `...`."""
+    definition = source.splitlines()[0][:-1]
+    if not isinstance(method, FunctionType):
+        return f"{definition} -> Any: ..."
+
+    signature = inspect.signature(method, follow_wrapped=False)
+    params = [
+        param.replace(
+            annotation=inspect.Parameter.empty,
+            default=param.default if param.default is inspect.Parameter.empty else _Default(param.default),
+        )
+        for param in signature.parameters.values()
+    ]
+    prefix = definition[: definition.index("(")]
+    return f"{prefix}{signature.replace(parameters=params, return_annotation=inspect.Signature.empty)} -> Any: ..."
+
+
+def _emit(
+    new_attr_name: str,
+    delegatee_name: str,
+    delegatee_instance: Union[Iterable[str], delegatee],
+    attr_name: str,
+    descriptor: Any,
+) -> Tuple[List[str], List[str]]:
+    """Returns the (source, stub) lines of the class body defining `new_attr_name` as `descriptor`.
+
+    Raises:
+        _NotPrebuildable: if `descriptor` cannot be reproduced by source code (e.g. a staticmethod of the delegatee
+            class, which is only reachable by importing it).
+    """
+    if not _is_identifier(new_attr_name):
+        raise _NotPrebuildable(f"'{new_attr_name}' is not a valid identifier")
+
+    if descriptor is None:  # dunder marked as not available, see `dunder_from_protocol`
+        return [f"{new_attr_name} = None"], [f"{new_attr_name} = None"]
+
+    # Names of delegatees with `flatten=True` are forwarded to their innermost delegate, as `_make_descriptor` does
+    chain = _chain(delegatee_name, delegatee_instance, attr_name)
+    path, inner_name = chain.delegatee_name, chain.attr_name
+
+    if isinstance(descriptor, DelegatedAttribute) or type(descriptor) is property:
+        writable = descriptor.writable if isinstance(descriptor, DelegatedAttribute) else descriptor.fset is not None
+        source = f"_compclasses_attribute({path!r}, {inner_name!r}, writable={writable})"
+        return [f"{new_attr_name} = {source}"], [f"{new_attr_name}: Any"]
+
+    if isinstance(descriptor, ClassLevelAttribute) and isinstance(descriptor.forward, DelegatedAttribute):
+        literal = None if callable(descriptor.class_value) else _literal(descriptor.class_value)
+        if literal is None:
+            kind = type(inspect.getattr_static(chain.delegatee_cls, inner_name, None)).__name__
+            raise _NotPrebuildable(f"'{new_attr_name}' is forwarded by {kind}")
+        forward = f"_compclasses_attribute({path!r}, {inner_name!r}, writable={descriptor.forward.writable})"
+        source = f"_compclasses_class_level({literal}, {forward})"
+        return [f"{new_attr_name} = {source}"], [f"{new_attr_name}: {type(descriptor.class_value).__name__}"]
+
+    if isinstance(descriptor, BoundMethodCache):  # never flattened
+        source = f"_compclasses_bound({delegatee_name!r}, {attr_name!r}, {new_attr_name!r})"
+        return [f"{new_attr_name} = {source}"], [f"{new_attr_name}: Any"]
+
+    if isinstance(descriptor, FunctionType):
+        method = _forwarded_method(delegatee_name, delegatee_instance, attr_name)
+        if method is None:
+            source = protocol_source(delegatee_name, attr_name)
+        else:
+            source = forwarder_source(path, inner_name, new_attr_name, method)
+        # The docstring (and signature) of the method are restored when loaded, see `load_prebuilt`
+        return source.splitlines(), [_stub_def(source, method)]
+
+    raise _NotPrebuildable(f"'{new_attr_name}' is forwarded by {type(descriptor).__name__}")
+
+
+def _class_source(cls: Type, delegates: Delegates, compiled: bool) -> Tuple[str, str, str]:
+    """Returns the (source, stub, `PREBUILT` entry) code of a composed class.
+
+    Raises:
+        _NotPrebuildable: if any forwarded name cannot be prebuilt.
+    """
+    digest = spec_hash(delegates, compiled)
+    if digest is None:
+        raise _NotPrebuildable("its delegation specification is only known at runtime")
+
+    body: List[str] = []
+    stub: List[str] = []
+    injected: List[Injection] = []
+    for delegatee_name, delegatee_instance in delegates.items():
+        if not isinstance(delegatee_instance, delegatee):
+            delegatee_instance = tuple(delegatee_instance)
+        for new_attr_name, attr_name, descriptor in _generate_descriptors(
+            delegatee_name, delegatee_instance, compiled, None
+        ):
+            source_lines, stub_lines = _emit(new_attr_name, delegatee_name, delegatee_instance, attr_name, descriptor)
+            body.extend(source_lines)
+            stub.extend(stub_lines)
+            injected.append((new_attr_name, delegatee_name, attr_name))
+
+    name = cls.__qualname__
+    source = f"class {name}:\n" + "\n".join(f"    {line}" for line in body or ["pass"])
+    stub_source = f"class {name}:\n" + "\n".join(f"    {line}" for line in stub or ["..."])
+    entry = f"    {name!r}: ({digest!r}, {name}, {tuple(injected)!r}),"
+    return source, stub_source, entry
+
+
+def _artifact_paths(module: ModuleType, output_dir: Union[Path, None]) -> Tuple[Path, Path]:
+    """Returns the paths of the (source, stub) artifact of `module`, next to it unless `output_dir` is given."""
+    stem = f"{module.__name__.rpartition('.')[2]}{ARTIFACT_SUFFIX}"
+    if output_dir is None:
+        if getattr(module, "__file__", None) is None:
+            raise ValueError(f"Cannot locate the source file of module '{module.__name__}', provide `output_dir`")
+        module_path = Path(module.__file__)  # type: ignore
+        # The artifact of a package is a sibling of its directory, e.g. `pkg/__init__.py` -> `pkg_compclasses.py`
+        output_dir = module_path.parent.parent if hasattr(module, "__path__") else module_path.parent
+    return output_dir / f"{stem}.py", output_dir / f"{stem}.pyi"
+
+
+def build(module_name: str, output_dir: Union[Path, None] = None) -> Tuple[Path, Path, Dict[str, str]]:
+    """Imports (or reloads) the module `module_name` and generates a plain python module, together with its `.pyi`
+    stub, defining the forwarding descriptors of every composed class of the module (`compclass` and `CompclassMeta`
+    ones) with explicit source code.
+
+    When the module is imported afterwards, composed classes with a matching prebuilt entry (see `spec_hash`) take
+    their descriptors from the generated module instead of generating them, see `load_prebuilt`. Classes composed with
+    `lazy=True`, `slots=True` or `instrument=True`, as well as fan-out delegates and names which cannot be reproduced by
+    source code (e.g. static and class methods of the delegatee class) are not prebuilt, they are composed as usual.
+
+    The stub describes the generated module (e.g. `pkg/mod_compclasses.pyi`), not `module_name`: type checkers do not
+    apply it to the composed classes of `module_name`, unless they explicitly inherit from the stub classes while type
+    checking.
+
+    Arguments:
+        module_name: Name of the module, e.g. `"pkg.mod"`.
+        output_dir: Directory in which to write the generated files, by default next to the module.
+
+    Returns:
+        Tuple of (source path, stub path, mapping from qualified name to the reason why it is not prebuilt).
+    """
+    global _recorded
+
+    _recorded = recorded = []
+    try:
+        module = sys.modules.get(module_name)
+        module = importlib.reload(module) if module is not None else importlib.import_module(module_name)
+    finally:
+        _recorded = None
+
+    classes, stubs, entries, skipped = [], [], [], {}  # type: ignore
+    for cls, delegates, compiled in recorded:
+        if cls.__module__ != module_name or getattr(module, cls.__qualname__, None) is not cls:
+            continue  # e.g. defined in a function or in another module
+        try:
+            source, stub, entry = _class_source(cls, delegates, compiled)
+        except _NotPrebuildable as e:
+            skipped[cls.__qualname__] = str(e)
+            continue
+        classes.append(source)
+        stubs.append(stub)
+        entries.append(entry)
+
+    header = f"# Generated by `python -m compclasses build {module_name}`, do not edit.\n"
+    source_code = (
+        f"{header}import operator  # noqa: F401\n\n"
+        "from compclasses._attribute import ClassLevelAttribute as _compclasses_class_level\n"
+        "from compclasses._attribute import delegated_attribute as _compclasses_attribute\n"
+        "from compclasses._bound import BoundMethodCache as _compclasses_bound\n\n\n"
+        + "".join(f"{source}\n\n\n" for source in classes)
+        + "PREBUILT = {\n"
+        + "".join(f"{entry}\n" for entry in entries)
+        + "}\n"
+    )
+    stub_code = (
+        f"{header}from typing import Any, Dict, Tuple\n\n"
+        + "".join(f"{stub}\n\n" for stub in stubs)
+        + "PREBUILT: Dict[str, Tuple[str, type, Tuple[Tuple[str, str, str], ...]]]\n"
+    )
+
+    source_path, stub_path = _artifact_paths(module, output_dir)
+    source_path.write_text(source_code)
+    stub_path.write_text(stub_code)
+    _artifacts.pop(module_name, None)
+    return source_path, stub_path, skipped
@@ -0,0 +1,60 @@
+import asyncio
+import inspect
+from typing import Any, Iterable, Tuple, Type, Union
+
+# Dunder methods of the asynchronous iterator, context manager and awaitable protocols.
+ASYNC_DUNDERS = ("__aiter__", "__anext__", "__aenter__", "__aexit__", "__await__")
+
+
+def is_async_method(delegatee_cls: Union[Type, None], attr_name: str) -> bool:
+    """Assesses whether or not `attr_name` is a coroutine function (i.e. defined with `async def`) of `delegatee_cls`,
+    or a method of the asynchronous protocols (see `ASYNC_DUNDERS`).
+
+    Arguments:
+        delegatee_cls: Class of the delegate, if known.
+        attr_name: Attribute/method name.
+
+    Returns:
+        `False` if `delegatee_cls` is unknown, otherwise whether `attr_name` is an asynchronous method.
+    """
+    if delegatee_cls is None:
+        return False
+
+    return attr_name in ASYNC_DUNDERS or inspect.iscoroutinefunction(
+        inspect.getattr_static(delegatee_cls, attr_name, None)
+    )
+
+
+async def acall_all(
+    objs: Iterable[Any],
+    method_name: str,
+    *args: Any,
+    return_exceptions: bool = False,
+    **kwargs: Any,
+) -> Tuple[Any, ...]:
+    """Awaits the coroutine method `method_name(*args, **kwargs)` of every object concurrently, via `asyncio.gather`.
+
+    It can be used on composed instances forwarding the same coroutine method from their delegates, as well as on the
+    delegates themselves.
+
+    Usage:
+
+    ```python
+    from compclasses import acall_all
+
+    results = await acall_all(services, "fetch", "https://example.com", timeout=1)
+    ```
+
+    Arguments:
+        objs: Objects having a coroutine method called `method_name`.
+        method_name: Name of the coroutine method to call.
+        *args: Positional arguments of the call.
+        return_exceptions: Whether to return exceptions as results instead of raising the first one, see
+            `asyncio.gather`.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        Tuple of results, in the same order as `objs`.
+    """
+    coros = [getattr(obj, method_name)(*args, **kwargs) for obj in objs]
+    return tuple(await asyncio.gather(*coros, return_exceptions=return_exceptions))
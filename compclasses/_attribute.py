@@ -0,0 +1,157 @@
+from operator import attrgetter
+from threading import Lock
+from typing import Any, Callable, Hashable, Tuple, Type, Union
+from weakref import WeakValueDictionary
+
+
+class DelegatedAttribute:
+    """Data descriptor forwarding `delegatee_name.attr_name`, a lean replacement of the property (and closures) created
+    by `property_from_delegator`.
+
+    Accessing, setting and deleting the attribute on a composed instance is forwarded to the delegate (unless
+    read-only). The descriptor holds no reference to the composed class nor to the forwarded name, hence identical
+    descriptors are interned (see `delegated_attribute`) and shared by every class forwarding the same attribute of
+    the same delegate, whatever its prefix and suffix.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the attribute/method.
+        attr_name: Attribute/method of the delegate which we want to forward.
+        delegatee_getter: Callable returning the delegate given the composed instance, defaults to
+            `attrgetter(delegatee_name)`.
+        writable: Whether setting and deleting the attribute is forwarded, otherwise it raises `AttributeError`.
+    """
+
+    __slots__ = ("delegatee_name", "attr_name", "writable", "_get_delegate", "__weakref__")
+
+    def __init__(
+        self,
+        delegatee_name: str,
+        attr_name: str,
+        delegatee_getter: Union[Callable[[Any], Any], None] = None,
+        writable: bool = True,
+    ):
+        self.delegatee_name = delegatee_name
+        self.attr_name = attr_name
+        self.writable = writable
+        self._get_delegate = attrgetter(delegatee_name) if delegatee_getter is None else delegatee_getter
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(self._get_delegate(instance), self.attr_name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if not self.writable:
+            raise AttributeError(self._read_only_message(instance))
+        setattr(self._get_delegate(instance), self.attr_name, value)
+
+    def __delete__(self, instance: Any) -> None:
+        if not self.writable:
+            raise AttributeError(self._read_only_message(instance))
+        delattr(self._get_delegate(instance), self.attr_name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.delegatee_name!r}, {self.attr_name!r}, writable={self.writable})"
+
+    def _read_only_message(self, instance: Any) -> str:
+        """Returns the message of the error raised when setting or deleting a read-only attribute of `instance`."""
+        return (
+            f"Forwarded attribute '{self.delegatee_name}.{self.attr_name}' of '{type(instance).__name__}' object is "
+            "read-only"
+        )
+
+    def as_property(self) -> property:
+        """Returns an equivalent property, whose accessors can be wrapped (e.g. to instrument them)."""
+        fset, fdel = (self.__set__, self.__delete__) if self.writable else (None, None)
+        return property(fget=self.__get__, fset=fset, fdel=fdel)
+
+
+class ClassLevelAttribute:
+    """Data descriptor returning `class_value` when accessed from the composed class, and deferring to `forward` (a
+    forwarding descriptor, e.g. a `DelegatedAttribute`) when accessed, set or deleted on a composed instance.
+
+    It is used for names whose value is known from the delegatee class alone (staticmethods, classmethods and class
+    level constants, see `compclasses._core.descriptor_from_kind`), so that they are available from the composed class
+    itself, while instances still look the name up on their delegate, whose runtime type may be a subclass of the
+    delegatee class overriding it.
+
+    Arguments:
+        class_value: Value returned when accessed from the composed class.
+        forward: Forwarding descriptor used for instance access.
+    """
+
+    __slots__ = ("class_value", "forward")
+
+    def __init__(self, class_value: Any, forward: Any):
+        self.class_value = class_value
+        self.forward = forward
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        if instance is None:
+            return self.class_value
+        return self.forward.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.forward.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.forward.__delete__(instance)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.class_value!r}, {self.forward!r})"
+
+
+# (delegatee_name, attr_name, writable, delegatee_getter) -> interned descriptor, dropped once no class uses it.
+_interned: "WeakValueDictionary[Tuple[Hashable, ...], DelegatedAttribute]" = WeakValueDictionary()
+_lock = Lock()
+
+
+def delegated_attribute(
+    delegatee_name: str,
+    attr_name: str,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+    writable: bool = True,
+) -> DelegatedAttribute:
+    """Returns the interned `DelegatedAttribute` forwarding `delegatee_name.attr_name`, creating it if needed.
+
+    Descriptors with a custom `delegatee_getter` are interned only if it is hashable, e.g. the `__get__` of a slot
+    member descriptor is, hence classes composed with `slots=True` share descriptors as long as they read the delegate
+    from the same slot.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the attribute/method.
+        attr_name: Attribute/method of the delegate which we want to forward.
+        delegatee_getter: Callable returning the delegate given the composed instance, see `DelegatedAttribute`.
+        writable: Whether setting and deleting the attribute is forwarded, see `DelegatedAttribute`.
+
+    Returns:
+        Forwarding descriptor which will be injected in the class.
+    """
+    key = (delegatee_name, attr_name, writable, delegatee_getter)
+    try:
+        hash(key)
+    except TypeError:
+        return DelegatedAttribute(delegatee_name, attr_name, delegatee_getter, writable)
+
+    with _lock:
+        descriptor = _interned.get(key)
+        if descriptor is None:
+            descriptor = _interned[key] = DelegatedAttribute(delegatee_name, attr_name, delegatee_getter, writable)
+        return descriptor
+
+
+def is_forwarding_attribute(descriptor: Any) -> bool:
+    """Assesses whether or not `descriptor` forwards an attribute, i.e. it is a `DelegatedAttribute`, a property or a
+    `ClassLevelAttribute` deferring to either of them."""
+    if isinstance(descriptor, ClassLevelAttribute):
+        descriptor = descriptor.forward
+    return isinstance(descriptor, (DelegatedAttribute, property))
+
+
+def is_writable_attribute(descriptor: Any) -> bool:
+    """Assesses whether or not setting the forwarding `descriptor` is allowed."""
+    if isinstance(descriptor, ClassLevelAttribute):
+        descriptor = descriptor.forward
+    if isinstance(descriptor, DelegatedAttribute):
+        return descriptor.writable
+    return isinstance(descriptor, property) and descriptor.fset is not None
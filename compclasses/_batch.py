@@ -0,0 +1,149 @@
+from numbers import Number
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
+
+from compclasses._attribute import is_forwarding_attribute, is_writable_attribute
+from compclasses._bound import _class_attr
+from compclasses._conflicts import Dispatcher
+from compclasses._delegatee import delegatee
+from compclasses._inheritance import DELEGATES_ATTR
+from compclasses._instrument import is_instrumented
+from compclasses._lazy import materialize
+from compclasses._spec import SPEC_ATTR, resolve
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+# Kinds of forwarded names which `gather` and `scatter` access on the delegates directly, see `classify`.
+_ATTRIBUTE_KINDS = ("attribute", "property", "unknown")
+
+
+def _delegate_path(objs: Sequence[Any], name: str, kinds: Tuple[str, ...]) -> Union[Tuple[str, str], None]:
+    """Returns the (`delegatee_name`, `attr_name`) source of the forwarded `name`, if every object in `objs` is an
+    instance of the same composed class, which forwards `name` (of one of `kinds`) through a plain, non-instrumented
+    descriptor. Otherwise `None` is returned, in which case `name` has to be looked up on each object."""
+    classes = set(map(type, objs))
+    if len(classes) != 1:
+        return None
+
+    cls = classes.pop()
+    delegation = resolve(cls, name)
+    if delegation is None or delegation.kind not in kinds:
+        return None
+
+    delegatee_instance = getattr(cls, DELEGATES_ATTR, {}).get(delegation.delegatee_name)
+    if isinstance(delegatee_instance, delegatee) and delegatee_instance._fanout:
+        return None
+
+    materialize(cls, name)  # no-op unless composed with `lazy=True`
+    owner = next((klass for klass in cls.__mro__ if name in klass.__dict__), None)
+    if owner is None or name not in owner.__dict__.get(SPEC_ATTR, {}):  # e.g. overridden by a plain subclass
+        return None
+
+    descriptor = owner.__dict__[name]
+    if is_instrumented(descriptor) or isinstance(descriptor, Dispatcher):
+        return None
+    if kinds == _ATTRIBUTE_KINDS and not is_forwarding_attribute(descriptor):  # e.g. class level constants
+        return None
+    return delegation.delegatee_name, delegation.attr_name
+
+
+def _to_array(values: List[Any], as_array: Union[bool, None]) -> Any:
+    """Converts `values` to a NumPy array if `as_array=True`, or if `as_array=None`, NumPy is installed and the
+    values are numeric."""
+    if as_array is False or (as_array is None and (np is None or not values or not isinstance(values[0], Number))):
+        return values
+    if np is None:
+        raise ImportError("NumPy is required to return arrays, install it via `pip install numpy`")
+
+    array = np.asarray(values)
+    return array if as_array or array.dtype.kind in "biufc" else values
+
+
+def gather(objs: Iterable[Any], name: str, as_array: Union[bool, None] = None) -> Any:
+    """Returns the value of the forwarded attribute `name` of every composed instance in `objs`.
+
+    If every object is an instance of the same composed class, the values are read from the delegates directly (e.g.
+    via `attrgetter("_foo.value")`), skipping the forwarding property of each object. Otherwise, or if `name` is not a
+    forwarded attribute, it is equivalent to `[getattr(obj, name) for obj in objs]`.
+
+    Usage:
+
+    ```python
+    from compclasses import gather
+
+    gather(bazs, "value")  # same as [baz.value for baz in bazs]
+    ```
+
+    Arguments:
+        objs: Composed instances.
+        name: Name of the attribute.
+        as_array: Whether to return a NumPy array. By default, an array is returned if NumPy is installed and the
+            values are numeric, otherwise a list.
+
+    Returns:
+        List (or NumPy array) of values, in the same order as `objs`.
+
+    Raises:
+        ImportError: if `as_array=True` and NumPy is not installed.
+    """
+    objs = objs if isinstance(objs, Sequence) else tuple(objs)
+    path = _delegate_path(objs, name, _ATTRIBUTE_KINDS)
+    getter = attrgetter(name if path is None else ".".join(path))
+    return _to_array(list(map(getter, objs)), as_array)
+
+
+def scatter(objs: Iterable[Any], name: str, values: Iterable[Any]) -> None:
+    """Sets the forwarded attribute `name` of every composed instance in `objs` to the matching value in `values`.
+
+    If every object is an instance of the same composed class, the values are written to the delegates directly,
+    otherwise it is equivalent to `for obj, value in zip(objs, values): setattr(obj, name, value)`.
+
+    Arguments:
+        objs: Composed instances.
+        name: Name of the attribute.
+        values: Values to set (e.g. a list or NumPy array), one per object.
+
+    Raises:
+        ValueError: if `objs` and `values` have different lengths.
+        AttributeError: if `name` is a read-only forwarded attribute.
+    """
+    objs = objs if isinstance(objs, Sequence) else tuple(objs)
+    values = values if hasattr(values, "__len__") else tuple(values)  # e.g. lists and NumPy arrays are kept
+    if len(objs) != len(values):  # type: ignore
+        raise ValueError(f"Got {len(objs)} objects but {len(values)} values")  # type: ignore
+
+    path = _delegate_path(objs, name, _ATTRIBUTE_KINDS)
+    if path is not None and not is_writable_attribute(_class_attr(type(objs[0]), name)):
+        raise AttributeError(f"Forwarded attribute '{name}' of '{type(objs[0]).__name__}' object is read-only")
+
+    target, attr_name = (None, name) if path is None else (attrgetter(path[0]), path[1])
+    for obj, value in zip(objs, values):
+        setattr(obj if target is None else target(obj), attr_name, value)
+
+
+def call_all(objs: Iterable[Any], method_name: str, /, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+    """Calls the (forwarded) method `method_name(*args, **kwargs)` of every composed instance in `objs`.
+
+    If every object is an instance of the same composed class, the method of each delegate is called directly (e.g.
+    via `methodcaller("hello", "GitHub")` on `attrgetter("_foo")`), otherwise it is equivalent to
+    `tuple(getattr(obj, method_name)(*args, **kwargs) for obj in objs)`. See `acall_all` for coroutine methods.
+
+    Arguments:
+        objs: Composed instances.
+        method_name: Name of the method to call.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        Tuple of results, in the same order as `objs`.
+    """
+    objs = objs if isinstance(objs, Sequence) else tuple(objs)
+    path = _delegate_path(objs, method_name, ("method",))
+
+    caller: Callable[[Any], Any] = methodcaller(method_name if path is None else path[1], *args, **kwargs)
+    if path is None:
+        return tuple(map(caller, objs))
+    return tuple(map(caller, map(attrgetter(path[0]), objs)))
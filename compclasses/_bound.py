@@ -0,0 +1,184 @@
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Tuple, Type, Union
+from weakref import WeakKeyDictionary
+
+from compclasses._delegatee import delegatee
+from compclasses._spec import SPEC_ATTR, Delegation
+
+# Composed class -> (spec index, mapping from delegate name to the names of its methods), see `bound_names`.
+_bound_index: "WeakKeyDictionary[Type, Tuple[Mapping[str, Delegation], Dict[str, Tuple[str, ...]]]]" = (
+    WeakKeyDictionary()
+)
+# Composed class -> mapping from delegate name to the names of its replaced descriptors, see `retire_bound_names`.
+_retired: "WeakKeyDictionary[Type, Dict[str, Tuple[str, ...]]]" = WeakKeyDictionary()
+
+
+class BoundMethodCache:
+    """Non-data descriptor forwarding a method of a delegate, which memoises the resolved bound method in the instance
+    `__dict__` under the forwarded name.
+
+    The first access resolves `getattr(delegate, attr_name)` and stores it in the instance `__dict__`: since the
+    descriptor is a non-data one, every later access finds the bound method there, without evaluating any descriptor
+    nor allocating a new bound method. Cached entries are dropped when the delegate attribute is reassigned or deleted,
+    see `install_bound_cache`, including the ones of descriptors which have since been replaced, see
+    `retire_bound_names`.
+
+    Instances without `__dict__` (e.g. composed with `slots=True`) resolve the bound method at each access.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the method.
+        attr_name: Method of the delegate which we want to forward.
+        name: Name of the forwarded method in the scope of the composed class.
+        delegatee_getter: Callable returning the delegate given the composed instance, defaults to
+            `attrgetter(delegatee_name)`.
+        wrapper: Callable applied to the bound method before caching it (e.g. to instrument it).
+    """
+
+    __slots__ = ("delegatee_name", "attr_name", "name", "_get_delegate", "_wrapper")
+
+    def __init__(
+        self,
+        delegatee_name: str,
+        attr_name: str,
+        name: str,
+        delegatee_getter: Union[Callable[[Any], Any], None] = None,
+        wrapper: Union[Callable[[Callable], Callable], None] = None,
+    ):
+        self.delegatee_name = delegatee_name
+        self.attr_name = attr_name
+        self.name = name
+        self._get_delegate = attrgetter(delegatee_name) if delegatee_getter is None else delegatee_getter
+        self._wrapper = wrapper
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        if instance is None:
+            return self
+
+        bound = getattr(self._get_delegate(instance), self.attr_name)
+        if self._wrapper is not None:
+            bound = self._wrapper(bound)
+
+        instance_dict = getattr(instance, "__dict__", None)
+        if instance_dict is not None:
+            instance_dict[self.name] = bound
+        return bound
+
+    def wrapped(self, wrapper: Callable[[Callable], Callable]) -> "BoundMethodCache":
+        """Returns a copy of the descriptor applying `wrapper` to the bound method before caching it."""
+        return type(self)(self.delegatee_name, self.attr_name, self.name, self._get_delegate, wrapper)
+
+
+def _class_attr(cls: Type, name: str) -> Any:
+    """Looks `name` up in the `__dict__` of the classes in `cls.__mro__`, without triggering descriptors."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+def cached_bound_methods(obj: Any) -> Iterator[Tuple[str, str]]:
+    """Yields the (`name`, `delegatee_name`) pairs of the bound methods cached in the `__dict__` of `obj`, see
+    `BoundMethodCache`."""
+    cls = type(obj)
+    for name in tuple(getattr(obj, "__dict__", ())):
+        descriptor = _class_attr(cls, name)
+        if isinstance(descriptor, BoundMethodCache):
+            yield name, descriptor.delegatee_name
+
+
+def bound_names(cls: Type, delegatee_name: str) -> Tuple[str, ...]:
+    """Returns the names forwarded by `cls` to methods of the delegate `delegatee_name`, namely the ones whose bound
+    methods may be cached (see `BoundMethodCache`).
+
+    The names are indexed once per spec index of `cls`, which is replaced whenever `cls` is rebound (see
+    `compclasses.rebind`), hence the lookup does not depend on the number of names forwarded by other delegates. The
+    index includes the names retired by `cls` and its bases (see `retire_bound_names`), whose bound methods may still
+    be cached by existing instances.
+    """
+    spec = getattr(cls, SPEC_ATTR, {})
+    try:
+        indexed, index = _bound_index.get(cls, (None, {}))
+    except TypeError:  # e.g. a class whose metaclass defines `__eq__` without `__hash__`
+        indexed, index = None, {}
+
+    if indexed is not spec:
+        index = {}
+        for name, delegation in spec.items():
+            if delegation.kind == "method":
+                index[delegation.delegatee_name] = (*index.get(delegation.delegatee_name, ()), name)
+        for klass in cls.__mro__:
+            try:
+                retired = _retired.get(klass, {})
+            except TypeError:
+                continue
+            for key, names in retired.items():
+                index[key] = (*index.get(key, ()), *(name for name in names if name not in index.get(key, ())))
+        try:
+            _bound_index[cls] = (spec, index)
+        except TypeError:
+            pass
+    return index.get(delegatee_name, ())
+
+
+def retire_bound_names(cls: Type, delegatee_name: str, names: Iterable[str]) -> None:
+    """Records that the descriptors caching the bound methods `names` of the delegate `delegatee_name` have been
+    replaced in `cls` (see `compclasses.rebind`).
+
+    Their entries cached by existing instances are not looked for: they are dropped along with the other ones, the next
+    time the delegate attribute of an instance is reassigned or deleted (see `invalidate_bound_methods`).
+    """
+    names = tuple(names)
+    if not names:
+        return
+    try:
+        retired = _retired.setdefault(cls, {})
+    except TypeError:  # e.g. a class whose metaclass defines `__eq__` without `__hash__`
+        return
+    current = retired.get(delegatee_name, ())
+    retired[delegatee_name] = (*current, *(name for name in names if name not in current))
+
+
+def invalidate_bound_methods(obj: Any, delegatee_name: str) -> None:
+    """Drops the bound methods of the delegate `delegatee_name` cached in the `__dict__` of `obj`, in time
+    proportional to the number of methods forwarded to it (see `bound_names`)."""
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict:
+        for name in bound_names(type(obj), delegatee_name):
+            instance_dict.pop(name, None)
+
+
+def install_bound_cache(cls: Type, delegates: Dict[str, Union[Iterable[str], delegatee]]) -> Type:
+    """Adds `__setattr__` and `__delattr__` hooks to `cls`, which drop the cached bound methods of a delegate (see
+    `BoundMethodCache`) whenever the delegate attribute is reassigned or deleted. The hooks fall back to the ones `cls`
+    had before (either defined or inherited).
+
+    It is a no-op if no delegate is a `delegatee` with `cache_bound=True`, hence other classes pay no overhead at all.
+
+    Arguments:
+        cls: Composed class.
+        delegates: Key-value pair of delegates.
+
+    Returns:
+        The class itself.
+    """
+    cached = frozenset(name for name, value in delegates.items() if isinstance(value, delegatee) and value._cache_bound)
+    if not cached:
+        return cls
+
+    setattr_fallback = cls.__setattr__
+    delattr_fallback = cls.__delattr__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in cached:
+            invalidate_bound_methods(self, name)
+        setattr_fallback(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in cached:
+            invalidate_bound_methods(self, name)
+        delattr_fallback(self, name)
+
+    for hook in (__setattr__, __delattr__):
+        hook.__qualname__ = f"{cls.__qualname__}.{hook.__name__}"
+        setattr(cls, hook.__name__, hook)
+    return cls
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 1024
+
+# Number of times a composed class has been rebound (see `compclasses.rebind`), stored in its own `__dict__`.
+VERSION_ATTR = "__compclass_version__"
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `LRUCache`, mirroring `functools.lru_cache` `cache_info()` output."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Bounded, thread-safe, least recently used cache.
+
+    Every access to the entries holds the lock, hence the cache does not rely on the GIL and is safe on free-threaded
+    builds as well. Values are computed outside of the lock: if several threads miss the same key concurrently, the
+    first computed value is stored and returned to all of them, so that they share the same object.
+
+    Arguments:
+        maxsize: Maximum number of entries to keep, once reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get_or_compute(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Returns the value cached for `key`, calling `func` to compute (and cache) it on a miss.
+
+        If `key` is not hashable (e.g. a class whose metaclass defines `__eq__` without `__hash__`), `func` is called
+        and its result returned without being cached. Exceptions raised by `func` are propagated and nothing is cached.
+
+        Arguments:
+            key: Key to look up.
+            func: Zero arguments callable computing the value for `key`.
+
+        Returns:
+            The cached or freshly computed value (or the one stored by another thread in the meantime).
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return func()
+
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]  # type: ignore
+            self.misses += 1
+
+        value = func()
+
+        with self._lock:
+            value = self._data.setdefault(key, value)  # type: ignore
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries and resets statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# Process-wide caches:
+# - attrs: (delegatee_cls, version, attrs) -> parsed attrs tuple (see `delegatee._parse_attrs`).
+# - validation: (delegatee_cls, version, parsed attrs) -> True if `delegatee._validate_delegatee_methods` succeeded.
+# - discovery: (cls, mro) -> instance attributes discovered (see `compclasses._discovery.discover_attrs`).
+# - descriptors: (delegatee_name, delegatee spec, version, options) -> tuple of generated (new_attr_name, attr_name,
+#   descriptor).
+# Keys depending on what a composed delegatee class forwards hold its `class_version`, hence entries computed before it
+# is rebound are never hit again (and eventually evicted), without clearing the caches.
+_caches: Dict[str, LRUCache] = {
+    "attrs": LRUCache(),
+    "validation": LRUCache(),
+    "discovery": LRUCache(),
+    "descriptors": LRUCache(),
+}
+
+attrs_cache = _caches["attrs"]
+validation_cache = _caches["validation"]
+discovery_cache = _caches["discovery"]
+descriptors_cache = _caches["descriptors"]
+
+
+def class_version(cls: Any) -> int:
+    """Returns the number of times `cls` and its base classes have been rebound (see `compclasses.rebind`), `0` if
+    `cls` is not a class or has never been rebound."""
+    return sum(vars(klass).get(VERSION_ATTR, 0) for klass in getattr(cls, "__mro__", ()))
+
+
+def clear_cache() -> None:
+    """Clears every compclasses cache (parsed attributes, validation results, discovered instance attributes and
+    generated descriptors).
+
+    This is required only if a delegatee class is modified (e.g. monkeypatched) after having been used to define a
+    composed class, and the composed classes defined afterwards should reflect such change.
+    """
+    for cache in _caches.values():
+        cache.clear()
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Returns hits/misses statistics for each compclasses cache.
+
+    Returns:
+        Mapping from cache name (`"attrs"`, `"validation"`, `"discovery"` and `"descriptors"`) to its `CacheInfo`.
+    """
+    return {name: cache.info() for name, cache in _caches.items()}
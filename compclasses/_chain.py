@@ -0,0 +1,95 @@
+from typing import Iterable, NamedTuple, Tuple, Type, Union
+
+from compclasses._conflicts import Dispatcher
+from compclasses._delegatee import delegatee
+from compclasses._inheritance import DELEGATES_ATTR
+from compclasses._instrument import is_instrumented
+from compclasses._spec import SPEC_ATTR, Delegation, resolve
+
+# Maximum number of delegates in the path of a flattened forwarder (e.g. 2 for `"_b._c"`), see `flatten_chain`.
+MAX_CHAIN_DEPTH = 8
+
+# Kinds of forwarded names which are flattened, see `compclasses._spec.classify`. Dunders are looked up on the type of
+# each delegate, and static/class methods are injected as they are, hence neither go through the delegate path.
+_FLATTENABLE_KINDS = ("method", "property", "attribute", "unknown")
+
+
+class Chain(NamedTuple):
+    """Flattened source of a forwarded name: the path of delegates (e.g. `"_b._c"`), the class of the last delegate
+    (if known), the attribute name in it, and whether every hop is writable."""
+
+    delegatee_name: str
+    delegatee_cls: Union[Type, None]
+    attr_name: str
+    writable: bool
+
+
+def _next_hop(cls: Type, attr_name: str) -> Union[Tuple[Delegation, Union[Iterable[str], delegatee]], None]:
+    """Returns the `Delegation` of `attr_name` in the composed class `cls` together with the delegate it is forwarded
+    to, provided that `cls` forwards it through the descriptor it generated (i.e. not overridden, nor instrumented,
+    nor fanned out, nor dispatched). Otherwise `None` is returned, in which case the chain stops at `cls`."""
+    delegation = resolve(cls, attr_name)
+    if delegation is None or delegation.kind not in _FLATTENABLE_KINDS:
+        return None
+
+    # Names of classes composed with `lazy=True` have no descriptor until materialised, they are not flattened.
+    owner = next((klass for klass in cls.__mro__ if attr_name in klass.__dict__), None)
+    if owner is None or attr_name not in owner.__dict__.get(SPEC_ATTR, {}):  # e.g. overridden by a plain subclass
+        return None
+    descriptor = owner.__dict__[attr_name]
+    if is_instrumented(descriptor) or isinstance(descriptor, Dispatcher):
+        return None
+
+    delegatee_instance = getattr(cls, DELEGATES_ATTR, {}).get(delegation.delegatee_name)
+    if delegatee_instance is None or (isinstance(delegatee_instance, delegatee) and delegatee_instance._fanout):
+        return None
+    return delegation, delegatee_instance
+
+
+def flatten_chain(
+    delegatee_name: str,
+    delegatee_cls: Union[Type, None],
+    attr_name: str,
+    writable: bool = True,
+    max_depth: int = MAX_CHAIN_DEPTH,
+) -> Chain:
+    """Follows the delegation metadata of composed delegates to find the final source of `delegatee_name.attr_name`.
+
+    If `delegatee_cls` is itself composed, e.g. it forwards `attr_name` to its own delegate `_c`, the name can be
+    forwarded to `delegatee_name._c.attr_name` directly, skipping the descriptor of `delegatee_cls`. The same applies
+    to the class of `_c`, and so on, until the class of the last delegate is not composed (or unknown), it does not
+    forward the name through a generated descriptor (see `_next_hop`), or the path contains `max_depth` delegates.
+
+    Delegation cycles (e.g. a class forwarding a name to a delegate of its own type) stop the chain before the first
+    class and name met twice.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the attribute/method.
+        delegatee_cls: Class of the delegate, if known.
+        attr_name: Attribute/method of delegatee_name which we want to forward.
+        writable: Whether the forwarded attribute can be set and deleted.
+        max_depth: Maximum number of delegates in the flattened path.
+
+    Returns:
+        The flattened `Chain`, which is `Chain(delegatee_name, delegatee_cls, attr_name, writable)` itself if the name
+            cannot be flattened. It is read-only if any hop is read-only.
+    """
+    path, seen = [delegatee_name], {(delegatee_cls, attr_name)}
+
+    while delegatee_cls is not None and len(path) < max_depth:
+        hop = _next_hop(delegatee_cls, attr_name)
+        if hop is None:
+            break
+
+        delegation, delegatee_instance = hop
+        is_delegatee = isinstance(delegatee_instance, delegatee)
+        inner_cls = delegatee_instance.delegatee_cls if is_delegatee else None  # type: ignore
+        if (inner_cls, delegation.attr_name) in seen:
+            break
+
+        seen.add((inner_cls, delegation.attr_name))
+        path.append(delegation.delegatee_name)
+        delegatee_cls, attr_name = inner_cls, delegation.attr_name
+        writable = writable and (delegatee_instance._is_writable(attr_name) if is_delegatee else True)  # type: ignore
+
+    return Chain(".".join(path), delegatee_cls, attr_name, writable)
@@ -0,0 +1,239 @@
+from operator import attrgetter
+from types import FunctionType
+from typing import Any, Dict, Generator, Iterable, List, NamedTuple, Sequence, Tuple, Type, Union
+
+from compclasses._delegatee import _delegated_names, delegatee
+from compclasses._logging import Injection, logger
+
+# Policies resolving a name forwarded by several delegates, see `conflict_index`. A sequence of delegate names is a
+# priority list.
+POLICIES = ("error", "first", "last", "dispatch")
+
+Conflicts = Union[str, Sequence[str], None]
+
+
+class ConflictIndex(NamedTuple):
+    """Names colliding across the delegates of a composed class, as resolved by its conflict policy.
+
+    - sources: Mapping from each colliding name to the (`delegatee_name`, `attr_name`) pairs it is forwarded to, a
+        single pair unless the policy is `"dispatch"`, in which case they are tried in order.
+    - collisions: Mapping from each colliding name to the names of all the delegates exposing it.
+    - shadowed: Names defined in the body of the class which are replaced by forwarded names.
+    """
+
+    sources: Dict[str, Tuple[Tuple[str, str], ...]]
+    collisions: Dict[str, Tuple[str, ...]]
+    shadowed: Tuple[str, ...]
+
+
+class Dispatcher:
+    """Data descriptor forwarding a name exposed by several delegates (with `conflicts="dispatch"`), trying the
+    forwarding descriptor of each delegate in order: the first one which does not raise `AttributeError` (e.g.
+    because the delegate is missing, or it has no such attribute) is used.
+
+    Plain functions (e.g. compiled forwarders, see `compclasses._core.method_from_delegator`) never fail to bind,
+    hence the delegate attribute they forward to is looked up first, and they are skipped if it raises
+    `AttributeError`.
+
+    Arguments:
+        name: Forwarded name.
+        candidates: Forwarding descriptors (or class level constants) of each delegate, in order.
+        sources: (`delegatee_name`, `attr_name`) pair forwarded by each candidate, in the same order.
+    """
+
+    __slots__ = ("name", "candidates", "_probes")
+
+    def __init__(self, name: str, candidates: Tuple[Any, ...], sources: Tuple[Tuple[str, str], ...]):
+        self.name = name
+        self.candidates = candidates
+        self._probes = tuple(
+            attrgetter(f"{delegatee_name}.{attr_name}") if isinstance(candidate, FunctionType) else None
+            for candidate, (delegatee_name, attr_name) in zip(candidates, sources)
+        )
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        if instance is None:
+            return self
+
+        error = None
+        for candidate, probe in zip(self.candidates, self._probes):
+            get = getattr(type(candidate), "__get__", None)
+            if get is None:
+                return candidate
+            try:
+                if probe is not None:
+                    probe(instance)
+                return get(candidate, instance, owner)
+            except AttributeError as e:
+                error = e
+        raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'") from error
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._apply("__set__", instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self._apply("__delete__", instance)
+
+    def _apply(self, method: str, instance: Any, *args: Any) -> None:
+        """Calls `method` (i.e. `__set__` or `__delete__`) of the first candidate which supports it without raising
+        `AttributeError`."""
+        error = None
+        for candidate in self.candidates:
+            func = getattr(type(candidate), method, None)
+            if func is None:
+                continue
+            try:
+                return func(candidate, instance, *args)
+            except AttributeError as e:
+                error = e
+        raise AttributeError(
+            f"Forwarded attribute '{self.name}' of '{type(instance).__name__}' object cannot be set"
+        ) from error
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.candidates!r})"
+
+
+def check_conflicts(conflicts: Conflicts, delegate_names: Iterable[str]) -> None:
+    """Validates a conflict policy, see `conflict_index`.
+
+    Raises:
+        ValueError: if `conflicts` is neither `None`, one of `POLICIES` nor a sequence of delegate names.
+    """
+    if conflicts is None or conflicts in POLICIES:
+        return
+    if isinstance(conflicts, str):
+        raise ValueError(f"`conflicts` must be one of {POLICIES} or a sequence of delegate names, got '{conflicts}'")
+
+    unknown = [name for name in conflicts if name not in set(delegate_names)]
+    if unknown:
+        raise ValueError(f"`conflicts` priority list contains names which are not delegates: {unknown}")
+
+
+def injections(delegates: Dict[str, Union[Iterable[str], delegatee]]) -> Iterable[Injection]:
+    """Generates the (`new_attr_name`, `delegatee_name`, `attr_name`) triplets of every delegate, in order."""
+    for delegatee_name, delegatee_instance in delegates.items():
+        for new_attr_name, attr_name in _delegated_names(delegatee_instance):
+            yield new_attr_name, delegatee_name, attr_name
+
+
+def conflict_index(
+    injected: Iterable[Injection],
+    conflicts: Conflicts = None,
+    defined: Iterable[str] = (),
+    cls_name: str = "",
+) -> ConflictIndex:
+    """Indexes the names forwarded by more than one delegate, and the ones replacing names defined in the class body,
+    in a single pass over the forwarded names.
+
+    Colliding names are resolved according to `conflicts`:
+
+    - `None` (default): the last delegate wins, and every collision is reported by a WARNING record of the
+        `compclasses` logger;
+    - `"error"`: a `ValueError` is raised;
+    - `"first"` or `"last"`: the first or last delegate (in order of definition) wins;
+    - a sequence of delegate names: the first listed delegate wins, delegates which are not listed rank after the
+        listed ones, in order of definition;
+    - `"dispatch"`: the name is forwarded by a `Dispatcher`, trying every delegate in order of definition.
+
+    Names defined in the class body are replaced by forwarded names, which is reported by a WARNING record (or
+    raises a `ValueError` with `conflicts="error"`).
+
+    Arguments:
+        injected: (`new_attr_name`, `delegatee_name`, `attr_name`) triplets, in order of definition.
+        conflicts: Conflict policy.
+        defined: Names defined in the class body.
+        cls_name: Name of the composed class, used for reporting.
+
+    Returns:
+        The `ConflictIndex` of the forwarded names.
+
+    Raises:
+        ValueError: if there is any collision or shadowed name and `conflicts="error"`.
+    """
+    sources: Dict[str, List[Tuple[str, str]]] = {}
+    collided = []
+    for new_attr_name, delegatee_name, attr_name in injected:
+        pairs = sources.get(new_attr_name)
+        if pairs is None:
+            sources[new_attr_name] = [(delegatee_name, attr_name)]
+        elif all(name != delegatee_name for name, _ in pairs):
+            pairs.append((delegatee_name, attr_name))
+            if len(pairs) == 2:
+                collided.append(new_attr_name)
+
+    collisions = {name: tuple(delegatee_name for delegatee_name, _ in sources[name]) for name in collided}
+    shadowed = tuple(name for name in defined if name in sources)
+
+    if conflicts == "error" and (collisions or shadowed):
+        problems = [
+            *([f"forwarded names collide across delegates {collisions}"] if collisions else []),
+            *([f"forwarded names shadow names defined in the class {list(shadowed)}"] if shadowed else []),
+        ]
+        raise ValueError(f"{cls_name}: {'; '.join(problems)}")
+    if collisions and conflicts is None:
+        logger.warning(
+            "%s: forwarded names collide across delegates, the last one wins: %s",
+            cls_name,
+            collisions,
+            extra={"compclass": cls_name, "collisions": collisions},
+        )
+    if shadowed:
+        logger.warning(
+            "%s: forwarded names shadow names defined in the class: %s",
+            cls_name,
+            ", ".join(shadowed),
+            extra={"compclass": cls_name, "shadowed": shadowed},
+        )
+
+    resolved = {name: resolve_conflict(sources[name], conflicts) for name in collided}
+    return ConflictIndex(resolved, collisions, shadowed)
+
+
+def resolve_conflict(pairs: Sequence[Tuple[str, str]], conflicts: Conflicts) -> Tuple[Tuple[str, str], ...]:
+    """Returns the (`delegatee_name`, `attr_name`) pairs a name forwarded by several delegates is forwarded to, given
+    the (`delegatee_name`, `attr_name`) pairs of every delegate exposing it and the conflict policy.
+
+    Raises:
+        ValueError: if `conflicts="error"`.
+    """
+    if conflicts == "error":
+        raise ValueError(f"Forwarded name collides across delegates {tuple(name for name, _ in pairs)}")
+    if conflicts == "dispatch":
+        return tuple(pairs)
+    if conflicts == "first":
+        return (pairs[0],)
+    if conflicts is None or conflicts == "last":
+        return (pairs[-1],)
+
+    rank = {name: idx for idx, name in enumerate(conflicts)}  # type: ignore
+    return (min(pairs, key=lambda pair: rank.get(pair[0], len(rank))),)
+
+
+def resolve_descriptors(
+    generated: Iterable[Tuple[str, str, str, Any]],
+    conflicts: Union[ConflictIndex, None] = None,
+) -> Generator[Tuple[str, str, str, Any], None, None]:
+    """Filters the generated (`new_attr_name`, `delegatee_name`, `attr_name`, descriptor) quadruplets according to a
+    `ConflictIndex`: a colliding name is kept only for the delegate it is resolved to, or it is yielded once, as a
+    `Dispatcher` over the descriptors of every delegate it is dispatched to (reported as forwarded to the first one).
+
+    Arguments:
+        generated: Quadruplets of every delegate, in order of definition.
+        conflicts: Index of the names forwarded by several delegates, by default every quadruplet is yielded.
+
+    Returns:
+        Generator of the resolved quadruplets.
+    """
+    sources = conflicts.sources if conflicts is not None else {}
+    dispatched: Dict[str, List[Any]] = {}
+
+    for new_attr_name, delegatee_name, attr_name, descriptor in generated:
+        kept = sources.get(new_attr_name)
+        if kept is None or kept == ((delegatee_name, attr_name),):
+            yield new_attr_name, delegatee_name, attr_name, descriptor
+        elif len(kept) > 1 and (delegatee_name, attr_name) in kept:
+            # Yielded once the descriptors of every delegate it is dispatched to are generated.
+            dispatched.setdefault(new_attr_name, []).append(descriptor)
+            if (delegatee_name, attr_name) == kept[-1]:
+                yield new_attr_name, *kept[0], Dispatcher(new_attr_name, tuple(dispatched.pop(new_attr_name)), kept)
@@ -1,8 +1,24 @@
+import ast
+import inspect
+from functools import update_wrapper
+from inspect import Parameter
+from keyword import iskeyword
 from operator import attrgetter
-from typing import Callable, Dict, Generator, Iterable, Tuple, TypeVar, Union
+from types import FunctionType, MethodDescriptorType, WrapperDescriptorType
+from typing import Any, Callable, Dict, Generator, Iterable, List, Tuple, Type, TypeVar, Union
 
-from compclasses._delegatee import delegatee
-from compclasses._logging import logger
+from compclasses._async import is_async_method
+from compclasses._attribute import ClassLevelAttribute, delegated_attribute
+from compclasses._bound import BoundMethodCache
+from compclasses._cache import class_version, descriptors_cache
+from compclasses._chain import flatten_chain
+from compclasses._conflicts import ConflictIndex, resolve_descriptors
+from compclasses._delegatee import _delegated_names, delegatee
+from compclasses._discovery import discover_attrs
+from compclasses._fanout import _is_method, method_from_fanout, property_from_fanout
+from compclasses._instrument import instrument_descriptor
+from compclasses._logging import Injection, is_reporting, log_injection
+from compclasses._protocols import dunder_from_protocol
 
 T = TypeVar("T")
 
@@ -11,6 +27,8 @@ def property_from_delegator(
     delegatee_cls_name: str,
     attr_name: str,
     new_attr_name: str,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+    writable: bool = True,
 ) -> property:
     """Defines a property called `new_attr_name` based upon `delegate_cls_name.attr_name`.
 
@@ -23,79 +41,517 @@ def property_from_delegator(
     We define the property as follows:
 
         - fget: returns the value of `delegatee_cls_name.attr_name`
-        - fset: sets the value of `delegatee_cls_name.new_attr_name`
-        - fdel: deletes the value of `delegatee_cls_name.new_attr_name`
+        - fset: sets the value of `delegatee_cls_name.attr_name` (unless read-only)
+        - fdel: deletes the value of `delegatee_cls_name.attr_name` (unless read-only)
 
     and using `wrapped_delegatee = attrgetter(delegatee_cls_name)` which allows us to access `self.delegatee_cls_name`
-    by calling  `wrapped_delegatee(self)`.
+    by calling  `wrapped_delegatee(self)`, unless a custom `delegatee_getter` is provided (e.g. the `__get__` of a slot
+    member descriptor).
 
     Arguments:
         delegatee_cls_name: Name of the attribute from which we forward the method.
         attr_name: Attribute/method of delegatee_cls_name which we want to forward.
         new_attr_name: Name of the new attribute to be created in the scope of the class which will be used to access
             the attribute/method of delegatee_cls.
+        delegatee_getter: Callable returning the delegate given the composed instance, defaults to
+            `attrgetter(delegatee_cls_name)`.
+        writable: Whether the property has `fset` and `fdel`, otherwise setting or deleting it raises `AttributeError`.
 
     Returns:
         property: Property which will be injected in the class.
     """
 
-    wrapped_delegatee = attrgetter(delegatee_cls_name)  # => wrapped_delegatee(self) returns self.delegatee_cls_name
+    # => wrapped_delegatee(self) returns self.delegatee_cls_name
+    wrapped_delegatee = attrgetter(delegatee_cls_name) if delegatee_getter is None else delegatee_getter
 
     def fget(self):
         """Function to be used for getting an attribute value."""
         return getattr(wrapped_delegatee(self), attr_name)
 
+    if not writable:
+        return property(fget=fget, doc=fget.__doc__)
+
     def fset(self, value):
         """Function to be used for setting an attribute value."""
-        setattr(wrapped_delegatee(self), new_attr_name, value)
+        setattr(wrapped_delegatee(self), attr_name, value)
 
     def fdel(self):
         """Function to be used for deleting an attribute value."""
-        delattr(wrapped_delegatee(self), new_attr_name)
+        delattr(wrapped_delegatee(self), attr_name)
 
     return property(fget=fget, fset=fset, fdel=fdel, doc=fget.__doc__)
 
 
-def generate_properties(
-    delegates: Dict[str, Union[Iterable[str], delegatee]],
-    verbose: bool = True,
-    log_func: Callable[[str], None] = logger.info,
-) -> Generator[Tuple[str, property], None, None]:
-    """Creates a generator of (`new_attr_name`, `property_to_inject`), which is used to inject the property into the
-    class of interest, by iterating over the delegates argument.
+def property_from_property(
+    delegatee_cls_name: str,
+    attr_name: str,
+    prop: property,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+    writable: bool = True,
+) -> property:
+    """Defines a property forwarding `attr_name`, a property of the delegatee class, keeping its docstring and its
+    accessors.
+
+    Contrary to `property_from_delegator`, accessors missing in `prop` (e.g. read-only properties) are missing in the
+    new property as well. Accessors are not called directly: the delegate attribute is looked up at each access, hence
+    the property of the runtime type of the delegate is used (e.g. a subclass of the delegatee class overriding it).
 
     Arguments:
-        delegates: Key-value pair of delegates.
-        verbose: Whether to log the injection of the properties.
-        log_func: Function used to log, unused if verbose is set to False.
+        delegatee_cls_name: Name of the attribute from which we forward the property.
+        attr_name: Name of the property in the delegatee class.
+        prop: The property, as defined in the delegatee class.
+        delegatee_getter: Callable returning the delegate given the composed instance, defaults to
+            `attrgetter(delegatee_cls_name)`.
+        writable: Whether to forward setting and deleting the property, if `prop` supports them.
 
     Returns:
-        Generator[Tuple[str, property], None, None]: generator of (`new_attr_name`, `property_to_inject`) which is used
-            to inject the property into the class of interest.
+        property: Property which will be injected in the class.
     """
+    wrapped_delegatee = attrgetter(delegatee_cls_name) if delegatee_getter is None else delegatee_getter
 
-    for delegatee_name, delegatee_instance in delegates.items():
-        is_delegatee = isinstance(delegatee_instance, delegatee)
+    def fget(self):
+        return getattr(wrapped_delegatee(self), attr_name)
 
-        for attr_name in delegatee_instance:
-            if is_delegatee and not delegatee._is_dunder_method(attr_name):
-                pfx, sfx = (
-                    delegatee_instance._prefix,  # type: ignore
-                    delegatee_instance._suffix,  # type: ignore
-                )
+    def fset(self, value):
+        setattr(wrapped_delegatee(self), attr_name, value)
 
-            else:
-                pfx, sfx = "", ""
+    def fdel(self):
+        delattr(wrapped_delegatee(self), attr_name)
+
+    return property(
+        fget=fget if prop.fget is not None else None,
+        fset=fset if writable and prop.fset is not None else None,
+        fdel=fdel if writable and prop.fdel is not None else None,
+        doc=prop.__doc__,
+    )
+
+
+def _is_constant(delegatee_cls: Type, attr_name: str, member: Any) -> bool:
+    """Assesses whether or not `member` (i.e. `attr_name` of `delegatee_cls`) is a class level constant, namely an
+    UPPER_CASE, non-callable class attribute which is neither a descriptor nor shadowed by an instance attribute."""
+    return (
+        attr_name.isupper()
+        and member is not None
+        and not callable(member)
+        and not hasattr(type(member), "__get__")
+        and any(attr_name in vars(klass) for klass in delegatee_cls.__mro__)
+        and attr_name not in discover_attrs(delegatee_cls, mro=True)
+    )
+
+
+def descriptor_from_kind(
+    delegatee_cls: Type,
+    delegatee_cls_name: str,
+    attr_name: str,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+    writable: bool = True,
+) -> Union[Any, None]:
+    """Creates the best forwarder of `attr_name` according to its kind in `delegatee_cls` (see `classify`), namely:
+
+    - staticmethods, classmethods and class level constants (see `_is_constant`) are forwarded by a
+        `ClassLevelAttribute`: accessed from the composed class itself, staticmethods are returned as they are,
+        classmethods are bound to `delegatee_cls` and constants are captured by value, at class creation time.
+    - properties keep their docstring and accessors, see `property_from_property`.
+
+    Accessed from a composed instance, each of them is looked up on the delegate (see `DelegatedAttribute`), whose
+    runtime type may be a subclass of `delegatee_cls` overriding it, and setting or deleting them is forwarded to the
+    delegate (unless read-only).
+
+    Arguments:
+        delegatee_cls: Class of the delegate.
+        delegatee_cls_name: Name of the attribute from which we forward the attribute/method.
+        attr_name: Attribute/method of delegatee_cls_name which we want to forward.
+        delegatee_getter: Callable returning the delegate given the composed instance, see `property_from_delegator`.
+        writable: Whether setting and deleting the name on composed instances is forwarded to the delegate.
+
+    Returns:
+        The object to inject, or `None` if `attr_name` is of any other kind (e.g. instance method or attribute).
+    """
+    member = inspect.getattr_static(delegatee_cls, attr_name, None)
+
+    if type(member) is property:
+        return property_from_property(delegatee_cls_name, attr_name, member, delegatee_getter, writable)
+
+    if isinstance(member, staticmethod):
+        class_value = member.__func__
+    elif isinstance(member, classmethod):
+        class_value = getattr(delegatee_cls, attr_name)
+    elif _is_constant(delegatee_cls, attr_name, member):
+        class_value = member
+    else:
+        return None
+    forward = delegated_attribute(delegatee_cls_name, attr_name, delegatee_getter, writable)
+    return ClassLevelAttribute(class_value, forward)
+
+
+def _literal(value: Any) -> Union[str, None]:
+    """Returns the source code of `value` if it is a literal which `repr` round-trips (e.g. `1`, `"a"`, `(None,)`)."""
+    source = repr(value)
+    try:
+        evaluated = ast.literal_eval(source)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return source if type(evaluated) is type(value) and evaluated == value else None
+
+
+def _forwarding_signature(method: Callable) -> Union[Tuple[str, str, str], None]:
+    """Builds the source code to reproduce the parameters of a python function in a forwarding function.
+
+    Parameters are reproduced up to the first one with a default value: from there on, arguments are collected by
+    `*args` and `**kwargs` and passed through, so that the delegate applies its own defaults (which may differ from the
+    ones of `method`, e.g. if the delegate is an instance of a subclass overriding it).
+
+    Arguments:
+        method: The original method, whose first parameter is the delegate instance.
+
+    Returns:
+        Tuple of (name of the first parameter, parameters definition, call arguments), e.g. `("self", "self, x, *,
+            y", "x, y=y")` for `def method(self, x, *, y)` or `("self", "self, x, *args, **kwargs", "x, *args,
+            **kwargs")` for `def method(self, x, y=1)`, or `None` if `method` is not a python function with at least
+            one positional parameter.
+    """
+    if not isinstance(method, FunctionType):
+        return None
+
+    params = list(inspect.signature(method, follow_wrapped=False).parameters.values())
+    if not params or params[0].kind not in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+        return None
+
+    names = {p.name for p in params[1:]}
+    self_name, args_name, kwargs_name = "self", "args", "kwargs"
+    while self_name in names:
+        self_name = f"_{self_name}"
+    while args_name in names:
+        args_name = f"_{args_name}"
+    while kwargs_name in names:
+        kwargs_name = f"_{kwargs_name}"
+
+    definition, call = [self_name], []
+    has_var_positional, is_keyword_only, is_positional_only = False, False, False
+    for idx, param in enumerate([*params, None]):
+        # The positional-only marker closes the positional-only parameters reproduced so far, before the first
+        # parameter which is not reproduced as one (or at the end).
+        if is_positional_only and (
+            param is None or param.kind != Parameter.POSITIONAL_ONLY or param.default is not Parameter.empty
+        ):
+            definition.append("/")
+            is_positional_only = False
+        if param is None:
+            break
+
+        kind, name = param.kind, param.name
+        if param.default is not Parameter.empty:
+            # The remaining arguments are passed through, e.g. `def f(self, x, y=1)` -> `def f(self, x, *args,
+            # **kwargs)`.
+            if not (has_var_positional or is_keyword_only):
+                definition.append(f"*{args_name}")
+                call.append(f"*{args_name}")
+            definition.append(f"**{kwargs_name}")
+            call.append(f"**{kwargs_name}")
+            break
+
+        if kind == Parameter.POSITIONAL_ONLY:
+            is_positional_only = True
+        if idx > 0 and kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+            definition.append(name)
+            call.append(name)
+        elif kind == Parameter.VAR_POSITIONAL:
+            has_var_positional = True
+            definition.append(f"*{name}")
+            call.append(f"*{name}")
+        elif kind == Parameter.KEYWORD_ONLY:
+            if not (has_var_positional or is_keyword_only):
+                definition.append("*")
+            is_keyword_only = True
+            definition.append(name)
+            call.append(f"{name}={name}")
+        elif kind == Parameter.VAR_KEYWORD:
+            definition.append(f"**{name}")
+            call.append(f"**{name}")
+
+    return self_name, ", ".join(definition), ", ".join(call)
+
+
+def forwarder_source(delegatee_cls_name: str, attr_name: str, new_attr_name: str, method: Callable) -> str:
+    """Returns the source code of the function forwarding calls to `delegatee_cls_name.attr_name`, see
+    `method_from_delegator` and `_forwarding_signature`."""
+    signature = _forwarding_signature(method)
+    self_name, definition, call = (
+        signature if signature is not None else ("self", "self, /, *args, **kwargs", "*args, **kwargs")
+    )
+
+    is_coroutine = inspect.iscoroutinefunction(method)
+    return (
+        f"{'async ' if is_coroutine else ''}def {new_attr_name}({definition}):\n"
+        f"    return {'await ' if is_coroutine else ''}{self_name}.{delegatee_cls_name}.{attr_name}({call})\n"
+    )
+
+
+def method_from_delegator(
+    delegatee_cls_name: str,
+    attr_name: str,
+    new_attr_name: str,
+    method: Callable,
+) -> Callable:
+    """Defines a function called `new_attr_name` which directly forwards calls to `delegatee_cls_name.attr_name`.
+
+    Contrary to `property_from_delegator`, the function is generated from source code via `exec`, i.e. it is
+    equivalent to the hand-written wrapper. If `method` is a python function, the wrapper reproduces its parameters
+    up to the first one with a default, e.g. for `def hello(self, name, *, greeting="Hello")`:
+
+    ```python
+    def new_attr_name(self, name, **kwargs):  # `greeting` defaults to the one of the delegate, if not passed
+        return self.delegatee_cls_name.attr_name(name, **kwargs)
+    ```
+
+    otherwise (e.g. for builtin methods) it falls back to:
+
+    ```python
+    def new_attr_name(self, /, *args, **kwargs):
+        return self.delegatee_cls_name.attr_name(*args, **kwargs)
+    ```
 
-            new_attr_name = f"{pfx}{attr_name}{sfx}"
+    hence calling the forwarded method costs a single function call, without any property access nor bound method
+    allocation in between.
 
-            property_to_inject = property_from_delegator(
+    If `method` is a coroutine function (i.e. defined with `async def`), the wrapper is a native coroutine function
+    as well, namely `async def new_attr_name(...): return await self.delegatee_cls_name.attr_name(...)`, so that
+    `inspect.iscoroutinefunction` and frameworks relying on it treat the forwarded method as the original one.
+
+    The generated function is wrapped with `functools.update_wrapper`, therefore it keeps the original docstring and
+    `__wrapped__` attribute (which `inspect.signature` follows to retrieve the original signature).
+
+    Arguments:
+        delegatee_cls_name: Name of the attribute from which we forward the method.
+        attr_name: Method of delegatee_cls_name which we want to forward.
+        new_attr_name: Name of the new method to be created in the scope of the class.
+        method: The original method, as defined in the delegatee class.
+
+    Returns:
+        Function which will be injected in the class.
+    """
+    namespace: Dict[str, Any] = {}
+    # Only identifiers are interpolated: names checked by `_is_compilable` and parameters of a function signature.
+    exec(forwarder_source(delegatee_cls_name, attr_name, new_attr_name, method), {}, namespace)  # nosec B102
+    forwarder = namespace[new_attr_name]
+
+    update_wrapper(forwarder, method)
+    forwarder.__name__ = forwarder.__qualname__ = new_attr_name
+    return forwarder
+
+
+def _is_identifier(name: str) -> bool:
+    """Assesses whether or not `name` can be used as a python identifier in generated source code."""
+    return name.isidentifier() and not iskeyword(name)
+
+
+def _is_identifier_path(name: str) -> bool:
+    """Assesses whether or not `name` is a (dotted) path of python identifiers, e.g. `"_foo"` or `"_foo.bar"`."""
+    return all(map(_is_identifier, name.split(".")))
+
+
+def _is_compilable(
+    delegatee_cls: Union[Type, None],
+    delegatee_cls_name: str,
+    attr_name: str,
+    new_attr_name: str,
+) -> bool:
+    """Assesses whether or not `attr_name` can be forwarded using `method_from_delegator`, namely if `delegatee_cls` is
+    known, `attr_name` is a plain (python or builtin) method of it and all names are valid python identifiers."""
+    if delegatee_cls is None:
+        return False
+
+    names_are_valid = (
+        _is_identifier_path(delegatee_cls_name) and _is_identifier(attr_name) and _is_identifier(new_attr_name)
+    )
+    return names_are_valid and isinstance(
+        inspect.getattr_static(delegatee_cls, attr_name, None),
+        (FunctionType, MethodDescriptorType, WrapperDescriptorType),
+    )
+
+
+def _make_descriptor(
+    delegatee_name: str,
+    delegatee_instance: Union[Iterable[str], delegatee],
+    attr_name: str,
+    new_attr_name: str,
+    compiled: bool,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+) -> Any:
+    """Creates the descriptor (see `DelegatedAttribute`, or the function in compiled mode) forwarding
+    `delegatee_name.attr_name`, unless a better forwarder exists for its kind (see `descriptor_from_kind`).
+
+    If the class of the delegate is itself composed and the delegatee has `flatten=True`, the name is forwarded to the
+    innermost delegate of the chain directly, see `compclasses._chain.flatten_chain`.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the attribute/method.
+        delegatee_instance: Iterable of attributes/methods names or `delegatee` instance.
+        attr_name: Attribute/method of delegatee_name which we want to forward.
+        new_attr_name: Name of the new attribute in the scope of the composed class.
+        compiled: Whether to generate a plain forwarding function if `attr_name` is a method, see
+            `generate_properties`. Asynchronous methods (see `is_async_method`) are always forwarded by functions.
+        delegatee_getter: Callable returning the delegate given the composed instance, see `property_from_delegator`.
+
+    Returns:
+        Descriptor, function (or class level constant) which will be injected in the class.
+    """
+    is_delegatee = isinstance(delegatee_instance, delegatee)
+    delegatee_cls = delegatee_instance.delegatee_cls if is_delegatee else None  # type: ignore
+    compiled = compiled or is_async_method(delegatee_cls, attr_name)
+    writable = delegatee_instance._is_writable(attr_name) if is_delegatee else True  # type: ignore
+
+    if is_delegatee and delegatee_instance._fanout:  # type: ignore
+        options = {"reduce": delegatee_instance._reduce, "executor": delegatee_instance._executor}  # type: ignore
+        if compiled and _is_compilable(delegatee_cls, delegatee_name, attr_name, new_attr_name):
+            return method_from_fanout(
                 delegatee_cls_name=delegatee_name,
                 attr_name=attr_name,
                 new_attr_name=new_attr_name,
+                method=inspect.getattr_static(delegatee_cls, attr_name),
+                delegatee_getter=delegatee_getter,
+                **options,
             )
+        return property_from_fanout(
+            delegatee_cls_name=delegatee_name,
+            attr_name=attr_name,
+            new_attr_name=new_attr_name,
+            delegatee_cls=delegatee_cls,
+            delegatee_getter=delegatee_getter,
+            writable=writable,
+            **options,
+        )
+
+    if is_delegatee and delegatee_instance._protocols and _is_identifier_path(delegatee_name):  # type: ignore
+        if attr_name in delegatee_instance._protocol_dunders():  # type: ignore
+            return dunder_from_protocol(delegatee_cls, delegatee_name, attr_name)
+
+    # Bound method caches are invalidated per delegate of the composed class, hence their path cannot be flattened.
+    flattenable = (
+        is_delegatee
+        and delegatee_instance._flatten  # type: ignore
+        and delegatee_getter is None
+        and not delegatee_instance._cache_bound  # type: ignore
+    )
+    if flattenable and not delegatee._is_dunder_method(attr_name):
+        delegatee_name, delegatee_cls, attr_name, writable = flatten_chain(
+            delegatee_name, delegatee_cls, attr_name, writable
+        )
+        compiled = compiled or is_async_method(delegatee_cls, attr_name)
+
+    if delegatee_cls is not None and not delegatee._is_dunder_method(attr_name):
+        descriptor = descriptor_from_kind(delegatee_cls, delegatee_name, attr_name, delegatee_getter, writable)
+        if descriptor is not None:
+            return descriptor
+
+    if is_delegatee and delegatee_instance._cache_bound and _is_method(delegatee_cls, attr_name):  # type: ignore
+        if not delegatee._is_dunder_method(attr_name):
+            return BoundMethodCache(delegatee_name, attr_name, new_attr_name, delegatee_getter)
+
+    if compiled and _is_compilable(delegatee_cls, delegatee_name, attr_name, new_attr_name):
+        return method_from_delegator(
+            delegatee_cls_name=delegatee_name,
+            attr_name=attr_name,
+            new_attr_name=new_attr_name,
+            method=inspect.getattr_static(delegatee_cls, attr_name),
+        )
+
+    return delegated_attribute(delegatee_name, attr_name, delegatee_getter, writable)
+
+
+def _generate_descriptors(
+    delegatee_name: str,
+    delegatee_instance: Union[Iterable[str], delegatee],
+    compiled: bool,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+) -> Tuple[Tuple[str, str, Union[property, Callable]], ...]:
+    """Generates the (`new_attr_name`, `attr_name`, `property_to_inject`) triplets of a single delegate.
+
+    Arguments:
+        delegatee_name: Name of the attribute from which we forward the attributes/methods.
+        delegatee_instance: Iterable of attributes/methods names or `delegatee` instance.
+        compiled: Whether to generate plain forwarding functions for methods, see `generate_properties`.
+        delegatee_getter: Callable returning the delegate given the composed instance, see `property_from_delegator`.
+
+    Returns:
+        Tuple of (`new_attr_name`, `attr_name`, `property_to_inject`) triplets.
+    """
+    return tuple(
+        (
+            new_attr_name,
+            attr_name,
+            _make_descriptor(delegatee_name, delegatee_instance, attr_name, new_attr_name, compiled, delegatee_getter),
+        )
+        for new_attr_name, attr_name in _delegated_names(delegatee_instance)
+    )
+
+
+def generate_properties(
+    delegates: Dict[str, Union[Iterable[str], delegatee]],
+    verbose: bool = False,
+    log_func: Union[Callable[[str], None], None] = None,
+    compiled: bool = False,
+    delegatee_getters: Union[Dict[str, Callable[[Any], Any]], None] = None,
+    cls_name: str = "",
+    instrument: bool = False,
+    conflicts: Union[ConflictIndex, None] = None,
+) -> Generator[Tuple[str, Union[property, Callable]], None, None]:
+    """Creates a generator of (`new_attr_name`, `property_to_inject`), which is used to inject the property into the
+    class of interest, by iterating over the delegates argument.
+
+    Arguments:
+        delegates: Key-value pair of delegates.
+        verbose: Whether to report the injected names, as a single record once the generator is exhausted (see
+            `log_injection`).
+        log_func: Custom function used to report, by default an INFO record of the `compclasses` logger is emitted.
+            Unused if verbose is set to False.
+        compiled: Whether to generate plain forwarding functions (see `method_from_delegator`) for the methods of
+            `delegatee` instances with a known `delegatee_cls`. Attributes and every other name are still forwarded
+            using a descriptor (see `compclasses._attribute.DelegatedAttribute`).
+        delegatee_getters: Custom callables returning each delegate given the composed instance (e.g. the `__get__`
+            of slot member descriptors), by default `attrgetter(delegatee_name)` is used.
+        cls_name: Name of the composed class, used for reporting and instrumentation.
+        instrument: Whether to record calls statistics of every forwarded name under `cls_name` (see
+            `compclasses.stats`).
+        conflicts: Index of the names forwarded by several delegates, see `compclasses._conflicts.resolve_descriptors`.
+            By default every name is generated, hence the last delegate wins once injected.
+
+    Returns:
+        Generator[Tuple[str, Union[property, Callable]], None, None]: generator of (`new_attr_name`,
+            `property_to_inject`) which is used to inject the property into the class of interest.
+
+    Remark that the generated properties only depend on the delegate name and its specification, namely
+    (`delegatee_cls`, `attrs`, `prefix`, `suffix` and fan-out options), hence they are cached process-wide and shared
+    by all classes composed with the same delegates (see `compclasses.clear_cache` and `compclasses.cache_info`), until
+    the class of the delegate is rebound (see `compclasses.rebind`). Instrumented copies are created per composed class,
+    outside of the cache.
+    """
+    injected: Union[List[Injection], None] = [] if is_reporting(verbose, log_func) else None
+
+    def generated() -> Generator[Tuple[str, str, str, Any], None, None]:
+        for delegatee_name, delegatee_instance in delegates.items():
+            if isinstance(delegatee_instance, delegatee):
+                spec, version = delegatee_instance._cache_key(), class_version(delegatee_instance.delegatee_cls)
+            else:
+                delegatee_instance = tuple(delegatee_instance)
+                spec, version = (None, delegatee_instance), 0
+
+            delegatee_getter = (delegatee_getters or {}).get(delegatee_name)
+            descriptors = descriptors_cache.get_or_compute(
+                (delegatee_name, spec, version, compiled, delegatee_getter),
+                lambda: _generate_descriptors(delegatee_name, delegatee_instance, compiled, delegatee_getter),
+            )
+
+            for new_attr_name, attr_name, property_to_inject in descriptors:
+                if instrument:
+                    property_to_inject = instrument_descriptor(property_to_inject, cls_name, delegatee_name, attr_name)
+                yield new_attr_name, delegatee_name, attr_name, property_to_inject
+
+    for new_attr_name, delegatee_name, attr_name, property_to_inject in resolve_descriptors(generated(), conflicts):
+        if injected is not None:
+            injected.append((new_attr_name, delegatee_name, attr_name))
 
-            if verbose:
-                log_func(f"Setting {new_attr_name} from {delegatee_name}.{attr_name}")
+        yield new_attr_name, property_to_inject
 
-            yield new_attr_name, property_to_inject
+    if injected is not None:
+        log_injection(cls_name, injected, log_func)
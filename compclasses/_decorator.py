@@ -1,7 +1,17 @@
-from typing import Callable, Dict, Iterable, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, Type, TypeVar, Union
 
-from compclasses._core import generate_properties, logger
+from compclasses._aot import load_prebuilt, record_prebuildable
+from compclasses._bound import install_bound_cache
+from compclasses._conflicts import Conflicts, check_conflicts, conflict_index, injections
+from compclasses._core import generate_properties
 from compclasses._delegatee import delegatee
+from compclasses._holders import install_holders
+from compclasses._inheritance import diff_delegates, inherited_delegates, record_delegation
+from compclasses._lazy import install_lazy
+from compclasses._pickling import PicklePolicy, install_pickling, resolve_policies
+from compclasses._slots import add_slots, slot_getters
+from compclasses._spec import SPEC_ATTR
+from compclasses._swap import Composition, record_options
 
 T = TypeVar("T")
 
@@ -9,8 +19,14 @@ T = TypeVar("T")
 def compclass(
     _cls: Union[Type[T], None] = None,
     delegates: Union[Dict[str, Union[Iterable[str], delegatee]], None] = None,
-    verbose: bool = True,
-    log_func: Callable[[str], None] = logger.info,
+    verbose: bool = False,
+    log_func: Union[Callable[[str], None], None] = None,
+    compiled: bool = False,
+    lazy: bool = False,
+    slots: bool = False,
+    instrument: bool = False,
+    pickling: Union[Dict[str, Union[str, PicklePolicy]], None] = None,
+    conflicts: Conflicts = None,
 ) -> Union[Type[T], Callable[[Type[T], Dict[str, Union[Iterable[str], delegatee]]], Type[T]]]:
     """Decorator that adds class attributes/methods from `delegates` to `_cls` object as class properties.
 
@@ -20,16 +36,36 @@ def compclass(
 
             - key: Name of the class/instance attribute to which the delegate instance is assigned to.
             - value: Must be either a sequence/iterable of method names or a `delegatee` instance.
-                They represent the attributes/methods to forward.
-
-        verbose: Defines the level of verbosity when setting those forwarded methods.
-        log_func: Function to use for logging, if verbose is set to True.
+                They represent the attributes/methods to forward. If `_cls` inherits from composed classes, a value
+                overrides the inherited delegate with the same key (if it differs, otherwise inherited descriptors are
+                reused), while `None` removes it.
+
+        verbose: Whether to report the forwarded names, as a single INFO record of the `compclasses` logger per class.
+        log_func: Custom function to report the forwarded names with, if verbose is set to True.
+        compiled: Whether to forward methods of `delegatee` instances (with known `delegatee_cls`) using generated
+            functions, which are as fast as hand-written wrappers, instead of properties.
+        lazy: Whether to defer the creation of the forwarded attributes/methods to the first time each of them is
+            accessed from an instance (dunder methods are always injected eagerly). Pair it with `delegatee(...,
+            lazy=True)` to defer parsing and validation as well, and call `compclasses.finalize` to materialise
+            everything at once.
+        slots: Whether to store the delegates in `__slots__`. Since slots cannot be added to an existing class, a new
+            class is created, and instances of it have no `__dict__` (unless provided by a base class).
+        instrument: Whether to record call counts, cumulative wall time and exceptions of every forwarded name, see
+            `compclasses.stats`. Non-instrumented classes pay no overhead at all.
+        pickling: Mapping from delegate name to pickling policy (`"copy"`, `"share"` or a `PicklePolicy` instance,
+            such as `RebuildPolicy`). If provided, the class gets `__reduce_ex__` and `__setstate__` methods
+            serialising (or copying) each delegate according to its policy, see `install_pickling`.
+        conflicts: Policy for names forwarded by more than one delegate: `"error"`, `"first"`, `"last"`, a priority
+            list of delegate names, or `"dispatch"` to try every delegate in order. By default the last delegate wins
+            and collisions are reported by a WARNING record of the `compclasses` logger, as are forwarded names
+            replacing the ones defined in the class body (which raise with `"error"`).
 
     Raises:
-        ValueError: `delegates` param cannot be `None`.
+        ValueError: `delegates` param cannot be `None`, or a name conflict is found with `conflicts="error"`.
 
     Returns:
-        Class with added methods from delegates.
+        Class with added methods from delegates. The source of every forwarded name is recorded in its
+            `__compclass_spec__` index, see `compclasses.resolve` and `compclasses.delegated_names`.
 
     Usage:
 
@@ -62,9 +98,48 @@ def compclass(
         _cls: Type[T],
         delegates: Dict[str, Union[Iterable[str], delegatee]] = delegates,  # type: ignore
     ) -> Type[T]:
-        for _name, _to_inject in generate_properties(delegates, verbose, log_func):
+        generated, merged, replaced = diff_delegates(inherited_delegates(_cls.__bases__), delegates)
+        defined = tuple(_cls.__dict__)
+        cls_name = f"{_cls.__module__}.{_cls.__qualname__}"
+        policies = None if pickling is None else resolve_policies(_cls, merged, pickling)
+        check_conflicts(conflicts, merged)
+
+        delegatee_getters = None
+        if slots:
+            _cls = add_slots(_cls, generated.keys())
+            delegatee_getters = slot_getters(_cls, generated.keys())
+
+        # Every descriptor is generated (hence every delegate parsed and validated) before `_cls` is modified, so that
+        # an error leaves it untouched and other threads never observe a partially composed class.
+        # Descriptors are taken from the artifact of `python -m compclasses build`, if there is an up to date one.
+        # Names forwarded by several delegates are resolved by the conflict index, which prebuilt artifacts ignore.
+        body = tuple(name for name in defined if name not in _cls.__dict__.get(SPEC_ATTR, {}))  # e.g. composed twice
+        index = None if lazy else conflict_index(injections(generated), conflicts, body, cls_name)
+        prebuildable = not (lazy or slots or instrument or (index is not None and index.collisions))
+        namespace: Dict[str, Any] = {}
+        if prebuildable:
+            namespace = load_prebuilt(_cls.__module__, _cls.__qualname__, generated, compiled, verbose, log_func) or {}
+        if not (lazy or namespace):
+            namespace = dict(
+                generate_properties(
+                    generated, verbose, log_func, compiled, delegatee_getters, cls_name, instrument, index
+                )
+            )
+
+        install_holders(_cls, generated)
+        install_bound_cache(_cls, generated)
+        if lazy:
+            install_lazy(_cls, generated, verbose, log_func, compiled, delegatee_getters, instrument, conflicts, body)
+        for _name, _to_inject in namespace.items():
             setattr(_cls, _name, _to_inject)
 
+        record_delegation(_cls, generated, merged, replaced, defined, conflicts)
+        record_options(_cls, generated, Composition(compiled, instrument, conflicts, delegatee_getters))
+        if policies is not None:
+            install_pickling(_cls, policies)
+        if prebuildable:
+            record_prebuildable(_cls, generated, compiled)
+
         return _cls
 
     if _cls is None:
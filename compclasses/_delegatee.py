@@ -1,9 +1,10 @@
-import inspect
-import re
+from concurrent.futures import Executor
 from itertools import filterfalse, tee
-from typing import Callable, Iterable, Tuple, Type, TypeVar
+from typing import Any, Callable, FrozenSet, Generator, Iterable, Tuple, Type, TypeVar, Union
 
-from compclasses._logging import logger
+from compclasses._cache import attrs_cache, class_version, validation_cache
+from compclasses._discovery import discover_attrs
+from compclasses._protocols import check_protocols, protocol_dunders
 
 T = TypeVar("T")
 
@@ -45,13 +46,69 @@ class delegatee:
         validate: Whether or not to validate if `delegatee_cls` has all the methods and/or attributes.
 
             !!! warning
-                - Methods are searched in class definition `__dict__`.
-                - Attributes are searched in class `__init__` code by matching the following regex:
-                    `"self.{attr}"` (more technically, `re.compile(r"self.(\w+)")`).
+                - Methods are searched in class definition (and its parents).
+                - Attributes are searched among the instance attributes discovered by
+                    `compclasses._discovery.discover_attrs`, namely `self.<attr> = ...` assignments in the
+                    `__init__` bytecode (of the class and its parents), `__slots__`, dataclass fields and annotations.
+
+            !!! info
+                Both parsing and validation results are cached process-wide per `(delegatee_cls, attrs)`, see
+                `compclasses.clear_cache` and `compclasses.cache_info`.
+
+        lazy: Whether to defer parsing and validation of `attrs` to the first time they are needed (or to an explicit
+            `finalize()` call), instead of doing it at initialization time.
+        fanout: Whether the delegate attribute holds a collection of homogeneous delegates (e.g. a list of workers),
+            in which case `delegatee_cls` is the class of its members, and every forwarded name is forwarded to all of
+            them: methods calls and attributes values are collected in a tuple, while setting/deleting an attribute
+            applies to every member.
+        reduce: Callable applied to the tuple of results of fan-out calls/attributes (e.g. `sum`, `any`,
+            `lambda results: list(itertools.chain.from_iterable(results))`). Requires `fanout=True`.
+        executor: `concurrent.futures.Executor` (e.g. `ThreadPoolExecutor`, `ProcessPoolExecutor`) used to run fan-out
+            method calls concurrently, instead of sequentially. Requires `fanout=True`.
+        cache_bound: Whether to memoise the bound methods of the delegate in the `__dict__` of each composed instance,
+            so that repeated accesses (e.g. `obj.method(...)` in a hot loop) neither evaluate a descriptor nor allocate
+            a new bound method. Cached bound methods are dropped when the delegate attribute is reassigned or
+            deleted, see `compclasses._bound.BoundMethodCache`. Incompatible with `fanout=True` and `weak=True`, as
+            cached bound methods would keep the delegate alive.
+        readonly: Whether forwarded attributes can only be read: either a boolean applying to every attribute, or the
+            names (as in `attrs`, i.e. without prefix and suffix) of the read-only ones. Setting or deleting a read-only
+            attribute on the composed instance raises `AttributeError`, otherwise the write goes to the delegate.
+        protocols: Protocol groups whose dunder methods are forwarded as a whole, among `"container"`, `"sequence"`,
+            `"mapping"`, `"number"` (arithmetic, bitwise and conversion operators, including reflected ones),
+            `"inplace"` (in-place operators, replacing the delegate with the result), `"comparison"` (rich comparisons
+            and `__hash__`), `"context"` and `"callable"`. Only the dunder methods implemented by `delegatee_cls` (if
+            known) are forwarded, each one by a plain method calling the matching builtin or operator on the delegate
+            (e.g. `len(self._foo)`), see `compclasses._protocols.dunder_from_protocol`. If provided, `attrs` can be
+            empty. Incompatible with `fanout=True`.
+        weak: Whether the composed instance holds the delegate by weak reference (i.e. `self._foo = foo` stores
+            `weakref.ref(foo)`), so that it does not keep the delegate alive. Accessing the delegate (or any name
+            forwarded to it) once it has been garbage collected raises `ReferenceError`. Incompatible with
+            `cache_bound=True`.
+        lazy_factory: Callable building the delegate given the composed instance (e.g. `lambda self: Client(self.url)`),
+            called the first time the delegate is accessed, unless it has been set before. The result is stored on the
+            instance, and the factory is called once per instance also when accessed from several threads at once.
+            Incompatible with `weak=True`.
+
+            !!! info
+                Both `weak` and `lazy_factory` replace the delegate attribute with a descriptor (see
+                `compclasses._holders.DelegateHolder`), storing the delegate in the instance `__dict__`, hence they
+                are not supported by classes composed with `slots=True`.
+
+        flatten: Whether to forward names of a composed `delegatee_cls` to its innermost delegate directly, skipping
+            the forwarder of each intermediate class, see `compclasses._chain.flatten_chain`. Ignored with
+            `cache_bound=True` and by classes composed with `slots=True`.
+
+            !!! warning
+                The flattened path is computed from the delegation of `delegatee_cls` (and of the classes of its own
+                delegates), hence the delegate (and each intermediate delegate) must be an instance of exactly that
+                class at runtime: a subclass delegating a name differently, or overriding it, is bypassed.
 
     Methods:
+        - finalize: Parses and validates attrs, if not done already.
         - _parse_attrs: Parses the original attrs sequence, splitting between dunder and class methods.
         - _is_dunder_method: Assess whether or not an attribute is a dunder method.
+        - _is_writable: Assess whether or not a forwarded attribute can be set and deleted.
+        - _protocol_dunders: Returns the dunder methods forwarded by the protocol groups.
         - _validate_delegatee_methods: Checks if delegatee_cls has all attributes/methods in attrs.
     """
 
@@ -62,27 +119,132 @@ class delegatee:
         prefix: str = "",
         suffix: str = "",
         validate: bool = True,
+        lazy: bool = False,
+        fanout: bool = False,
+        reduce: Union[Callable[[Tuple[Any, ...]], Any], None] = None,
+        executor: Union[Executor, None] = None,
+        cache_bound: bool = False,
+        readonly: Union[bool, Iterable[str]] = False,
+        protocols: Iterable[str] = (),
+        weak: bool = False,
+        lazy_factory: Union[Callable[[Any], Any], None] = None,
+        flatten: bool = False,
     ):
-        if not attrs:  # empty iterable such as list(), tuple(), None, etc...
+        protocols = check_protocols(protocols)
+        if not attrs and not protocols:  # empty iterable such as list(), tuple(), None, etc...
             raise ValueError("attrs parameter cannot be None")
 
-        self.delegatee_cls = delegatee_cls
+        if not fanout and (reduce is not None or executor is not None):
+            raise ValueError("reduce and executor parameters require fanout=True")
 
-        if delegatee_cls is not None:
-            self._attrs = self._parse_attrs(delegatee_cls, attrs)
-        else:
-            self._attrs = tuple(attrs)
+        if fanout and (cache_bound or protocols):
+            raise ValueError("cache_bound and protocols parameters are not supported with fanout=True")
+
+        if weak and lazy_factory is not None:
+            raise ValueError("weak and lazy_factory parameters are mutually exclusive")
 
-        if validate and (delegatee_cls is not None):
-            self._validate_delegatee_methods(self.delegatee_cls, self._attrs)
+        if weak and cache_bound:
+            raise ValueError("weak and cache_bound parameters are mutually exclusive")
+
+        self.delegatee_cls = delegatee_cls
+        self._raw_attrs = tuple(attrs or ())
+        self._protocols = protocols
+        self._attrs: Union[Tuple[str, ...], None] = None
+        self._validate = validate
 
         self._prefix = prefix
         self._suffix = suffix
 
+        self._fanout = fanout
+        self._reduce = reduce
+        self._executor = executor
+        self._cache_bound = cache_bound
+        self._readonly: Union[bool, FrozenSet[str]] = readonly if isinstance(readonly, bool) else frozenset(readonly)
+        self._weak = weak
+        self._lazy_factory = lazy_factory
+        self._flatten = flatten
+
+        if not lazy:
+            self.finalize()
+
     def __iter__(self):
-        for attr_name in self._attrs:
+        for attr_name in self.finalize()._attrs:  # type: ignore
             yield attr_name
 
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """Returns the (hashable) specification which the code generated from this delegatee depends on."""
+        return (
+            self.delegatee_cls,
+            self.finalize()._attrs,
+            self._prefix,
+            self._suffix,
+            self._fanout,
+            self._reduce,
+            self._executor,
+            self._cache_bound,
+            self._readonly,
+            self._protocols,
+            self._weak,
+            self._lazy_factory,
+            self._flatten,
+        )
+
+    def finalize(self) -> "delegatee":
+        """Parses and (optionally) validates `attrs`, if not done already.
+
+        This is called at initialization time unless `lazy=True`, in which case it is deferred to the first time the
+        delegatee is iterated over (e.g. when the forwarded attributes are injected) or until explicitly called.
+
+        Returns:
+            The delegatee instance itself.
+
+        Raises:
+            AttributeError: if `validate=True` and `delegatee_cls` has no attribute/method in attrs.
+            ValueError: if any read-only name is not listed in attrs.
+        """
+        if self._attrs is not None:
+            return self
+
+        delegatee_cls, attrs = self.delegatee_cls, self._raw_attrs
+        version = class_version(delegatee_cls)
+
+        if delegatee_cls is not None:
+            parsed_attrs = attrs_cache.get_or_compute(
+                (delegatee_cls, version, attrs),
+                lambda: self._parse_attrs(delegatee_cls, attrs),
+            )
+        else:
+            parsed_attrs = attrs
+
+        # Protocol dunders are restricted to the implemented ones already (see `protocol_dunders`), hence not validated.
+        if self._validate and (delegatee_cls is not None):
+            validation_cache.get_or_compute(
+                (delegatee_cls, version, parsed_attrs),
+                lambda: self._validate_delegatee_methods(delegatee_cls, parsed_attrs) or True,
+            )
+
+        if self._protocols:
+            dunders = self._protocol_dunders()
+            parsed_attrs = (*dunders, *(attr_name for attr_name in parsed_attrs if attr_name not in dunders))
+
+        if not isinstance(self._readonly, bool):
+            unknown = self._readonly.difference(parsed_attrs)
+            if unknown:
+                raise ValueError(f"Read-only names {sorted(unknown)} are not listed in attrs")
+
+        self._attrs = parsed_attrs
+        return self
+
+    def _protocol_dunders(self) -> Tuple[str, ...]:
+        """Returns the dunder methods forwarded by the protocol groups, see `protocols` parameter."""
+        return protocol_dunders(self.delegatee_cls, self._protocols)
+
+    def _is_writable(self, attr_name: str) -> bool:
+        """Assesses whether or not the forwarded `attr_name` can be set and deleted, see `readonly` parameter."""
+        if isinstance(self._readonly, bool):
+            return not self._readonly
+        return attr_name not in self._readonly
+
     @staticmethod
     def _parse_attrs(delegatee_cls: Type, attrs: Iterable[str]) -> Tuple[str, ...]:
         """Parses the original attrs sequence:
@@ -95,20 +257,11 @@ class delegatee:
 
         dunder_methods, base_methods = partition(delegatee._is_dunder_method, attrs)
         if "*" in base_methods:
-            pattern = re.compile(r"self.(\w+)")
-
-            methods = tuple(
-                attr_name for attr_name in delegatee_cls.__dict__.keys() if not delegatee._is_dunder_method(attr_name)
+            all_methods = tuple(
+                attr_name
+                for attr_name in dict.fromkeys((*delegatee_cls.__dict__.keys(), *discover_attrs(delegatee_cls)))
+                if not delegatee._is_dunder_method(attr_name)
             )
-            try:
-                co_code = inspect.getsource(delegatee_cls.__init__)
-                init_attrs = tuple(pattern.findall(co_code))
-
-            except Exception as e:
-                logger.info(f"Unable to parse __init__ method of {delegatee_cls} due to: {e}")
-                init_attrs = tuple()
-
-            all_methods = methods + init_attrs
         else:
             all_methods = base_methods
         return dunder_methods + all_methods
@@ -130,18 +283,36 @@ class delegatee:
             AttributeError: if `delegatee_cls` has no attribute/method in attrs.
         """
 
-        cls_methods = tuple([a[0] for a in inspect.getmembers(delegatee_cls)])
-
-        try:
-            co_code = inspect.getsource(delegatee_cls.__init__)
-            pattern = re.compile(r"self.(\w+)")
-            init_attrs = tuple(pattern.findall(co_code))
-
-        except Exception as e:
-            logger.info(f"Unable to parse `__init__` method of {delegatee_cls} due to error: {e}")
-            init_attrs = tuple()
-
-        all_methods = cls_methods + init_attrs
+        all_methods = {*dir(delegatee_cls), *discover_attrs(delegatee_cls, mro=True)}
         for attr_name in attrs:
             if attr_name not in all_methods:
                 raise AttributeError(f"'{delegatee_cls}' has no attribute nor method '{attr_name}'")
+
+
+def _delegated_names(
+    delegatee_instance: Union[Iterable[str], delegatee],
+    attrs: Union[Iterable[str], None] = None,
+) -> Generator[Tuple[str, str], None, None]:
+    """Generates the (`new_attr_name`, `attr_name`) pairs of a single delegate, adding prefix and suffix (if any) to
+    non-dunder attributes of `delegatee` instances.
+
+    Arguments:
+        delegatee_instance: Iterable of attributes/methods names or `delegatee` instance.
+        attrs: Attributes/methods names to consider, by default all the ones of `delegatee_instance`.
+
+    Returns:
+        Generator of (`new_attr_name`, `attr_name`) pairs.
+    """
+    is_delegatee = isinstance(delegatee_instance, delegatee)
+
+    for attr_name in delegatee_instance if attrs is None else attrs:
+        if is_delegatee and not delegatee._is_dunder_method(attr_name):
+            pfx, sfx = (
+                delegatee_instance._prefix,  # type: ignore
+                delegatee_instance._suffix,  # type: ignore
+            )
+
+        else:
+            pfx, sfx = "", ""
+
+        yield f"{pfx}{attr_name}{sfx}", attr_name
@@ -0,0 +1,134 @@
+import dis
+import inspect
+from dataclasses import fields, is_dataclass
+from typing import Callable, Iterable, List, Tuple, Type
+
+from compclasses._cache import clear_cache, discovery_cache
+from compclasses._logging import logger
+
+Discoverer = Callable[[Type], Iterable[str]]
+
+
+def _is_self_load(instruction: dis.Instruction, self_name: str) -> bool:
+    """Assesses whether or not `instruction` pushes `self_name` (the first argument) on top of the stack.
+
+    Handles the different opcodes used across python versions, e.g. `LOAD_FAST`, `LOAD_FAST_CHECK`,
+    `LOAD_FAST_LOAD_FAST` (python 3.13+, whose argval is a tuple of names), `LOAD_FAST_BORROW` and `LOAD_DEREF` (if
+    `self` is referenced by a closure).
+    """
+    if not (instruction.opname.startswith("LOAD_FAST") or instruction.opname == "LOAD_DEREF"):
+        return False
+
+    argval = instruction.argval
+    return (argval[-1] if isinstance(argval, tuple) else argval) == self_name
+
+
+def init_attrs(cls: Type) -> Tuple[str, ...]:
+    """Discovers instance attributes assigned as `self.<attr> = ...` in `cls.__init__`.
+
+    Instead of reading the source code, we look for `STORE_ATTR` instructions on the first argument of
+    `cls.__init__.__code__`, therefore no I/O is involved, it works for classes without source code available
+    (zipapps, frozen builds, `.pyc`-only deploys) and it is not fooled by strings or comments.
+
+    Arguments:
+        cls: Class to inspect.
+
+    Returns:
+        Tuple of attributes names, empty if `cls.__init__` is not a python function (e.g. `object.__init__`).
+    """
+    code = getattr(inspect.unwrap(cls.__init__), "__code__", None)
+    if code is None or code.co_argcount == 0:
+        return tuple()
+
+    self_name = code.co_varnames[0]
+    attrs, previous = [], None
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == "STORE_ATTR" and previous is not None and _is_self_load(previous, self_name):
+            attrs.append(instruction.argval)
+        previous = instruction
+
+    return tuple(attrs)
+
+
+def slots_attrs(cls: Type) -> Tuple[str, ...]:
+    """Discovers instance attributes declared in `cls.__slots__`."""
+    slots = cls.__dict__.get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def dataclass_attrs(cls: Type) -> Tuple[str, ...]:
+    """Discovers instance attributes declared as dataclass fields, if `cls` is a dataclass."""
+    return tuple(f.name for f in fields(cls)) if is_dataclass(cls) else tuple()
+
+
+def annotations_attrs(cls: Type) -> Tuple[str, ...]:
+    """Discovers instance attributes declared as class level annotations (e.g. `attr: int`) of `cls`."""
+    return tuple(cls.__dict__.get("__annotations__", {}))
+
+
+_discoverers: List[Discoverer] = [init_attrs, slots_attrs, dataclass_attrs, annotations_attrs]
+
+
+def register_discoverer(discoverer: Discoverer) -> Discoverer:
+    """Registers an additional strategy to discover instance attributes of a class.
+
+    A discoverer is a callable that takes a class and returns an iterable of attribute names. It can be used as a
+    decorator. Registering a discoverer clears every compclasses cache, as previously discovered attributes may change.
+
+    Usage:
+
+    ```python
+    from compclasses import register_discoverer
+
+    @register_discoverer
+    def attrs_from_fields(cls):
+        return getattr(cls, "_fields", ())
+    ```
+
+    Arguments:
+        discoverer: Callable taking a class and returning an iterable of attribute names.
+
+    Returns:
+        The discoverer itself.
+    """
+    _discoverers.append(discoverer)
+    clear_cache()
+    return discoverer
+
+
+def _discover_attrs(cls: Type, mro: bool) -> Tuple[str, ...]:
+    """Non-cached implementation of `discover_attrs`."""
+    classes = [klass for klass in cls.__mro__ if klass is not object] if mro else [cls]
+    discoverers = tuple(_discoverers)  # snapshot, in case of concurrent `register_discoverer` calls
+
+    attrs: List[str] = []
+    for klass in classes:
+        for discoverer in discoverers:
+            try:
+                attrs.extend(discoverer(klass))
+            except Exception as e:
+                logger.info("Unable to discover attributes of %s using %s due to: %s", klass, discoverer.__name__, e)
+
+    return tuple(dict.fromkeys(attrs))
+
+
+def discover_attrs(cls: Type, mro: bool = False) -> Tuple[str, ...]:
+    """Discovers the instance attributes of `cls` by means of the registered discoverers, namely:
+
+    - `STORE_ATTR` instructions on `self` in `__init__` bytecode (see `init_attrs`);
+    - `__slots__` entries;
+    - dataclass fields;
+    - class level annotations;
+    - any discoverer added via `register_discoverer`.
+
+    The result is cached per `(cls, mro)`.
+
+    Arguments:
+        cls: Class to inspect.
+        mro: Whether to run the discoverers on every class in `cls.__mro__` (e.g. to find attributes assigned by a
+            parent `__init__` called via `super().__init__(...)`) or only on `cls` itself.
+
+    Returns:
+        Tuple of unique attributes names, in order of discovery.
+    """
+    return discovery_cache.get_or_compute((cls, mro), lambda: _discover_attrs(cls, mro))
@@ -0,0 +1,174 @@
+import asyncio
+import inspect
+from concurrent.futures import Executor
+from functools import partial, update_wrapper
+from operator import attrgetter, methodcaller
+from types import FunctionType, MethodDescriptorType, WrapperDescriptorType
+from typing import Any, Callable, Iterable, Tuple, Type, Union
+
+Reduce = Callable[[Tuple[Any, ...]], Any]
+
+_METHOD_TYPES = (FunctionType, MethodDescriptorType, WrapperDescriptorType, staticmethod, classmethod)
+
+
+def _is_method(delegatee_cls: Union[Type, None], attr_name: str) -> Union[bool, None]:
+    """Assesses whether or not `attr_name` is a method of `delegatee_cls`, `None` if `delegatee_cls` is unknown."""
+    if delegatee_cls is None:
+        return None
+    return isinstance(inspect.getattr_static(delegatee_cls, attr_name, None), _METHOD_TYPES)
+
+
+def fanout_call(
+    members: Iterable[Any],
+    attr_name: str,
+    reduce: Union[Reduce, None],
+    executor: Union[Executor, None],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Calls `attr_name(*args, **kwargs)` on every member, collecting the results in a tuple.
+
+    Arguments:
+        members: Collection of delegates.
+        attr_name: Method to call on each member.
+        reduce: Callable applied to the tuple of results, if provided (e.g. `sum`, `any`).
+        executor: If provided, calls are submitted to it (e.g. a `ThreadPoolExecutor` or `ProcessPoolExecutor`)
+            instead of being run sequentially. Results keep the members order.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        Tuple of results (or its reduction).
+    """
+    if executor is None:
+        results = tuple(getattr(member, attr_name)(*args, **kwargs) for member in members)
+    else:
+        results = tuple(executor.map(methodcaller(attr_name, *args, **kwargs), members))
+
+    return results if reduce is None else reduce(results)
+
+
+async def fanout_acall(
+    members: Iterable[Any],
+    attr_name: str,
+    reduce: Union[Reduce, None],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Awaits the coroutine method `attr_name(*args, **kwargs)` of every member concurrently, via `asyncio.gather`,
+    collecting the results in a tuple (reduced by `reduce`, if provided)."""
+    results = tuple(await asyncio.gather(*(getattr(member, attr_name)(*args, **kwargs) for member in members)))
+    return results if reduce is None else reduce(results)
+
+
+def property_from_fanout(
+    delegatee_cls_name: str,
+    attr_name: str,
+    new_attr_name: str,
+    delegatee_cls: Union[Type, None] = None,
+    reduce: Union[Reduce, None] = None,
+    executor: Union[Executor, None] = None,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+    writable: bool = True,
+) -> property:
+    """Defines a property called `new_attr_name` forwarding `attr_name` to every member of the collection stored in
+    `delegatee_cls_name`.
+
+    We define the property as follows:
+
+        - fget: if `attr_name` is a method, returns a callable which calls it on every member (see `fanout_call`),
+            otherwise returns the tuple of `member.attr_name` values. In both cases the tuple is passed to `reduce` (if
+            provided).
+        - fset: sets `member.attr_name` for every member (unless read-only).
+        - fdel: deletes `member.attr_name` for every member (unless read-only).
+
+    Arguments:
+        delegatee_cls_name: Name of the attribute holding the collection of delegates.
+        attr_name: Attribute/method of the members which we want to forward.
+        new_attr_name: Name of the new attribute to be created in the scope of the class.
+        delegatee_cls: Class of the members, if known it is used to detect methods upfront, otherwise `attr_name` is
+            treated as a method if it is callable on the first member.
+        reduce: Callable applied to the tuple of results, if provided.
+        executor: Executor used to run method calls concurrently, if provided.
+        delegatee_getter: Callable returning the collection given the composed instance, defaults to
+            `attrgetter(delegatee_cls_name)`.
+        writable: Whether the property has `fset` and `fdel`, otherwise setting or deleting it raises `AttributeError`.
+
+    Returns:
+        property: Property which will be injected in the class.
+    """
+    wrapped_delegatee = attrgetter(delegatee_cls_name) if delegatee_getter is None else delegatee_getter
+    is_method = _is_method(delegatee_cls, attr_name)
+    get_attr = attrgetter(attr_name)
+
+    def fget(self):
+        """Function to be used for getting an attribute value from every member."""
+        members = wrapped_delegatee(self)
+
+        if is_method or (is_method is None and members and callable(get_attr(next(iter(members))))):
+            return partial(fanout_call, members, attr_name, reduce, executor)
+
+        values = tuple(map(get_attr, members))
+        return values if reduce is None else reduce(values)
+
+    if not writable:
+        return property(fget=fget, doc=fget.__doc__)
+
+    def fset(self, value):
+        """Function to be used for setting an attribute value on every member."""
+        for member in wrapped_delegatee(self):
+            setattr(member, attr_name, value)
+
+    def fdel(self):
+        """Function to be used for deleting an attribute value from every member."""
+        for member in wrapped_delegatee(self):
+            delattr(member, attr_name)
+
+    return property(fget=fget, fset=fset, fdel=fdel, doc=fget.__doc__)
+
+
+def method_from_fanout(
+    delegatee_cls_name: str,
+    attr_name: str,
+    new_attr_name: str,
+    method: Callable,
+    reduce: Union[Reduce, None] = None,
+    executor: Union[Executor, None] = None,
+    delegatee_getter: Union[Callable[[Any], Any], None] = None,
+) -> Callable:
+    """Defines a function called `new_attr_name` which calls `attr_name` on every member of the collection stored in
+    `delegatee_cls_name`, see `fanout_call`.
+
+    If `method` is a coroutine function, the forwarder is a coroutine function awaiting all the members calls
+    concurrently via `asyncio.gather` (the executor, if any, is not used), see `fanout_acall`.
+
+    Arguments:
+        delegatee_cls_name: Name of the attribute holding the collection of delegates.
+        attr_name: Method of the members which we want to forward.
+        new_attr_name: Name of the new method to be created in the scope of the class.
+        method: The original method, as defined in the members class.
+        reduce: Callable applied to the tuple of results, if provided.
+        executor: Executor used to run calls concurrently, if provided.
+        delegatee_getter: Callable returning the collection given the composed instance, defaults to
+            `attrgetter(delegatee_cls_name)`.
+
+    Returns:
+        Function which will be injected in the class.
+    """
+    wrapped_delegatee = attrgetter(delegatee_cls_name) if delegatee_getter is None else delegatee_getter
+
+    if inspect.iscoroutinefunction(method):
+
+        async def forwarder(self, /, *args, **kwargs):
+            """Awaits the calls of the method on every member concurrently."""
+            return await fanout_acall(wrapped_delegatee(self), attr_name, reduce, *args, **kwargs)
+
+    else:
+
+        def forwarder(self, /, *args, **kwargs):
+            """Calls the method on every member."""
+            return fanout_call(wrapped_delegatee(self), attr_name, reduce, executor, *args, **kwargs)
+
+    update_wrapper(forwarder, method)
+    forwarder.__name__ = forwarder.__qualname__ = new_attr_name
+    return forwarder
@@ -0,0 +1,104 @@
+import weakref
+from threading import RLock
+from typing import Any, Callable, Dict, Iterable, Type, Union
+
+from compclasses._delegatee import delegatee
+
+# Locks guarding the first call of lazy factories, striped by instance so that building the delegates of different
+# instances rarely contends, without storing a lock per instance.
+_locks = tuple(RLock() for _ in range(64))
+
+
+class DelegateHolder:
+    """Data descriptor set on the composed class in place of the delegate attribute `name`, for delegates held by weak
+    reference (`weak=True`) or constructed on first access (`lazy_factory=...`).
+
+    The delegate is stored in the instance `__dict__` under `name`, either as it is or as a `weakref.ref`. Since every
+    forwarder reads the delegate via `getattr(instance, name)` (e.g. `attrgetter(name)`), they all go through the
+    holder, which dereferences the weak reference or builds the delegate (once per instance, also when several
+    threads access it concurrently) and stores it.
+
+    Arguments:
+        name: Name of the delegate attribute.
+        lazy_factory: Callable building the delegate given the composed instance, called the first time the delegate
+            is accessed (unless already set).
+        weak: Whether to hold the delegate by weak reference.
+    """
+
+    __slots__ = ("name", "lazy_factory", "weak")
+
+    def __init__(self, name: str, lazy_factory: Union[Callable[[Any], Any], None] = None, weak: bool = False):
+        self.name = name
+        self.lazy_factory = lazy_factory
+        self.weak = weak
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            if self.lazy_factory is None:
+                raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'") from None
+            return self._build(instance)
+
+        if self.weak:
+            value = value()
+            if value is None:
+                raise ReferenceError(
+                    f"Delegate '{self.name}' of '{type(instance).__name__}' object has been garbage collected"
+                )
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = weakref.ref(value) if self.weak else value
+
+    def __delete__(self, instance: Any) -> None:
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'") from None
+
+    def _build(self, instance: Any) -> Any:
+        """Calls the lazy factory and stores its result, unless another thread did it in the meantime."""
+        with _locks[(id(instance) >> 4) % len(_locks)]:
+            instance_dict = instance.__dict__
+            if self.name not in instance_dict:
+                instance_dict[self.name] = self.lazy_factory(instance)  # type: ignore
+            return instance_dict[self.name]
+
+
+def install_holders(cls: Type, delegates: Dict[str, Union[Iterable[str], delegatee]]) -> Type:
+    """Sets a `DelegateHolder` on `cls` for each delegate with `weak=True` or a `lazy_factory`.
+
+    It is a no-op if no delegate has such options, hence other classes pay no overhead at all.
+
+    Arguments:
+        cls: Composed class.
+        delegates: Key-value pair of delegates.
+
+    Returns:
+        The class itself.
+
+    Raises:
+        ValueError: if such a delegate name is not a plain identifier (e.g. `"_foo.bar"`), or if instances of `cls`
+            have no `__dict__` (e.g. composed with `slots=True`).
+    """
+    holders = {
+        name: DelegateHolder(name, value._lazy_factory, value._weak)
+        for name, value in delegates.items()
+        if isinstance(value, delegatee) and (value._weak or value._lazy_factory is not None)
+    }
+    if not holders:
+        return cls
+
+    invalid = [name for name in holders if not name.isidentifier()]
+    if invalid:
+        raise ValueError(f"weak and lazy_factory delegates must be plain attribute names, got {invalid}")
+    if not any("__dict__" in vars(klass) for klass in cls.__mro__):
+        raise ValueError("weak and lazy_factory delegates require instances with `__dict__`, not supported by slots")
+
+    for name, holder in holders.items():
+        setattr(cls, name, holder)
+    return cls
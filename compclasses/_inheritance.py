@@ -0,0 +1,137 @@
+from typing import Any, Dict, Iterable, Mapping, Tuple, Type, Union
+
+from compclasses._conflicts import Conflicts
+from compclasses._delegatee import delegatee
+from compclasses._spec import attach_spec, build_spec, inherited_spec
+
+DELEGATES_ATTR = "__compclass_delegates__"
+
+Delegates = Dict[str, Union[Iterable[str], delegatee]]
+
+
+class _Removed:
+    """Descriptor masking a name forwarded by a base class, whose delegation has been removed (or overridden) by a
+    subclass. It is a non-data descriptor, hence instance attributes with the same name are still accessible."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Union[Type, None] = None) -> Any:
+        owner_name = (owner or type(instance)).__name__
+        if instance is None:
+            raise AttributeError(f"type object '{owner_name}' has no attribute '{self.name}'")
+        raise AttributeError(f"'{owner_name}' object has no attribute '{self.name}'")
+
+
+def inherited_delegates(bases: Tuple[Type, ...]) -> Delegates:
+    """Returns the delegates of the composed classes among `bases` (and their ancestors), merged along the MRO, i.e.
+    delegates of former bases take precedence."""
+    merged: Delegates = {}
+    for base in reversed(bases):
+        merged.update(getattr(base, DELEGATES_ATTR, {}))
+    return merged
+
+
+def _is_same(left: Union[Iterable[str], delegatee], right: Union[Iterable[str], delegatee]) -> bool:
+    """Assesses whether or not two delegate specifications forward the same names in the same way."""
+    if left is right:
+        return True
+    if isinstance(left, delegatee) and isinstance(right, delegatee):
+        return left._cache_key() == right._cache_key()
+    if not isinstance(left, delegatee) and not isinstance(right, delegatee):
+        return tuple(left) == tuple(right)
+    return False
+
+
+def diff_delegates(
+    inherited: Delegates,
+    delegates: Mapping[str, Union[Iterable[str], delegatee, None]],
+) -> Tuple[Delegates, Delegates, Tuple[str, ...]]:
+    """Compares the delegates of a class with the ones it inherits.
+
+    Each delegate of the class either:
+
+    - extends the inherited ones, if its name is new;
+    - overrides the inherited one with the same name, if its specification differs;
+    - removes the inherited one with the same name, if it is `None`;
+    - is skipped, if it has the same specification as the inherited one, so that inherited descriptors are reused.
+
+    Plain iterables of names are read once, as tuples, hence they can be iterated again (e.g. by generators).
+
+    Arguments:
+        inherited: Delegates inherited from composed base classes, see `inherited_delegates`.
+        delegates: Delegates of the class.
+
+    Returns:
+        Tuple of (delegates to generate, merged delegates, names of the overridden or removed inherited delegates).
+
+    Raises:
+        ValueError: if a delegate to remove is not inherited.
+    """
+    delegates = {
+        name: value if value is None or isinstance(value, delegatee) else tuple(value)
+        for name, value in delegates.items()
+    }
+    to_generate: Delegates = {}
+    replaced = []
+    for name, value in delegates.items():
+        if value is None:
+            if name not in inherited:
+                raise ValueError(f"Cannot remove delegate '{name}', which is not inherited from any base class")
+            replaced.append(name)
+        elif name not in inherited or not _is_same(inherited[name], value):
+            to_generate[name] = value
+            if name in inherited:
+                replaced.append(name)
+
+    merged = {name: value for name, value in {**inherited, **delegates}.items() if value is not None}
+    return to_generate, merged, tuple(replaced)  # type: ignore
+
+
+def mask_replaced(cls: Type, replaced: Tuple[str, ...], keep: Iterable[str]) -> None:
+    """Masks the names forwarded by base classes from delegates in `replaced`, unless listed in `keep`.
+
+    Dunder methods are set to `None`, which is the convention to mark an operation as not available (e.g.
+    `len(obj)` raises `TypeError`), every other name is set to a descriptor raising `AttributeError`.
+
+    Arguments:
+        cls: Composed class.
+        replaced: Names of the overridden or removed inherited delegates.
+        keep: Names to not mask, namely the ones forwarded by `cls` itself or defined in its body.
+    """
+    keep = set(keep)
+    for name, delegation in inherited_spec(cls).items():
+        if delegation.delegatee_name in replaced and name not in keep:
+            setattr(cls, name, None if delegation.kind == "dunder" else _Removed(name))
+
+
+def record_delegation(
+    cls: Type,
+    generated: Delegates,
+    merged: Delegates,
+    replaced: Tuple[str, ...],
+    defined: Iterable[str],
+    conflicts: Conflicts = None,
+) -> Type:
+    """Records the delegation metadata of a composed class, namely its spec index (see `attach_spec`) and its merged
+    delegates (inherited by subclasses), masking the names of overridden or removed inherited delegates.
+
+    Arguments:
+        cls: Composed class.
+        generated: Delegates whose descriptors have been generated for `cls`, see `diff_delegates`.
+        merged: Inherited delegates merged with the ones of `cls`.
+        replaced: Names of the overridden or removed inherited delegates.
+        defined: Names defined in the body of `cls`, which are never masked.
+        conflicts: Policy resolving names forwarded by several delegates, see `compclasses._spec.build_spec`.
+
+    Returns:
+        The class itself.
+    """
+    attach_spec(cls, generated, replaced, conflicts)
+    setattr(cls, DELEGATES_ATTR, merged)
+
+    if replaced:
+        mask_replaced(cls, replaced, keep=(*build_spec(generated), *defined))
+    return cls
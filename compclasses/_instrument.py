@@ -0,0 +1,227 @@
+import inspect
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from compclasses._attribute import ClassLevelAttribute, DelegatedAttribute
+from compclasses._bound import BoundMethodCache
+
+# (composed class, delegate name, attribute name, operation)
+StatsKey = Tuple[str, str, str, str]
+
+# Attribute set on instrumented forwarders, see `is_instrumented`.
+INSTRUMENTED_ATTR = "__compclass_instrumented__"
+
+
+class CallStats(NamedTuple):
+    """Statistics of a single forwarded name and operation (`"get"`, `"set"`, `"delete"` or `"call"`)."""
+
+    calls: int
+    seconds: float
+    errors: int
+
+
+class _Record:
+    """Mutable counters updated by instrumented forwarders, guarded by their own lock so that concurrent calls (also on
+    free-threaded builds) never lose an update, while calls to different forwarded names do not contend."""
+
+    __slots__ = ("calls", "seconds", "errors", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.errors = 0
+        self._lock = Lock()
+
+    def add(self, seconds: float, failed: bool) -> None:
+        """Records a call which took `seconds` and possibly raised."""
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+            self.errors += failed
+
+    def snapshot(self) -> CallStats:
+        """Returns the current counters."""
+        with self._lock:
+            return CallStats(self.calls, self.seconds, self.errors)
+
+    def reset(self) -> None:
+        """Sets every counter to zero."""
+        with self._lock:
+            self.calls, self.seconds, self.errors = 0, 0.0, 0
+
+
+class Stats(Dict[StatsKey, CallStats]):
+    """Snapshot of the forwarded calls statistics, keyed by (composed class, delegate, attribute, operation)."""
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as nested dictionaries: class -> delegate -> attribute -> operation -> stats."""
+        result: Dict[str, Any] = {}
+        for (cls_name, delegatee_name, attr_name, op), call_stats in self.items():
+            result.setdefault(cls_name, {}).setdefault(delegatee_name, {}).setdefault(attr_name, {})[op] = (
+                call_stats._asdict()
+            )
+        return result
+
+    def to_prometheus(self, prefix: str = "compclasses_forwarded") -> str:
+        """Returns the statistics in the Prometheus text exposition format, e.g.:
+
+        ```
+        # TYPE compclasses_forwarded_calls_total counter
+        compclasses_forwarded_calls_total{cls="mod.Baz",delegate="_foo",attr="get_foo",op="call"} 3
+        ```
+
+        Arguments:
+            prefix: Prefix of the metrics names.
+        """
+        metrics = (
+            ("calls_total", "Number of forwarded calls.", "calls"),
+            ("seconds_total", "Cumulative wall time spent in forwarded calls.", "seconds"),
+            ("errors_total", "Number of forwarded calls which raised an exception.", "errors"),
+        )
+
+        lines: List[str] = []
+        for suffix, help_text, field in metrics:
+            name = f"{prefix}_{suffix}"
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} counter"))
+            for (cls_name, delegatee_name, attr_name, op), call_stats in sorted(self.items()):
+                labels = f'cls="{cls_name}",delegate="{delegatee_name}",attr="{attr_name}",op="{op}"'
+                lines.append(f"{name}{{{labels}}} {getattr(call_stats, field)}")
+
+        return "\n".join(lines) + "\n"
+
+
+_records: Dict[StatsKey, _Record] = {}
+_lock = Lock()
+
+
+def _get_record(key: StatsKey) -> _Record:
+    """Returns the counters of `key`, creating them if missing."""
+    with _lock:
+        return _records.setdefault(key, _Record())
+
+
+def stats() -> Stats:
+    """Returns a snapshot of the statistics of forwarded names of classes composed with `instrument=True`.
+
+    Usage:
+
+    ```python
+    import compclasses
+
+    compclasses.stats().as_dict()  # {"mod.Baz": {"_foo": {"get_foo": {"call": {"calls": 3, ...}}}}}
+    compclasses.stats().to_prometheus()
+    ```
+
+    Returns:
+        Mapping from (composed class, delegate, attribute, operation) to `CallStats(calls, seconds, errors)`.
+    """
+    with _lock:
+        return Stats({key: record.snapshot() for key, record in _records.items()})
+
+
+def reset_stats() -> None:
+    """Resets every counter of instrumented forwarders to zero."""
+    with _lock:
+        for record in _records.values():
+            record.reset()
+
+
+def _timed(func: Callable, record: _Record) -> Callable:
+    """Wraps `func` so that each call updates `record` (coroutine functions are timed until awaited)."""
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """Awaits `func`, recording the elapsed time and whether it raised."""
+            start, failed = perf_counter(), False
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                record.add(perf_counter() - start, failed)
+
+        setattr(async_wrapper, INSTRUMENTED_ATTR, True)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        """Calls `func`, recording the elapsed time and whether it raised."""
+        start, failed = perf_counter(), False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            record.add(perf_counter() - start, failed)
+
+    setattr(wrapper, INSTRUMENTED_ATTR, True)
+    return wrapper
+
+
+def instrument_descriptor(
+    descriptor: Any,
+    cls_name: str,
+    delegatee_name: str,
+    attr_name: str,
+) -> Any:
+    """Returns a copy of `descriptor` recording call counts, cumulative wall time and exceptions.
+
+    Properties (and `DelegatedAttribute` descriptors, converted to properties) have their `fget`, `fset` and `fdel`
+    wrapped (recorded as `"get"`, `"set"` and `"delete"` operations), while functions (see `method_from_delegator`)
+    and cached bound methods (see `BoundMethodCache`) are wrapped as a whole (recorded as `"call"`). Class level
+    descriptors (see `ClassLevelAttribute`) have both their instance forwarder and, if callable, their class value
+    (e.g. a staticmethod called from the composed class) instrumented. Remark that, for methods forwarded by a
+    descriptor, only the attribute access is measured: use `compiled=True` to measure the calls.
+
+    Instrumentation is opt-in per composed class: non-instrumented classes use the original descriptors, hence they
+    pay no overhead at all.
+
+    Arguments:
+        descriptor: Forwarding property or function.
+        cls_name: Qualified name of the composed class.
+        delegatee_name: Name of the delegate.
+        attr_name: Name of the forwarded attribute/method.
+
+    Returns:
+        Instrumented property or function.
+    """
+    if isinstance(descriptor, BoundMethodCache):
+        record = _get_record((cls_name, delegatee_name, attr_name, "call"))
+        return descriptor.wrapped(lambda bound: _timed(bound, record))
+    if isinstance(descriptor, ClassLevelAttribute):
+        class_value = descriptor.class_value
+        if callable(class_value):
+            class_value = _timed(class_value, _get_record((cls_name, delegatee_name, attr_name, "call")))
+        return ClassLevelAttribute(
+            class_value, instrument_descriptor(descriptor.forward, cls_name, delegatee_name, attr_name)
+        )
+    if isinstance(descriptor, DelegatedAttribute):
+        descriptor = descriptor.as_property()
+    if not callable(descriptor) and not isinstance(descriptor, property):  # class level constant
+        return descriptor
+    if isinstance(descriptor, property):
+        fget, fset, fdel = (
+            None if func is None else _timed(func, _get_record((cls_name, delegatee_name, attr_name, op)))
+            for func, op in ((descriptor.fget, "get"), (descriptor.fset, "set"), (descriptor.fdel, "delete"))
+        )
+        return property(fget=fget, fset=fset, fdel=fdel, doc=descriptor.__doc__)
+
+    return _timed(descriptor, _get_record((cls_name, delegatee_name, attr_name, "call")))
+
+
+def is_instrumented(descriptor: Any) -> bool:
+    """Assesses whether or not `descriptor` has been returned by `instrument_descriptor` (for any operation)."""
+    if isinstance(descriptor, BoundMethodCache):
+        return descriptor._wrapper is not None
+    if isinstance(descriptor, ClassLevelAttribute):
+        return is_instrumented(descriptor.forward)
+    if isinstance(descriptor, property):
+        return any(
+            getattr(func, INSTRUMENTED_ATTR, False) for func in (descriptor.fget, descriptor.fset, descriptor.fdel)
+        )
+    return getattr(getattr(descriptor, "__func__", descriptor), INSTRUMENTED_ATTR, False)
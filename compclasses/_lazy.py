@@ -0,0 +1,326 @@
+from threading import RLock
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
+
+from compclasses._conflicts import Conflicts, Dispatcher, conflict_index, resolve_descriptors
+from compclasses._core import _make_descriptor
+from compclasses._delegatee import _delegated_names, delegatee, partition
+from compclasses._instrument import instrument_descriptor
+from compclasses._logging import Injection, is_reporting, log_injection
+
+LAZY_SPEC_ATTR = "__compclass_lazy__"
+LAZY_HOOKS = ("__getattr__", "__setattr__", "__delattr__")
+
+
+def bind(descriptor: Any, instance: Any, owner: Type) -> Any:
+    """Returns `descriptor` as accessed from `instance` (or from `owner`, if `instance` is `None`), i.e. the result of
+    its `__get__` if it is a descriptor, otherwise the object itself (e.g. a class level constant)."""
+    get = getattr(type(descriptor), "__get__", None)
+    return descriptor if get is None else get(descriptor, instance, owner)
+
+
+class _LazySpec:
+    """Delegation specification of a class composed with `lazy=True`.
+
+    It records the delegates at class creation time and materialises the forwarding descriptors on demand.
+
+    Arguments:
+        owner: The composed class.
+        delegates: Key-value pair of delegates.
+        verbose: Whether to report the injected names, once per batch of materialised names.
+        log_func: Custom function used to report, see `generate_properties`.
+        compiled: Whether to generate plain forwarding functions for methods, see `generate_properties`.
+        delegatee_getters: Custom callables returning each delegate given the composed instance, see
+            `generate_properties`.
+        instrument: Whether to record calls statistics of every forwarded name, see `generate_properties`.
+        conflicts: Policy resolving names forwarded by several delegates, see `compclasses._conflicts.conflict_index`.
+        defined: Names defined in the body of the owner class, which only dunder methods shadow.
+    """
+
+    def __init__(
+        self,
+        owner: Type,
+        delegates: Dict[str, Union[Iterable[str], delegatee]],
+        verbose: bool,
+        log_func: Union[Callable[[str], None], None],
+        compiled: bool,
+        delegatee_getters: Union[Dict[str, Callable[[Any], Any]], None] = None,
+        instrument: bool = False,
+        conflicts: Conflicts = None,
+        defined: Iterable[str] = (),
+    ):
+        self.owner = owner
+        self.delegates = {
+            name: value if isinstance(value, delegatee) else tuple(value) for name, value in delegates.items()
+        }
+        self.verbose = verbose
+        self.log_func = log_func
+        self.compiled = compiled
+        self.delegatee_getters = delegatee_getters or {}
+        self.instrument = instrument
+        self.conflicts = conflicts
+        self.defined = tuple(defined)
+        self.cls_name = f"{owner.__module__}.{owner.__qualname__}"
+
+        # Hooks defined by the owner class itself, restored once every name is materialised.
+        self.own_hooks = {hook: owner.__dict__[hook] for hook in LAZY_HOOKS if hook in owner.__dict__}
+
+        # new_attr_name -> (delegatee_name, attr_name), resolved on first miss.
+        self._pending: Union[Dict[str, Tuple[str, str]], None] = None
+        # new_attr_name -> (delegatee_name, attr_name) pairs, for names dispatched to several delegates.
+        self._dispatched: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        # new_attr_name -> installed descriptor, recorded before the name is removed from `_pending`.
+        self._installed: Dict[str, Any] = {}
+        self._lock = RLock()
+
+    def _install(
+        self,
+        new_attr_name: str,
+        delegatee_name: str,
+        attr_name: str,
+    ) -> Any:
+        """Creates the forwarding descriptor of `new_attr_name` and sets it on the owner class."""
+        pairs = self._dispatched.get(new_attr_name)
+        descriptor = (
+            self._descriptor(new_attr_name, delegatee_name, attr_name)
+            if pairs is None
+            else Dispatcher(new_attr_name, tuple(self._descriptor(new_attr_name, *pair) for pair in pairs), pairs)
+        )
+        setattr(self.owner, new_attr_name, descriptor)
+        self._installed[new_attr_name] = descriptor
+        return descriptor
+
+    def _installed_descriptor(self, name: str) -> Any:
+        """Returns the descriptor of `name` installed by `_install`, or `None` if it has since been replaced."""
+        descriptor = self._installed.get(name)
+        return descriptor if descriptor is not None and self.owner.__dict__.get(name) is descriptor else None
+
+    def _descriptor(
+        self,
+        new_attr_name: str,
+        delegatee_name: str,
+        attr_name: str,
+    ) -> Any:
+        """Creates the forwarding descriptor of `new_attr_name`."""
+        descriptor = _make_descriptor(
+            delegatee_name,
+            self.delegates[delegatee_name],
+            attr_name,
+            new_attr_name,
+            self.compiled,
+            self.delegatee_getters.get(delegatee_name),
+        )
+        if self.instrument:
+            descriptor = instrument_descriptor(descriptor, self.cls_name, delegatee_name, attr_name)
+        return descriptor
+
+    def _report(self, injected: List[Injection]) -> None:
+        """Reports a batch of installed names, see `log_injection`."""
+        if is_reporting(self.verbose, self.log_func):
+            log_injection(self.cls_name, injected, self.log_func)
+
+    def install_dunders(self) -> None:
+        """Eagerly installs explicitly listed dunder methods.
+
+        Dunder methods are looked up on the type by the interpreter (e.g. `len(obj)`), bypassing `__getattr__`, hence
+        they cannot be materialised lazily. Since `"*"` never includes them, they are known without parsing `attrs`
+        (together with the ones of the protocol groups, if any).
+
+        Every dunder descriptor is created before any is set, hence an error leaves the owner class untouched.
+        """
+        dunder_injections = []
+        for delegatee_name, delegatee_instance in self.delegates.items():
+            is_delegatee = isinstance(delegatee_instance, delegatee)
+            raw_attrs = (
+                (*delegatee_instance._protocol_dunders(), *delegatee_instance._raw_attrs)  # type: ignore
+                if is_delegatee
+                else delegatee_instance
+            )
+            dunders, _ = partition(delegatee._is_dunder_method, dict.fromkeys(raw_attrs))
+
+            dunder_injections.extend(
+                (new_attr_name, delegatee_name, attr_name)
+                for new_attr_name, attr_name in _delegated_names(delegatee_instance, dunders)
+            )
+
+        # Names which are not dunders are materialised only if missing, hence they never shadow the owner ones.
+        index = conflict_index(dunder_injections, self.conflicts, self.defined, self.cls_name)
+        descriptors, injected = {}, []
+        generated = (
+            (new_attr_name, delegatee_name, attr_name, self._descriptor(new_attr_name, delegatee_name, attr_name))
+            for new_attr_name, delegatee_name, attr_name in dunder_injections
+        )
+        for new_attr_name, delegatee_name, attr_name, descriptor in resolve_descriptors(generated, index):
+            descriptors[new_attr_name] = descriptor
+            injected.append((new_attr_name, delegatee_name, attr_name))
+
+        for new_attr_name, descriptor in descriptors.items():
+            setattr(self.owner, new_attr_name, descriptor)
+        self._report(injected)
+
+    def _resolve(self) -> Dict[str, Tuple[str, str]]:
+        """Parses and validates every delegate (once), returning the not yet installed names."""
+        if self._pending is None:
+            pending = [
+                (new_attr_name, delegatee_name, attr_name)
+                for delegatee_name, delegatee_instance in self.delegates.items()
+                for new_attr_name, attr_name in _delegated_names(delegatee_instance)
+                if not delegatee._is_dunder_method(attr_name)
+            ]
+            index = conflict_index(pending, self.conflicts, cls_name=self.cls_name)
+            self._dispatched = {name: pairs for name, pairs in index.sources.items() if len(pairs) > 1}
+            self._pending = {
+                new_attr_name: (delegatee_name, attr_name) for new_attr_name, delegatee_name, attr_name in pending
+            }
+            self._pending.update((name, pairs[0]) for name, pairs in index.sources.items())
+        return self._pending
+
+    def materialize(self, name: str) -> Any:
+        """Installs and returns the forwarding descriptor of `name`, or `None` if `name` is not a forwarded name.
+
+        A name is removed from the pending ones only after its descriptor is installed, and a materialised name keeps
+        resolving to its installed descriptor, hence a lookup which missed it while another thread was installing it
+        does not fail. As a consequence, a materialised descriptor raising `AttributeError` is called twice per access
+        (once by the lookup, once by `__getattr__`) until the owner class is finalized.
+
+        Arguments:
+            name: Name of the attribute looked up on the owner class (or its instances).
+        """
+        if delegatee._is_dunder_method(name):
+            return None
+        if self._pending is not None and name not in self._pending:
+            return self._installed_descriptor(name)
+
+        with self._lock:
+            pending = self._resolve()
+            target = pending.get(name)
+            if target is None:
+                return self._installed_descriptor(name)
+
+            descriptor = self._install(name, *target)
+            del pending[name]
+            self._report([(name, *target)])
+            return descriptor
+
+    def materialize_all(self) -> None:
+        """Installs every pending descriptor and restores the hooks the owner class had before."""
+        with self._lock:
+            pending, injected = self._resolve(), []
+            for name, target in tuple(pending.items()):
+                self._install(name, *target)
+                del pending[name]
+                injected.append((name, *target))
+            self._report(injected)
+
+            for hook in LAZY_HOOKS:
+                if hook in self.own_hooks:
+                    setattr(self.owner, hook, self.own_hooks[hook])
+                elif hook in self.owner.__dict__:
+                    delattr(self.owner, hook)
+
+            if LAZY_SPEC_ATTR in self.owner.__dict__:
+                delattr(self.owner, LAZY_SPEC_ATTR)
+
+
+def install_lazy(
+    cls: Type,
+    delegates: Dict[str, Union[Iterable[str], delegatee]],
+    verbose: bool,
+    log_func: Union[Callable[[str], None], None],
+    compiled: bool,
+    delegatee_getters: Union[Dict[str, Callable[[Any], Any]], None] = None,
+    instrument: bool = False,
+    conflicts: Conflicts = None,
+    defined: Iterable[str] = (),
+) -> Type:
+    """Records the delegation specification on `cls` and installs `__getattr__`, `__setattr__` and `__delattr__` hooks
+    which materialise each forwarding descriptor the first time it is accessed from an instance.
+
+    The hooks fall back to the ones `cls` had before (either defined or inherited), and are removed once every
+    forwarded name is materialised by `finalize`.
+
+    Arguments:
+        cls: Class to which attributes/methods should be forwarded to.
+        delegates: Key-value pair of delegates.
+        verbose: Whether to report the injected names, once per batch of materialised names.
+        log_func: Custom function used to report, see `generate_properties`.
+        compiled: Whether to generate plain forwarding functions for methods, see `generate_properties`.
+        delegatee_getters: Custom callables returning each delegate given the composed instance, see
+            `generate_properties`.
+        instrument: Whether to record calls statistics of every forwarded name, see `generate_properties`.
+        conflicts: Policy resolving names forwarded by several delegates, see `compclasses._conflicts.conflict_index`.
+        defined: Names defined in the body of `cls`.
+
+    Returns:
+        The class itself.
+    """
+    # Looked up in the class MRO only: `getattr(cls, "__getattr__")` could find the one of the metaclass instead.
+    getattr_fallback = next(
+        (klass.__dict__["__getattr__"] for klass in cls.__mro__ if "__getattr__" in klass.__dict__), None
+    )
+    setattr_fallback = cls.__setattr__
+    delattr_fallback = cls.__delattr__
+    spec = _LazySpec(cls, delegates, verbose, log_func, compiled, delegatee_getters, instrument, conflicts, defined)
+
+    def __getattr__(self, name: str) -> Any:
+        descriptor = spec.materialize(name)
+        if descriptor is not None:
+            return bind(descriptor, self, type(self))
+        if getattr_fallback is not None:
+            return getattr_fallback(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in spec.delegates:  # e.g. `self._foo = foo` in `__init__` does not trigger parsing
+            spec.materialize(name)
+        setattr_fallback(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name not in spec.delegates:
+            spec.materialize(name)
+        delattr_fallback(self, name)
+
+    spec.install_dunders()  # first, as it is the only step which can fail
+    setattr(cls, LAZY_SPEC_ATTR, spec)
+    for hook in (__getattr__, __setattr__, __delattr__):
+        setattr(cls, hook.__name__, hook)
+    return cls
+
+
+def materialize(cls: Type, name: str) -> Any:
+    """Materialises `name` on the first class in `cls.__mro__` composed with `lazy=True` which forwards it.
+
+    Arguments:
+        cls: Composed class (or subclass of it).
+        name: Name of the attribute to materialise.
+
+    Returns:
+        The installed descriptor, or `None` if `name` is not a pending forwarded attribute.
+    """
+    for klass in cls.__mro__:
+        spec = klass.__dict__.get(LAZY_SPEC_ATTR)
+        descriptor = spec.materialize(name) if spec is not None else None
+        if descriptor is not None:
+            return descriptor
+    return None
+
+
+def finalize(cls: Type) -> Type:
+    """Materialises every forwarded attribute/method of a class composed with `lazy=True`, validating its delegates.
+
+    After finalization the class is indistinguishable from one composed eagerly. It is a no-op for classes which are
+    not lazy (or already finalized).
+
+    Arguments:
+        cls: Composed class.
+
+    Returns:
+        The class itself.
+
+    Raises:
+        AttributeError: if any `delegatee` with `validate=True` has no attribute/method listed in its attrs.
+    """
+    for klass in reversed(cls.__mro__):
+        spec = klass.__dict__.get(LAZY_SPEC_ATTR)
+        if spec is not None:
+            spec.materialize_all()
+    return cls
@@ -1,5 +1,45 @@
 import logging
+from typing import Callable, Sequence, Tuple, Union
 
-# Define and configure logger
-logging.basicConfig(format="%(message)s", level=logging.INFO)
-logger = logging.getLogger()
+# Library logger: it is not configured here, records are emitted only if the application configures logging.
+logger = logging.getLogger("compclasses")
+logger.addHandler(logging.NullHandler())
+
+# (new_attr_name, delegatee_name, attr_name)
+Injection = Tuple[str, str, str]
+
+
+def is_reporting(verbose: bool, log_func: Union[Callable[[str], None], None]) -> bool:
+    """Assesses whether or not injected names should be collected and reported, namely if `verbose` is set and either
+    a custom `log_func` is provided or the `compclasses` logger is enabled for INFO records."""
+    return verbose and (log_func is not None or logger.isEnabledFor(logging.INFO))
+
+
+def log_injection(
+    cls_name: str,
+    injected: Sequence[Injection],
+    log_func: Union[Callable[[str], None], None] = None,
+) -> None:
+    """Reports the names injected into a composed class as a single record.
+
+    By default, an INFO record is emitted by the `compclasses` logger with the structured event attached to it via
+    `extra`, namely `record.compclass` (name of the composed class) and `record.injected` (mapping from each injected
+    name to its `"delegatee_name.attr_name"` source), so that log handlers and formatters can consume it without
+    parsing the message. If a custom `log_func` is provided, it is called with the formatted message instead.
+
+    Arguments:
+        cls_name: Name of the composed class.
+        injected: Sequence of (`new_attr_name`, `delegatee_name`, `attr_name`) triplets.
+        log_func: Custom function to log the message with, if any.
+    """
+    if not injected:
+        return
+
+    sources = {new_attr_name: f"{delegatee_name}.{attr_name}" for new_attr_name, delegatee_name, attr_name in injected}
+    message = "%s: setting %s"
+    names = ", ".join(f"{new_attr_name} from {source}" for new_attr_name, source in sources.items())
+
+    if log_func is not None:
+        log_func(message % (cls_name, names))
+    else:
+        logger.info(message, cls_name, names, extra={"compclass": cls_name, "injected": sources})
@@ -3,9 +3,17 @@ from __future__ import annotations
 from abc import ABCMeta
 from typing import Any, Callable, Dict, Iterable, Tuple, Type, Union
 
+from compclasses._aot import load_prebuilt, record_prebuildable
+from compclasses._bound import install_bound_cache
+from compclasses._conflicts import Conflicts, check_conflicts, conflict_index, injections
 from compclasses._core import generate_properties
 from compclasses._delegatee import delegatee
-from compclasses._logging import logger
+from compclasses._holders import install_holders
+from compclasses._inheritance import diff_delegates, inherited_delegates, record_delegation
+from compclasses._lazy import bind, install_lazy, materialize
+from compclasses._pickling import PicklePolicy, install_pickling, resolve_policies
+from compclasses._slots import merge_slots, slot_getters
+from compclasses._swap import Composition, record_options
 
 
 class CompclassMeta(ABCMeta):
@@ -31,6 +39,17 @@ class CompclassMeta(ABCMeta):
     bar.a  # -> 1 (instead of bar._foo.a)
     len(bar)  # -> 42 (instead of len(bar._foo))
     ```
+
+    Subclasses inherit the delegates of their composed base classes, and only generate the descriptors of the
+    delegates they add or override:
+
+    ```python
+    class Baz(Bar, delegates={"_qux": ("b",)}):  # forwards a, __len__ (inherited) and b
+        ...
+
+    class Qux(Bar, delegates={"_foo": None}):  # forwards nothing, a and len() are not available anymore
+        ...
+    ```
     """
 
     def __new__(
@@ -38,9 +57,15 @@ class CompclassMeta(ABCMeta):
         clsname: str,
         bases: Tuple[Type, ...],
         attrs: Dict[str, Any],
-        delegates: Dict[str, Union[Iterable[str], delegatee]],
-        verbose: bool = True,
-        log_func: Callable[[str], None] = logger.info,
+        delegates: Union[Dict[str, Union[Iterable[str], delegatee, None]], None] = None,
+        verbose: bool = False,
+        log_func: Union[Callable[[str], None], None] = None,
+        compiled: bool = False,
+        lazy: bool = False,
+        slots: bool = False,
+        instrument: bool = False,
+        pickling: Union[Dict[str, Union[str, PicklePolicy]], None] = None,
+        conflicts: Conflicts = None,
     ) -> CompclassMeta:
         """
         Arguments:
@@ -48,17 +73,100 @@ class CompclassMeta(ABCMeta):
             clsname: Class name
             bases: Base classes
             attrs: Class attributes
-            delegates: Key-value pair of delegates.
+            delegates: Key-value pair of delegates, merged with the ones inherited from composed base classes (it can
+                be omitted if there are any).
 
                 - key: Name of the class/instance attribute to which the delegate instance is assigned to.
                 - value: Must be either a sequence/iterable of method names or a `delegatee` instance.
-                    They represent the attributes/methods to forward.
+                    They represent the attributes/methods to forward. A value overrides the inherited delegate with
+                    the same key (if it differs, otherwise inherited descriptors are reused), while `None` removes it.
 
-            verbose: Defines the level of verbosity when setting those forwarded methods.
-            log_func: Function to use for logging, if verbose is set to True.
+            verbose: Whether to report the forwarded names, as a single INFO record of the `compclasses` logger per
+                class.
+            log_func: Custom function to report the forwarded names with, if verbose is set to True.
+            compiled: Whether to forward methods of `delegatee` instances (with known `delegatee_cls`) using generated
+                functions, which are as fast as hand-written wrappers, instead of properties.
+            lazy: Whether to defer the creation of the forwarded attributes/methods to the first time each of them is
+                accessed, from the class or from an instance (dunder methods are always injected eagerly).
+            slots: Whether to add the delegates names to the class `__slots__`, in which case the forwarded
+                attributes read the delegates directly through the slots member descriptors.
+            instrument: Whether to record call counts, cumulative wall time and exceptions of every forwarded name,
+                see `compclasses.stats`. Non-instrumented classes pay no overhead at all.
+            pickling: Mapping from delegate name to pickling policy (`"copy"`, `"share"` or a `PicklePolicy`
+                instance, such as `RebuildPolicy`). If provided, the class gets `__reduce_ex__` and `__setstate__`
+                methods serialising (or copying) each delegate according to its policy, see `install_pickling`.
+            conflicts: Policy for names forwarded by more than one delegate: `"error"`, `"first"`, `"last"`, a
+                priority list of delegate names, or `"dispatch"` to try every delegate in order. By default the last
+                delegate wins and collisions are reported by a WARNING record of the `compclasses` logger, as are
+                forwarded names replacing the ones defined in the class body (which raise with `"error"`).
         """
+        inherited = inherited_delegates(bases)
+        if delegates is None and not inherited:
+            raise ValueError("`delegates` param cannot be `None`, unless inherited from a composed base class")
+
+        generated, merged, replaced = diff_delegates(inherited, delegates or {})
+        check_conflicts(conflicts, merged)
+        defined = tuple(attrs)
+        cls_name = f"{attrs.get('__module__')}.{attrs.get('__qualname__', clsname)}"
+
+        # Names forwarded by several delegates are resolved by the conflict index, which prebuilt artifacts ignore.
+        index = None if lazy else conflict_index(injections(generated), conflicts, defined, cls_name)
+        if slots:
+            merge_slots(attrs, bases, generated.keys())
+
+        delegatee_getters = None
+        if lazy or slots:
+            new_cls = super().__new__(cls, clsname, bases, attrs)
+            policies = None if pickling is None else resolve_policies(new_cls, merged, pickling)
+            delegatee_getters = slot_getters(new_cls, generated.keys()) if slots else None
+            # Generated before `new_cls` is modified, see `compclass`.
+            namespace = (
+                {}
+                if lazy
+                else dict(
+                    generate_properties(
+                        generated, verbose, log_func, compiled, delegatee_getters, cls_name, instrument, index
+                    )
+                )
+            )
+
+            install_holders(new_cls, generated)
+            install_bound_cache(new_cls, generated)
+            if lazy:
+                install_lazy(
+                    new_cls, generated, verbose, log_func, compiled, delegatee_getters, instrument, conflicts, defined
+                )
+            for _name, _to_inject in namespace.items():
+                setattr(new_cls, _name, _to_inject)
+        else:
+            # Descriptors are taken from the artifact of `python -m compclasses build`, if there is an up to date one.
+            module_name, qualname = attrs.get("__module__", ""), attrs.get("__qualname__", clsname)
+            prebuildable = not (instrument or index.collisions)  # type: ignore
+            prebuilt = None
+            if prebuildable:
+                prebuilt = load_prebuilt(module_name, qualname, generated, compiled, verbose, log_func)
+            attrs.update(
+                prebuilt
+                or generate_properties(generated, verbose, log_func, compiled, None, cls_name, instrument, index)
+            )
+            new_cls = super().__new__(cls, clsname, bases, attrs)
+            policies = None if pickling is None else resolve_policies(new_cls, merged, pickling)
+            install_holders(new_cls, generated)
+            install_bound_cache(new_cls, generated)
+            if prebuildable:
+                record_prebuildable(new_cls, generated, compiled)
+
+        record_delegation(new_cls, generated, merged, replaced, defined, conflicts)
+        record_options(new_cls, generated, Composition(compiled, instrument, conflicts, delegatee_getters))
+        if policies is not None:
+            install_pickling(new_cls, policies)
 
-        for _name, _to_inject in generate_properties(delegates, verbose, log_func):
-            attrs[_name] = _to_inject
+        return new_cls
 
-        return super().__new__(cls, clsname, bases, attrs)
+    def __getattr__(cls, name: str) -> Any:
+        """Materialises forwarded attributes/methods of classes composed with `lazy=True` when accessed from the class
+        itself. Only called if `name` is not found by the regular attribute lookup."""
+        descriptor = materialize(cls, name)
+        if descriptor is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return bind(descriptor, None, cls)
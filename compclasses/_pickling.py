@@ -0,0 +1,260 @@
+import copyreg
+import inspect
+import pickle
+from array import array
+from typing import Any, Callable, Dict, Iterable, Tuple, Type, Union
+
+from compclasses._bound import cached_bound_methods
+from compclasses._delegatee import delegatee
+from compclasses._holders import DelegateHolder
+
+PICKLING_ATTR = "__compclass_pickling__"
+PICKLING_METHODS = ("__reduce__", "__reduce_ex__", "__getstate__", "__setstate__")
+
+# Bytes-like types whose instances can be rebuilt from a buffer, hence serialised out-of-band with protocol 5+.
+_BUFFER_TYPES = (bytes, bytearray, memoryview, array)
+
+
+def _rebuild_buffer(kind: Type, typecode: Union[str, None], buffer: Any) -> Any:
+    """Rebuilds a bytes-like delegate from `buffer` (a `pickle.PickleBuffer` if transferred out-of-band, otherwise
+    the in-band bytes/bytearray)."""
+    view = memoryview(buffer)
+    if kind is memoryview:
+        return view
+    if kind is array:
+        result = array(typecode)  # type: ignore
+        result.frombytes(view.cast("B"))
+        return result
+    return kind(view)
+
+
+class _OutOfBand:
+    """Wraps a bytes-like delegate so that it is pickled as a `pickle.PickleBuffer`, i.e. it can be transferred
+    out-of-band (see `pickle.dumps(..., buffer_callback=...)`) instead of being copied into the pickle stream."""
+
+    __slots__ = ("delegate",)
+
+    def __init__(self, delegate: Any):
+        self.delegate = delegate
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable, Tuple[Any, ...]]:
+        kind = memoryview if isinstance(self.delegate, memoryview) else type(self.delegate)
+        typecode = self.delegate.typecode if isinstance(self.delegate, array) else None
+        return _rebuild_buffer, (kind, typecode, pickle.PickleBuffer(self.delegate))
+
+
+class PicklePolicy:
+    """Base class of delegates pickling policies.
+
+    A policy converts the delegate to the (picklable) value stored in the composed instance state (`dump`), and back
+    (`load`) when the instance is unpickled or copied.
+    """
+
+    def dump(self, delegate: Any, protocol: int) -> Any:
+        """Returns the value to serialise in place of `delegate`."""
+        return delegate
+
+    def load(self, state: Any) -> Any:
+        """Returns the delegate given the value returned by `dump`."""
+        return state
+
+
+class CopyPolicy(PicklePolicy):
+    """Serialises the delegate along with the composed instance (i.e. the default behaviour).
+
+    With pickle protocol 5+, bytes-like delegates (`bytes`, `bytearray`, `memoryview`, `array.array`) are serialised
+    as `pickle.PickleBuffer`, hence they can be transferred out-of-band.
+    """
+
+    def dump(self, delegate: Any, protocol: int) -> Any:
+        """Returns `delegate`, wrapped so that it is pickled out-of-band if it is bytes-like and `protocol >= 5`."""
+        if protocol >= 5 and isinstance(delegate, _BUFFER_TYPES):
+            return _OutOfBand(delegate)
+        return delegate
+
+
+class SharePolicy(PicklePolicy):
+    """Serialises only a reference to the delegate, which is shared (not copied) by the unpickled instance.
+
+    Delegates must be registered explicitly via `SharePolicy.register`, in a process-wide registry keyed by their
+    `id`, and they are kept alive until `SharePolicy.release` is called. Since ids are only meaningful within the
+    process which registered them (and the processes forked from it after registration, which inherit the
+    registry), references can be resolved by copies in the same process or by forked workers only, e.g. register
+    delegates before starting a `fork` based process pool. They cannot be resolved by spawned processes nor after
+    the registering process has exited.
+    """
+
+    _registry: Dict[int, Any] = {}
+
+    @classmethod
+    def register(cls, delegate: Any) -> int:
+        """Registers `delegate` in the shared registry, returning its key."""
+        key = id(delegate)
+        cls._registry[key] = delegate
+        return key
+
+    @classmethod
+    def release(cls, delegate: Union[Any, None] = None) -> None:
+        """Removes `delegate` from the shared registry, or every delegate if not provided."""
+        if delegate is None:
+            cls._registry.clear()
+        else:
+            cls._registry.pop(id(delegate), None)
+
+    def dump(self, delegate: Any, protocol: int) -> int:
+        """Returns the key of `delegate` in the shared registry.
+
+        Raises:
+            PicklingError: if `delegate` has not been registered.
+        """
+        key = id(delegate)
+        if self._registry.get(key) is not delegate:
+            raise pickle.PicklingError(
+                f"Shared delegate of type '{type(delegate).__name__}' is not registered, register it via "
+                "`SharePolicy.register` before pickling or copying the instance"
+            )
+        return key
+
+    def load(self, state: int) -> Any:
+        """Returns the registered delegate with key `state`.
+
+        Raises:
+            UnpicklingError: if no delegate is registered with key `state` in this process.
+        """
+        try:
+            return self._registry[state]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                f"Shared delegate with key {state} is not registered in this process, register it via "
+                "`SharePolicy.register` before starting the worker processes"
+            ) from None
+
+
+class RebuildPolicy(PicklePolicy):
+    """Does not serialise the delegate, which is rebuilt by calling `factory(*args)` when unpickled.
+
+    Arguments:
+        factory: Callable (must be picklable, e.g. a module level function or a class) building the delegate.
+        args: Callable returning the (picklable) tuple of arguments to call `factory` with, given the delegate. By
+            default `factory` is called without arguments.
+
+    Usage:
+
+    ```python
+    RebuildPolicy(Connection, args=lambda conn: (conn.url,))  # Connection(conn.url) is created when unpickling
+    ```
+    """
+
+    def __init__(self, factory: Callable[..., Any], args: Union[Callable[[Any], Tuple[Any, ...]], None] = None):
+        self.factory = factory
+        self.args = args
+
+    def dump(self, delegate: Any, protocol: int) -> Tuple[Any, ...]:
+        """Returns the arguments to rebuild `delegate` with."""
+        return tuple() if self.args is None else tuple(self.args(delegate))
+
+    def load(self, state: Tuple[Any, ...]) -> Any:
+        """Returns a new delegate built by calling `factory(*state)`."""
+        return self.factory(*state)
+
+
+_POLICIES: Dict[str, Callable[[], PicklePolicy]] = {"copy": CopyPolicy, "share": SharePolicy}
+
+
+def _instance_state(obj: Any) -> Dict[str, Any]:
+    """Returns the instance attributes of `obj`, both from its `__dict__` and its `__slots__`, excluding the cached
+    bound methods of its delegates (see `BoundMethodCache`), which are resolved again once unpickled. Delegates held
+    by weak reference (see `DelegateHolder`) are dereferenced, and stored back through their holder by `__setstate__`.
+    """
+    state = dict(getattr(obj, "__dict__", {}))
+    for name, _ in cached_bound_methods(obj):
+        del state[name]
+    for name in state:
+        holder = inspect.getattr_static(type(obj), name, None)
+        if isinstance(holder, DelegateHolder) and holder.weak:
+            state[name] = getattr(obj, name)
+    for name in copyreg._slotnames(type(obj)):  # type: ignore
+        if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+            state[name] = getattr(obj, name)
+    return state
+
+
+def resolve_policies(
+    cls: Type,
+    delegates: Dict[str, Union[Iterable[str], delegatee]],
+    policies: Dict[str, Union[str, PicklePolicy]],
+) -> Dict[str, PicklePolicy]:
+    """Validates the pickling `policies` of `cls`, returning the policy of every delegate (`CopyPolicy` by default).
+
+    Delegates held by weak reference (`weak=True`) cannot be copied, since nothing but the weak reference of the
+    unpickled (or copied) instance would refer to the copy: they require another policy, e.g. `"share"`.
+
+    Arguments:
+        cls: Composed class.
+        delegates: Delegates of `cls`.
+        policies: Mapping from delegate name to policy, either a `PicklePolicy` instance or one of `"copy"`, `"share"`.
+
+    Returns:
+        Mapping from every delegate name to its `PicklePolicy` instance.
+
+    Raises:
+        ValueError: if a policy refers to an unknown delegate or is unknown, if a delegate held by weak reference
+            would be copied, or if `cls` already defines its own pickling methods.
+    """
+    for name, policy in policies.items():
+        if name not in delegates:
+            raise ValueError(f"Pickling policy given for '{name}', which is not a delegate")
+        if not isinstance(policy, PicklePolicy) and policy not in _POLICIES:
+            raise ValueError(f"Unknown pickling policy '{policy}', expected one of {tuple(_POLICIES)}")
+
+    own = [method for method in PICKLING_METHODS if method in cls.__dict__]
+    if own:
+        raise ValueError(f"'{cls.__name__}' already defines {', '.join(own)}, cannot install pickling policies")
+
+    resolved: Dict[str, PicklePolicy] = {}
+    for name in delegates:
+        policy = policies.get(name, "copy")
+        resolved[name] = policy if isinstance(policy, PicklePolicy) else _POLICIES[policy]()
+
+    weak = [
+        name
+        for name, value in delegates.items()
+        if isinstance(value, delegatee) and value._weak and isinstance(resolved[name], CopyPolicy)
+    ]
+    if weak:
+        raise ValueError(f"Delegates {weak} are held by weak reference and cannot be copied, use another policy")
+    return resolved
+
+
+def install_pickling(cls: Type, resolved: Dict[str, PicklePolicy]) -> Type:
+    """Adds `__reduce_ex__` and `__setstate__` methods to `cls`, which serialise each delegate according to its
+    policy, to be used by `pickle`, `copy.copy` and `copy.deepcopy`.
+
+    Delegates without a policy (as well as every other instance attribute) are serialised as usual, in which case
+    bytes-like delegates are transferred out-of-band with pickle protocol 5+ (see `CopyPolicy`).
+
+    Arguments:
+        cls: Composed class.
+        resolved: Mapping from delegate name to policy, see `resolve_policies`.
+
+    Returns:
+        The class itself.
+    """
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        state = _instance_state(self)
+        for name, policy in resolved.items():
+            if name in state:
+                state[name] = policy.dump(state[name], protocol)
+        return copyreg.__newobj__, (type(self),), state  # type: ignore
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            policy = resolved.get(name)
+            object.__setattr__(self, name, value if policy is None else policy.load(value))
+
+    setattr(cls, PICKLING_ATTR, resolved)
+    for method in (__reduce_ex__, __setstate__):
+        method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+        setattr(cls, method.__name__, method)
+    return cls
@@ -0,0 +1,214 @@
+import inspect
+import operator
+from typing import Any, Callable, Dict, Iterable, Tuple, Type, Union
+
+
+def _binary(dunder: str, call: str = "method(delegate, other)") -> str:
+    """Returns the body of a binary dunder method evaluating `call` with `method`, the `dunder` method of the delegate
+    type, or returning `NotImplemented` if the delegate type does not define it.
+
+    `NotImplemented` returned by the delegate is passed through as well, so that the interpreter tries the reflected
+    method of the other operand (and raises `TypeError` if it is not supported either), while any other error raised
+    by the delegate propagates.
+    """
+    return (
+        "delegate = {d}\n"
+        f"method = getattr(type(delegate), {dunder!r}, None)\n"
+        f"return NotImplemented if method is None else {call}"
+    )
+
+
+def _inplace(dunder: str) -> str:
+    """Returns the body of an in-place dunder method (e.g. `__iadd__`) calling the in-place method of the delegate
+    type, or its binary one (e.g. `__add__`) if either missing or not implemented for the other operand, see `_binary`.
+    The result is stored back as the delegate and the composed instance itself is returned."""
+    return (
+        "delegate = {d}\n"
+        f"for name in ({dunder!r}, {f'__{dunder[3:]}'!r}):\n"
+        "    method = getattr(type(delegate), name, None)\n"
+        "    result = NotImplemented if method is None else method(delegate, other)\n"
+        "    if result is not NotImplemented:\n"
+        "        {d} = result\n"
+        "        return self\n"
+        "return NotImplemented"
+    )
+
+
+# Dunder method -> (parameters, body), where `{d}` stands for the delegate. Bodies use the builtin function or operator
+# of each protocol (e.g. `len(d)`, `d[key]`), which dispatch through the delegate type slots, while binary operators
+# and rich comparisons call the method of the delegate type directly, see `_binary`.
+_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    # container
+    "__len__": ("", "return len({d})"),
+    "__iter__": ("", "return iter({d})"),
+    "__reversed__": ("", "return reversed({d})"),
+    "__contains__": ("item", "return item in {d}"),
+    "__getitem__": ("key", "return {d}[key]"),
+    "__setitem__": ("key, value", "{d}[key] = value"),
+    "__delitem__": ("key", "del {d}[key]"),
+    # number
+    "__add__": ("other", _binary("__add__")),
+    "__sub__": ("other", _binary("__sub__")),
+    "__mul__": ("other", _binary("__mul__")),
+    "__matmul__": ("other", _binary("__matmul__")),
+    "__truediv__": ("other", _binary("__truediv__")),
+    "__floordiv__": ("other", _binary("__floordiv__")),
+    "__mod__": ("other", _binary("__mod__")),
+    "__divmod__": ("other", _binary("__divmod__")),
+    "__pow__": (
+        "other, modulo=None",
+        _binary("__pow__", "method(delegate, other) if modulo is None else method(delegate, other, modulo)"),
+    ),
+    "__lshift__": ("other", _binary("__lshift__")),
+    "__rshift__": ("other", _binary("__rshift__")),
+    "__and__": ("other", _binary("__and__")),
+    "__xor__": ("other", _binary("__xor__")),
+    "__or__": ("other", _binary("__or__")),
+    "__radd__": ("other", _binary("__radd__")),
+    "__rsub__": ("other", _binary("__rsub__")),
+    "__rmul__": ("other", _binary("__rmul__")),
+    "__rmatmul__": ("other", _binary("__rmatmul__")),
+    "__rtruediv__": ("other", _binary("__rtruediv__")),
+    "__rfloordiv__": ("other", _binary("__rfloordiv__")),
+    "__rmod__": ("other", _binary("__rmod__")),
+    "__rdivmod__": ("other", _binary("__rdivmod__")),
+    "__rpow__": ("other", _binary("__rpow__")),
+    "__rlshift__": ("other", _binary("__rlshift__")),
+    "__rrshift__": ("other", _binary("__rrshift__")),
+    "__rand__": ("other", _binary("__rand__")),
+    "__rxor__": ("other", _binary("__rxor__")),
+    "__ror__": ("other", _binary("__ror__")),
+    "__neg__": ("", "return -{d}"),
+    "__pos__": ("", "return +{d}"),
+    "__abs__": ("", "return abs({d})"),
+    "__invert__": ("", "return ~{d}"),
+    "__bool__": ("", "return bool({d})"),
+    "__int__": ("", "return int({d})"),
+    "__float__": ("", "return float({d})"),
+    "__complex__": ("", "return complex({d})"),
+    "__index__": ("", "return operator.index({d})"),
+    "__round__": ("ndigits=None", "return round({d}) if ndigits is None else round({d}, ndigits)"),
+    # in-place
+    "__iadd__": ("other", _inplace("__iadd__")),
+    "__isub__": ("other", _inplace("__isub__")),
+    "__imul__": ("other", _inplace("__imul__")),
+    "__imatmul__": ("other", _inplace("__imatmul__")),
+    "__itruediv__": ("other", _inplace("__itruediv__")),
+    "__ifloordiv__": ("other", _inplace("__ifloordiv__")),
+    "__imod__": ("other", _inplace("__imod__")),
+    "__ipow__": ("other", _inplace("__ipow__")),
+    "__ilshift__": ("other", _inplace("__ilshift__")),
+    "__irshift__": ("other", _inplace("__irshift__")),
+    "__iand__": ("other", _inplace("__iand__")),
+    "__ixor__": ("other", _inplace("__ixor__")),
+    "__ior__": ("other", _inplace("__ior__")),
+    # comparison
+    "__eq__": ("other", _binary("__eq__")),
+    "__ne__": ("other", _binary("__ne__")),
+    "__lt__": ("other", _binary("__lt__")),
+    "__le__": ("other", _binary("__le__")),
+    "__gt__": ("other", _binary("__gt__")),
+    "__ge__": ("other", _binary("__ge__")),
+    "__hash__": ("", "return hash({d})"),
+    # context
+    "__enter__": ("", "return {d}.__enter__()"),
+    "__exit__": ("exc_type, exc_value, traceback", "return {d}.__exit__(exc_type, exc_value, traceback)"),
+    # callable
+    "__call__": ("*args, **kwargs", "return {d}(*args, **kwargs)"),
+}
+
+# Protocol group -> dunder methods forwarded, see `delegatee(..., protocols=...)`.
+PROTOCOLS: Dict[str, Tuple[str, ...]] = {
+    "container": ("__len__", "__iter__", "__contains__"),
+    "sequence": ("__len__", "__iter__", "__reversed__", "__contains__", "__getitem__", "__setitem__", "__delitem__"),
+    "mapping": ("__len__", "__iter__", "__contains__", "__getitem__", "__setitem__", "__delitem__"),
+    "number": (
+        *("__add__", "__sub__", "__mul__", "__matmul__", "__truediv__", "__floordiv__", "__mod__", "__divmod__"),
+        *("__pow__", "__lshift__", "__rshift__", "__and__", "__xor__", "__or__"),
+        *("__radd__", "__rsub__", "__rmul__", "__rmatmul__", "__rtruediv__", "__rfloordiv__", "__rmod__"),
+        *("__rdivmod__", "__rpow__", "__rlshift__", "__rrshift__", "__rand__", "__rxor__", "__ror__"),
+        *("__neg__", "__pos__", "__abs__", "__invert__", "__bool__", "__int__", "__float__", "__complex__"),
+        *("__index__", "__round__"),
+    ),
+    "inplace": (
+        *("__iadd__", "__isub__", "__imul__", "__imatmul__", "__itruediv__", "__ifloordiv__", "__imod__"),
+        *("__ipow__", "__ilshift__", "__irshift__", "__iand__", "__ixor__", "__ior__"),
+    ),
+    "comparison": ("__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__hash__"),
+    "context": ("__enter__", "__exit__"),
+    "callable": ("__call__",),
+}
+
+
+# In-place dunder methods, forwarded if the delegatee class implements the matching binary operator, see
+# `protocol_dunders`.
+_INPLACE = frozenset(PROTOCOLS["inplace"])
+
+
+def check_protocols(protocols: Iterable[str]) -> Tuple[str, ...]:
+    """Checks that every protocol group is known.
+
+    Raises:
+        ValueError: if any protocol group is unknown.
+    """
+    protocols = tuple(protocols)
+    unknown = [protocol for protocol in protocols if protocol not in PROTOCOLS]
+    if unknown:
+        raise ValueError(f"Unknown protocols {unknown}, expected any of {tuple(PROTOCOLS)}")
+    return protocols
+
+
+def protocol_dunders(delegatee_cls: Union[Type, None], protocols: Iterable[str]) -> Tuple[str, ...]:
+    """Returns the dunder methods of the `protocols` groups, in order and without duplicates, restricted to the ones
+    implemented by `delegatee_cls` (if known) so that the composed class keeps the fallbacks of missing ones (e.g.
+    iteration via `__getitem__`). In-place dunder methods are kept if `delegatee_cls` implements either them or the
+    matching binary operator (e.g. `__iadd__` or `__add__`), since the delegate is replaced by the result anyway."""
+    dunders = dict.fromkeys(dunder for protocol in protocols for dunder in PROTOCOLS[protocol])
+    if delegatee_cls is None:
+        return tuple(dunders)
+
+    # Looked up in the class MRO only: `hasattr(delegatee_cls, ...)` would find the ones of the metaclass as well.
+    implemented = {name for klass in delegatee_cls.__mro__ for name in vars(klass)}
+    return tuple(
+        dunder
+        for dunder in dunders
+        if dunder in implemented or (dunder in _INPLACE and f"__{dunder[3:]}" in implemented)
+    )
+
+
+def protocol_source(delegatee_cls_name: str, dunder: str) -> str:
+    """Returns the source code of the dunder method `dunder` forwarding to `delegatee_cls_name`, see
+    `dunder_from_protocol`."""
+    params, body = _TEMPLATES[dunder]
+    lines = body.format(d=f"self.{delegatee_cls_name}").splitlines()
+    return f"def {dunder}(self{', ' if params else ''}{params}):\n" + "".join(f"    {line}\n" for line in lines)
+
+
+def dunder_from_protocol(delegatee_cls: Union[Type, None], delegatee_cls_name: str, dunder: str) -> Any:
+    """Defines the dunder method `dunder` of a protocol group, forwarding to `delegatee_cls_name` via the matching
+    builtin function or operator, e.g.:
+
+    ```python
+    def __getitem__(self, key):
+        return self.delegatee_cls_name[key]
+    ```
+
+    Contrary to forwarding properties, the generated function is a plain method, hence the interpreter fills the type
+    slots of the composed class with it (e.g. `sq_length` for `__len__`) and `len(obj)` costs a single python call.
+
+    Arguments:
+        delegatee_cls: Class of the delegate, if known.
+        delegatee_cls_name: Name of the attribute holding the delegate.
+        dunder: Dunder method to forward.
+
+    Returns:
+        Function which will be injected in the class, or `None` if `delegatee_cls` explicitly marks `dunder` as not
+            available (e.g. `list.__hash__`).
+    """
+    if delegatee_cls is not None and inspect.getattr_static(delegatee_cls, dunder, False) is None:
+        return None
+
+    namespace: Dict[str, Callable] = {}
+    # Only a known dunder of `_TEMPLATES` and the identifier path checked by `_make_descriptor` are interpolated.
+    exec(protocol_source(delegatee_cls_name, dunder), {"operator": operator}, namespace)  # nosec B102
+    return namespace[dunder]
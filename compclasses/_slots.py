@@ -0,0 +1,127 @@
+from operator import attrgetter
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Iterable, Tuple, Type
+
+from compclasses._core import _is_identifier
+from compclasses._discovery import slots_attrs
+
+
+def _check_slot_names(names: Iterable[str]) -> Tuple[str, ...]:
+    """Checks that every delegate name can be used as a slot, namely that it is a valid identifier (e.g. not a dotted
+    path such as `"a.b"`).
+
+    Raises:
+        ValueError: if any name is not a valid identifier.
+    """
+    names = tuple(names)
+    for name in names:
+        if not _is_identifier(name):
+            raise ValueError(f"Delegate name '{name}' is not a valid identifier, hence cannot be used as slot")
+    return names
+
+
+def _inherited_slots(bases: Tuple[Type, ...]) -> Tuple[str, ...]:
+    """Returns every slot already defined by any class in the MRO of `bases`."""
+    return tuple(slot for base in bases for klass in base.__mro__ for slot in slots_attrs(klass))
+
+
+def merge_slots(attrs: Dict[str, Any], bases: Tuple[Type, ...], names: Iterable[str]) -> Dict[str, Any]:
+    """Adds delegate `names` to the `__slots__` of a class namespace (as passed to a metaclass `__new__`).
+
+    Names already present in the class own `__slots__`, or in the slots of any base class, are not added twice.
+
+    Arguments:
+        attrs: Class namespace.
+        bases: Base classes.
+        names: Delegate names to store in slots.
+
+    Returns:
+        The updated class namespace.
+
+    Raises:
+        ValueError: if any name is not a valid identifier.
+    """
+    own_slots = attrs.get("__slots__", ())
+    own_slots = (own_slots,) if isinstance(own_slots, str) else tuple(own_slots)
+    inherited = _inherited_slots(bases)
+
+    new_slots = tuple(name for name in _check_slot_names(names) if name not in inherited)
+    attrs["__slots__"] = tuple(dict.fromkeys((*own_slots, *new_slots)))
+    return attrs
+
+
+def _update_class_cells(cls_dict: Dict[str, Any], old_cls: Type, new_cls: Type) -> None:
+    """Points the `__class__` closure cells (used by zero-arguments `super()`) of the methods in `cls_dict` to
+    `new_cls`, in place of `old_cls`."""
+    for member in cls_dict.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            funcs: Iterable[Any] = (member.__func__,)
+        elif isinstance(member, property):
+            funcs = (member.fget, member.fset, member.fdel)
+        else:
+            funcs = (member,)
+
+        for func in funcs:
+            for cell in getattr(func, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is old_cls:
+                        cell.cell_contents = new_cls
+                except ValueError:  # empty cell
+                    continue
+
+
+def add_slots(cls: Type, names: Iterable[str]) -> Type:
+    """Creates a copy of `cls` storing the delegate `names` in `__slots__`.
+
+    Since `__slots__` cannot be added to an existing class, a new class is created (similarly to what
+    `dataclasses.dataclass(slots=True)` does) with the same name, bases and namespace.
+
+    !!! warning
+        Unless a base class provides it, instances of the new class do not have a `__dict__` (nor `__weakref__`),
+        therefore every instance attribute must be declared in `__slots__`.
+
+    Arguments:
+        cls: Class to which attributes/methods should be forwarded to.
+        names: Delegate names to store in slots.
+
+    Returns:
+        New class with `__slots__`.
+
+    Raises:
+        ValueError: if any name is not a valid identifier.
+    """
+    cls_dict = dict(cls.__dict__)
+    own_slots = slots_attrs(cls)
+
+    for name in own_slots:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    merge_slots(cls_dict, cls.__bases__, names)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    _update_class_cells(cls_dict, cls, new_cls)
+    return new_cls
+
+
+def slot_getters(cls: Type, names: Iterable[str]) -> Dict[str, Callable[[Any], Any]]:
+    """Returns, for each delegate name, a callable reading the delegate from an instance of `cls`.
+
+    If the name is stored in a slot, the callable is the slot member descriptor `__get__`, hence the delegate is read
+    directly from the instance memory layout instead of going through the generic attribute lookup. Otherwise it
+    falls back to `operator.attrgetter(name)`.
+
+    Arguments:
+        cls: Class with delegates stored in slots.
+        names: Delegate names.
+
+    Returns:
+        Mapping from delegate name to getter.
+    """
+    getters: Dict[str, Callable[[Any], Any]] = {}
+    for name in names:
+        member = next((klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__), None)
+        getters[name] = member.__get__ if isinstance(member, MemberDescriptorType) else attrgetter(name)
+    return getters
@@ -0,0 +1,203 @@
+import inspect
+from types import FunctionType, MethodDescriptorType, WrapperDescriptorType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Tuple, Type, Union
+
+from compclasses._conflicts import Conflicts, resolve_conflict
+from compclasses._delegatee import _delegated_names, delegatee
+
+SPEC_ATTR = "__compclass_spec__"
+
+# Kinds of forwarded names, see `classify`.
+KINDS = ("dunder", "method", "classmethod", "staticmethod", "property", "attribute", "unknown")
+
+
+class Delegation(NamedTuple):
+    """Source of a forwarded name: the delegate it is forwarded to, the attribute name in the delegate, and its kind
+    (see `classify`)."""
+
+    delegatee_name: str
+    attr_name: str
+    kind: str
+
+
+def classify(delegatee_cls: Union[Type, None], attr_name: str) -> str:
+    """Classifies `attr_name` of `delegatee_cls` statically, i.e. without triggering descriptors, as one of:
+
+    - `"dunder"`: dunder method (e.g. `__len__`);
+    - `"method"`, `"classmethod"`, `"staticmethod"`: (python or builtin) methods;
+    - `"property"`: property (or any other data descriptor, such as slots);
+    - `"attribute"`: class level constant or instance attribute;
+    - `"unknown"`: `delegatee_cls` is unknown (i.e. the delegate is a plain iterable of names).
+
+    Arguments:
+        delegatee_cls: Class of the delegate, if known.
+        attr_name: Attribute/method name.
+
+    Returns:
+        The kind of `attr_name`.
+    """
+    if delegatee._is_dunder_method(attr_name):
+        return "dunder"
+    if delegatee_cls is None:
+        return "unknown"
+
+    member = inspect.getattr_static(delegatee_cls, attr_name, None)
+    if isinstance(member, staticmethod):
+        return "staticmethod"
+    if isinstance(member, classmethod):
+        return "classmethod"
+    if isinstance(member, (FunctionType, MethodDescriptorType, WrapperDescriptorType)):
+        return "method"
+    if inspect.isdatadescriptor(member):
+        return "property"
+    return "attribute"
+
+
+def build_spec(
+    delegates: Dict[str, Union[Iterable[str], delegatee]],
+    conflicts: Conflicts = None,
+) -> Dict[str, Delegation]:
+    """Maps every forwarded name of `delegates` to its `Delegation`.
+
+    Arguments:
+        delegates: Key-value pair of delegates.
+        conflicts: Policy resolving names forwarded by several delegates, see `compclasses._conflicts.conflict_index`.
+            By default the last delegate wins, names dispatched to several delegates map to the first one.
+
+    Returns:
+        Mapping from forwarded name to `Delegation`, in order of injection.
+    """
+    spec: Dict[str, Delegation] = {}
+    collided: Dict[str, List[Delegation]] = {}
+    for delegatee_name, delegatee_instance in delegates.items():
+        delegatee_cls = delegatee_instance.delegatee_cls if isinstance(delegatee_instance, delegatee) else None
+        for new_attr_name, attr_name in _delegated_names(delegatee_instance):
+            delegation = Delegation(delegatee_name, attr_name, classify(delegatee_cls, attr_name))
+            if conflicts is not None and new_attr_name in spec:
+                collided.setdefault(new_attr_name, [spec[new_attr_name]]).append(delegation)
+            spec[new_attr_name] = delegation
+
+    for new_attr_name, delegations in collided.items():
+        (source, _), *_ = resolve_conflict([(d.delegatee_name, d.attr_name) for d in delegations], conflicts)
+        spec[new_attr_name] = next(d for d in delegations if d.delegatee_name == source)
+    return spec
+
+
+class SpecIndex(Mapping[str, Delegation]):
+    """Immutable mapping from forwarded name to `Delegation`, stored as `__compclass_spec__` of composed classes.
+
+    The mapping is computed on first access, hence classes composed with `lazy=True` (and lazy delegatees) do not
+    parse their delegates until it is needed.
+    """
+
+    __slots__ = ("_build", "_data")
+
+    def __init__(self, build: Callable[[], Dict[str, Delegation]]):
+        self._build: Union[Callable[[], Dict[str, Delegation]], None] = build
+        self._data: Dict[str, Delegation] = {}
+
+    @property
+    def data(self) -> Dict[str, Delegation]:
+        # `build` is read once and `_data` is set before `_build` is cleared, hence concurrent first accesses at worst
+        # build the (same) mapping twice, and never observe an empty one.
+        build = self._build
+        if build is not None:
+            self._data = build()
+            self._build = None
+        return self._data
+
+    def __getitem__(self, name: str) -> Delegation:
+        return self.data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data})"
+
+
+def inherited_spec(cls: Type) -> Dict[str, Delegation]:
+    """Returns the spec indexes of the composed base classes of `cls` merged along the MRO, i.e. former bases take
+    precedence."""
+    merged: Dict[str, Delegation] = {}
+    for base in reversed(cls.__bases__):
+        merged.update(getattr(base, SPEC_ATTR, {}))
+    return merged
+
+
+def attach_spec(
+    cls: Type,
+    delegates: Dict[str, Union[Iterable[str], delegatee]],
+    replaced: Iterable[str] = (),
+    conflicts: Conflicts = None,
+) -> Type:
+    """Attaches the `SpecIndex` of `delegates` to `cls` as `__compclass_spec__`, merged with the one inherited from
+    composed base classes (names forwarded by `cls` itself take precedence).
+
+    Arguments:
+        cls: Composed class.
+        delegates: Key-value pair of delegates.
+        replaced: Names of the inherited delegates overridden or removed by `cls`, whose inherited entries are dropped.
+        conflicts: Policy resolving names forwarded by several delegates, see `build_spec`.
+
+    Returns:
+        The class itself.
+    """
+    replaced = frozenset(replaced)
+    delegates = dict(delegates)
+    previous = cls.__dict__.get(SPEC_ATTR, {})  # e.g. if `cls` is composed twice
+
+    def build() -> Dict[str, Delegation]:
+        inherited = {
+            name: delegation
+            for name, delegation in {**inherited_spec(cls), **previous}.items()
+            if delegation.delegatee_name not in replaced
+        }
+        return {**inherited, **build_spec(delegates, conflicts)}
+
+    setattr(cls, SPEC_ATTR, SpecIndex(build))
+    return cls
+
+
+def _spec(cls: Type) -> Mapping[str, Delegation]:
+    """Returns the spec index of `cls` (or of the class of `cls`, if it is an instance)."""
+    klass = cls if isinstance(cls, type) else type(cls)
+    return getattr(klass, SPEC_ATTR, {})
+
+
+def resolve(cls: Type, name: str) -> Union[Delegation, None]:
+    """Returns the source of forwarded `name` in the composed class `cls` (or instance of it), in constant time.
+
+    Usage:
+
+    ```python
+    from compclasses import resolve
+
+    resolve(Baz, "get_value")  # Delegation(delegatee_name='_foo', attr_name='get_value', kind='method')
+    resolve(Baz, "not_forwarded")  # None
+    ```
+
+    Arguments:
+        cls: Composed class or instance.
+        name: Name to resolve.
+
+    Returns:
+        The `Delegation(delegatee_name, attr_name, kind)` of `name`, or `None` if `name` is not forwarded.
+    """
+    return _spec(cls).get(name)
+
+
+def delegated_names(cls: Type) -> Tuple[str, ...]:
+    """Returns every name forwarded by the composed class `cls` (or instance of it), including the ones inherited from
+    composed base classes, in order of injection.
+
+    Arguments:
+        cls: Composed class or instance.
+    """
+    return tuple(_spec(cls))
@@ -0,0 +1,342 @@
+import inspect
+from collections import deque
+from itertools import chain, repeat
+from operator import attrgetter
+from threading import RLock
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Set, Tuple, Type, Union
+from weakref import WeakKeyDictionary, WeakSet
+
+from compclasses._bound import (
+    BoundMethodCache,
+    _class_attr,
+    install_bound_cache,
+    invalidate_bound_methods,
+    retire_bound_names,
+)
+from compclasses._cache import VERSION_ATTR
+from compclasses._conflicts import Conflicts, conflict_index, injections
+from compclasses._core import generate_properties
+from compclasses._delegatee import _delegated_names, delegatee
+from compclasses._holders import DelegateHolder
+from compclasses._inheritance import DELEGATES_ATTR, Delegates, _Removed
+from compclasses._lazy import finalize
+from compclasses._spec import SPEC_ATTR, Delegation, SpecIndex, build_spec, inherited_spec
+
+OPTIONS_ATTR = "__compclass_options__"
+
+# Serialises `rebind` calls, including the ones cascading to dependent classes.
+_lock = RLock()
+
+# Composed class -> composed classes with a delegate of that class, see `record_options`.
+_dependents: "WeakKeyDictionary[Type, WeakSet[Type]]" = WeakKeyDictionary()
+
+
+class Composition(NamedTuple):
+    """Options a composed class has been composed with, which its generated descriptors depend on (see
+    `generate_properties`)."""
+
+    compiled: bool = False
+    instrument: bool = False
+    conflicts: Conflicts = None
+    delegatee_getters: Union[Dict[str, Callable[[Any], Any]], None] = None
+
+
+def record_options(cls: Type, delegates: Delegates, options: Composition) -> Type:
+    """Records the options of the composed class `cls` as `__compclass_options__`, and registers `cls` as dependent of
+    the classes of its delegates which are composed themselves, so that rebinding them regenerates the descriptors of
+    `cls` as well (e.g. flattened delegation chains, see `compclasses._chain.flatten_chain`).
+
+    Arguments:
+        cls: Composed class.
+        delegates: Delegates whose descriptors have been generated for `cls`.
+        options: Options `cls` has been composed with.
+
+    Returns:
+        The class itself.
+    """
+    setattr(cls, OPTIONS_ATTR, options)
+    for value in delegates.values():
+        delegatee_cls = value.delegatee_cls if isinstance(value, delegatee) else None
+        if isinstance(delegatee_cls, type) and hasattr(delegatee_cls, DELEGATES_ATTR):
+            try:
+                _dependents.setdefault(delegatee_cls, WeakSet()).add(cls)
+            except TypeError:  # e.g. a class whose metaclass defines `__eq__` without `__hash__`
+                pass
+    return cls
+
+
+def _dependents_of(cls: Type) -> List[Type]:
+    """Returns the composed classes with a delegate of class `cls` (or of a subclass of it)."""
+    classes, dependents = [cls], []
+    while classes:
+        klass = classes.pop()
+        classes.extend(type.__subclasses__(klass))
+        try:
+            dependents.extend(_dependents.get(klass, ()))
+        except TypeError:
+            pass
+    return dependents
+
+
+def _holding(value: Union[Iterable[str], delegatee]) -> Tuple[bool, Any]:
+    """Returns how a delegate is held by the composed instances, see `compclasses._holders.DelegateHolder`."""
+    return (value._weak, value._lazy_factory) if isinstance(value, delegatee) else (False, None)
+
+
+def _replace_attrs(
+    current: Union[Iterable[str], delegatee],
+    new_attrs: Union[Iterable[str], delegatee],
+) -> Union[Tuple[str, ...], delegatee]:
+    """Returns the delegate `current` forwarding `new_attrs` instead, with the same options (unless `new_attrs` is a
+    `delegatee` itself, which replaces `current` as a whole)."""
+    if isinstance(new_attrs, delegatee):
+        return new_attrs
+    if not isinstance(current, delegatee):
+        return tuple(new_attrs)
+
+    return delegatee(
+        current.delegatee_cls,
+        new_attrs,
+        prefix=current._prefix,
+        suffix=current._suffix,
+        validate=current._validate,
+        fanout=current._fanout,
+        reduce=current._reduce,
+        executor=current._executor,
+        cache_bound=current._cache_bound,
+        readonly=current._readonly,
+        protocols=current._protocols,
+        weak=current._weak,
+        lazy_factory=current._lazy_factory,
+        flatten=current._flatten,
+    )
+
+
+def rebind(cls: Type, key: str, new_attrs: Union[Iterable[str], delegatee]) -> Type:
+    """Changes the names the composed class `cls` forwards to its delegate `key`, in place.
+
+    Only the descriptors of the affected names (namely the ones forwarded to `key` before or after, including the ones
+    colliding with other delegates) are regenerated, as `compclasses.compclass` would, with the options `cls` has been
+    composed with. Every descriptor is generated before `cls` is modified, hence an error (e.g. a failed validation)
+    leaves it untouched. Then, names no longer forwarded are removed, the spec index of `cls` is updated (see
+    `compclasses.resolve`) and its version is increased, so that cached descriptors of classes composed over `cls` are
+    not reused (see `compclasses.clear_cache`). The changes to `cls` are published at once, its version last. The
+    delegates and spec indexes of composed subclasses of `cls` which
+    inherit the delegate `key` are updated accordingly, and composed classes with a delegate of class `cls` are
+    rebound in turn.
+
+    Bound methods cached by the replaced descriptors (see `delegatee(..., cache_bound=True)`) are not looked for in the
+    existing instances of `cls`: they are dropped the next time the delegate is reassigned, deleted or swapped (see
+    `swap_delegate`). Instances are not otherwise affected, as every forwarder looks the delegate up at each access.
+
+    Usage:
+
+    ```python
+    from compclasses import compclass, delegatee, rebind
+
+    @compclass(delegates={"_pool": delegatee(Pool, ("acquire",))})
+    class Service:
+        ...
+
+    rebind(Service, "_pool", ("acquire", "release"))  # Service().release is now forwarded to `_pool`
+    ```
+
+    Arguments:
+        cls: Composed class.
+        key: Name of the delegate.
+        new_attrs: Attributes/methods to forward, with the same options (e.g. prefix, `cache_bound`) as the current
+            delegate, or a `delegate` instance replacing it as a whole.
+
+    Returns:
+        The class itself.
+
+    Raises:
+        ValueError: if `key` is not a delegate of `cls`, the new delegate changes how it is held (i.e. `weak` or
+            `lazy_factory`), or a name conflict is found with `conflicts="error"`.
+        AttributeError: if the new `delegatee` has `validate=True` and its class has no attribute/method in attrs.
+    """
+    with _lock:
+        _rebind(cls, key, new_attrs, set())
+    return cls
+
+
+def _rebind(cls: Type, key: str, new_attrs: Union[Iterable[str], delegatee], seen: Set[Type]) -> None:
+    """Rebinds the delegate `key` of `cls`, and then the composed classes depending on `cls` not in `seen`."""
+    delegates = getattr(cls, DELEGATES_ATTR, {})
+    if key not in delegates:
+        raise ValueError(f"'{key}' is not a delegate of '{cls.__name__}'")
+
+    current = delegates[key]
+    new = _replace_attrs(current, new_attrs)
+    if _holding(new) != _holding(current):
+        raise ValueError(f"Rebinding '{key}' cannot change how the delegate is held (weak or lazy_factory)")
+
+    finalize(cls)  # Names of classes composed with `lazy=True` are materialised, so that they can be replaced.
+    options = getattr(cls, OPTIONS_ATTR, Composition())
+    cls_name = f"{cls.__module__}.{cls.__qualname__}"
+    merged = {**delegates, key: new}
+    spec = dict(getattr(cls, SPEC_ATTR, {}))
+
+    affected = {new_attr_name for value in (current, new) for new_attr_name, _ in _delegated_names(value)}
+    injected = [injection for injection in injections(merged) if injection[0] in affected]
+    involved = {delegatee_name for _, delegatee_name, _ in injected}
+    involved_delegates = {name: value for name, value in merged.items() if name in involved}
+
+    body = tuple(name for name in vars(cls) if name not in spec)
+    index = conflict_index(injected, options.conflicts, body, cls_name)
+    namespace = {
+        name: descriptor
+        for name, descriptor in generate_properties(
+            involved_delegates,
+            compiled=options.compiled,
+            delegatee_getters=options.delegatee_getters,
+            cls_name=cls_name,
+            instrument=options.instrument,
+            conflicts=index,
+        )
+        if name in affected
+    }
+
+    resolved, inherited = build_spec(involved_delegates, options.conflicts), inherited_spec(cls)
+    updated: Dict[str, Delegation] = {name: delegation for name, delegation in spec.items() if name not in affected}
+    updated.update((name, resolved[name]) for name in namespace)
+    removed = affected.difference(namespace)
+    masked = {name for name in removed if name in inherited and inherited[name].delegatee_name == key}
+    updated.update((name, inherited[name]) for name in removed.difference(masked) if name in inherited)
+    stale = [_class_attr(cls, name) for name in affected]
+
+    assignments: Dict[str, Any] = dict(namespace)
+    assignments.update((name, None if inherited[name].kind == "dunder" else _Removed(name)) for name in masked)
+    assignments.update({DELEGATES_ATTR: merged, SPEC_ATTR: SpecIndex(lambda: updated)})
+    deletions = [name for name in removed.difference(masked) if name in vars(cls)]
+
+    if (
+        isinstance(new, delegatee)
+        and new._cache_bound
+        and not (isinstance(current, delegatee) and current._cache_bound)
+    ):
+        install_bound_cache(cls, {key: new})  # hooks only drop cached bound methods, hence they can come first
+    _publish(cls, assignments, deletions)
+
+    for descriptor in stale:
+        if isinstance(descriptor, BoundMethodCache) and namespace.get(descriptor.name) is not descriptor:
+            retire_bound_names(cls, descriptor.delegatee_name, (descriptor.name,))
+
+    for subclass in type.__subclasses__(cls):
+        _propagate(subclass, key, current, new, affected)
+
+    seen.add(cls)
+    for dependent in _dependents_of(cls):
+        if dependent in seen:
+            continue
+        for name, value in tuple(getattr(dependent, DELEGATES_ATTR, {}).items()):
+            delegatee_cls = value.delegatee_cls if isinstance(value, delegatee) else None
+            if isinstance(delegatee_cls, type) and issubclass(delegatee_cls, cls):
+                _rebind(dependent, name, value, seen)
+
+
+def _publish(cls: Type, assignments: Dict[str, Any], deletions: Iterable[str] = (), bump: bool = True) -> None:
+    """Sets `assignments` on `cls` and deletes the `deletions` attributes, and then increases its version (see
+    `compclasses._cache.class_version`) if `bump`.
+
+    Every change is applied by a single call of builtin functions (`setattr` and `delattr` mapped over the changes and
+    consumed by a `deque`), which does not run python bytecode in between: under the GIL, a thread reading the class
+    namespace at once (e.g. `dict(vars(cls))`) sees either none or all of the changes, never a mix of old and new
+    descriptors. On free-threaded builds, readers may observe a partially published rebind.
+    """
+    deque(
+        chain(
+            map(setattr, repeat(cls), assignments, assignments.values()),
+            map(delattr, repeat(cls), deletions),
+        ),
+        maxlen=0,
+    )
+    if bump:
+        setattr(cls, VERSION_ATTR, vars(cls).get(VERSION_ATTR, 0) + 1)
+
+
+def _propagate(
+    cls: Type,
+    key: str,
+    current: Union[Iterable[str], delegatee],
+    new: Union[Iterable[str], delegatee],
+    affected: Set[str],
+) -> None:
+    """Updates the delegates and the spec index recorded by the subclass `cls` of a rebound class, and then by its own
+    subclasses, unless `cls` defines the delegate `key` itself. Their descriptors are inherited, hence left untouched.
+
+    Arguments:
+        cls: Subclass of the rebound class.
+        key: Name of the rebound delegate.
+        current: Delegate `key` before the rebind.
+        new: Delegate `key` after the rebind.
+        affected: Names forwarded to `key` before or after the rebind.
+    """
+    delegates = vars(cls).get(DELEGATES_ATTR)
+    if delegates is not None:
+        if delegates.get(key) is not current:  # e.g. overridden or removed by `cls`
+            return
+        spec = vars(cls).get(SPEC_ATTR, {})
+        updated = {
+            name: delegation
+            for name, delegation in spec.items()
+            if not (name in affected and delegation.delegatee_name == key)
+        }
+        inherited = inherited_spec(cls)
+        updated.update((name, inherited[name]) for name in affected if name not in updated and name in inherited)
+        _publish(cls, {DELEGATES_ATTR: {**delegates, key: new}, SPEC_ATTR: SpecIndex(lambda: updated)}, bump=False)
+
+    for subclass in type.__subclasses__(cls):
+        _propagate(subclass, key, current, new, affected)
+
+
+def _current(target: Any, name: str) -> Any:
+    """Returns the delegate `name` of `target` if it is set, without calling its lazy factory (if any)."""
+    holder = inspect.getattr_static(type(target), name, None)
+    if isinstance(holder, DelegateHolder):
+        value = getattr(target, "__dict__", {}).get(name)
+        return value() if holder.weak and value is not None else value
+    return getattr(target, name, None)
+
+
+def swap_delegate(obj: Any, key: str, new: Any) -> Any:
+    """Replaces the delegate `key` of the composed instance `obj` with `new`.
+
+    It is equivalent to assigning the delegate attribute (e.g. `obj._pool = new`), which is safe since every forwarder
+    looks the delegate up at each access: bound methods cached for `key` (see `delegatee(..., cache_bound=True)`) are
+    dropped in time proportional to the number of methods forwarded to it, and delegates held by weak reference (or
+    constructed on first access) are stored accordingly.
+
+    Usage:
+
+    ```python
+    from compclasses import swap_delegate
+
+    old_pool = swap_delegate(service, "_pool", Pool(size=16))
+    old_pool.close()
+    ```
+
+    Arguments:
+        obj: Composed instance.
+        key: Name of the delegate, possibly a dotted path (e.g. `"_foo.bar"`).
+        new: The new delegate.
+
+    Returns:
+        The previous delegate, or `None` if it was not set.
+
+    Raises:
+        ValueError: if `key` is not a delegate of the class of `obj`.
+    """
+    delegates = getattr(type(obj), DELEGATES_ATTR, {})
+    if key not in delegates:
+        raise ValueError(f"'{key}' is not a delegate of '{type(obj).__name__}'")
+
+    path, _, name = key.rpartition(".")
+    target = attrgetter(path)(obj) if path else obj
+    previous = _current(target, name)
+    setattr(target, name, new)
+
+    value = delegates[key]
+    if isinstance(value, delegatee) and value._cache_bound:  # e.g. dotted paths, or hooks overridden by a subclass
+        invalidate_bound_methods(obj, key)
+    return previous
@@ -0,0 +1,68 @@
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
+
+from compclasses._attribute import is_writable_attribute
+from compclasses._bound import _class_attr
+from compclasses._conflicts import Dispatcher
+from compclasses._delegatee import delegatee
+from compclasses._inheritance import DELEGATES_ATTR
+from compclasses._lazy import materialize
+from compclasses._spec import _spec
+
+# Kinds of forwarded names which cannot be written via `update`, see `compclasses._spec.classify`.
+_NOT_WRITABLE_KINDS = ("dunder", "method", "classmethod", "staticmethod")
+
+
+def update(obj: Any, /, **kwargs: Any) -> None:
+    """Sets many forwarded attributes of the composed instance `obj` at once, writing them to the delegates.
+
+    Names are grouped by delegate, so that each delegate is looked up once, and every name is validated before any
+    write happens, hence either all or none of the attributes are set (unless the delegates themselves raise).
+    Fan-out delegates have each attribute set on every member.
+
+    Usage:
+
+    ```python
+    from compclasses import update
+
+    update(baz, timeout=10, retries=3)  # same as baz.timeout = 10; baz.retries = 3
+    ```
+
+    Arguments:
+        obj: Composed instance.
+        **kwargs: Forwarded names (including prefix and suffix) and the values to set.
+
+    Raises:
+        AttributeError: if any name is not a forwarded attribute of `obj`, or it is read-only.
+    """
+    cls = type(obj)
+    spec = _spec(obj)
+
+    writes: Dict[str, List[Tuple[str, Any]]] = {}
+    dispatched: List[Tuple[str, Any]] = []  # names forwarded to the first delegate accepting them, see `Dispatcher`
+    for name, value in kwargs.items():
+        delegation = spec.get(name)
+        if delegation is None or delegation.kind in _NOT_WRITABLE_KINDS:
+            raise AttributeError(f"'{cls.__name__}' object has no forwarded attribute '{name}'")
+
+        materialize(cls, name)  # no-op unless composed with `lazy=True`
+        descriptor = _class_attr(cls, name)
+        if isinstance(descriptor, Dispatcher):
+            dispatched.append((name, value))
+            continue
+        if not is_writable_attribute(descriptor):
+            raise AttributeError(f"Forwarded attribute '{name}' of '{cls.__name__}' object is read-only")
+
+        writes.setdefault(delegation.delegatee_name, []).append((delegation.attr_name, value))
+
+    delegates = getattr(cls, DELEGATES_ATTR, {})
+    for delegatee_name, pairs in writes.items():
+        target = attrgetter(delegatee_name)(obj)
+        delegatee_instance = delegates.get(delegatee_name)
+        is_fanout = isinstance(delegatee_instance, delegatee) and delegatee_instance._fanout
+        members = target if is_fanout else (target,)
+        for member in members:
+            for attr_name, value in pairs:
+                setattr(member, attr_name, value)
+    for name, value in dispatched:
+        setattr(obj, name, value)
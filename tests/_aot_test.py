@@ -0,0 +1,189 @@
+import ast
+import asyncio
+import importlib
+import inspect
+import sys
+
+import pytest
+
+from compclasses import _aot, compclass, delegatee
+from compclasses.__main__ import main
+
+SOURCE = '''
+from compclasses import CompclassMeta, compclass, delegatee
+
+
+class Point:
+    scale_default = 2
+
+    def __init__(self, x):
+        self.x = x
+
+    def scale(self, factor=2, *, offset=0.0):
+        """Scales x"""
+        return self.x * factor + offset
+
+    async def fetch(self):
+        return self.x
+
+    @staticmethod
+    def origin():
+        return 0
+
+    def __len__(self):
+        return 2
+
+
+@compclass(
+    delegates={"_point": delegatee(Point, ("x", "scale", "fetch", "scale_default", "__len__"), prefix="__PREFIX__")},
+    compiled=True,
+)
+class Composed:
+    def __init__(self, x):
+        self._point = Point(x)
+
+
+class Items(metaclass=CompclassMeta, delegates={"_items": delegatee(list, ("append",), protocols=("sequence",))}):
+    def __init__(self):
+        self._items = []
+
+
+@compclass(delegates={"_point": delegatee(Point, ("origin",))})
+class WithStatic:
+    pass
+
+
+@compclass(delegates={"_point": ("x",)}, slots=True)
+class Slotted:
+    pass
+'''
+
+
+@pytest.fixture
+def sample(tmp_path, monkeypatch):
+    """Writes a module with composed classes, returning a function to (re)write it with a given prefix"""
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(prefix: str = "p_") -> str:
+        (tmp_path / "aot_sample.py").write_text(SOURCE.replace("__PREFIX__", prefix))
+        importlib.invalidate_caches()
+        return "aot_sample"
+
+    yield write
+
+    for name in ("aot_sample", f"aot_sample{_aot.ARTIFACT_SUFFIX}"):
+        sys.modules.pop(name, None)
+    _aot._artifacts.pop("aot_sample", None)
+
+
+def test_build(sample):
+    """Test generated module and stub, and that composed classes take their descriptors from it"""
+    module_name = sample()
+    source_path, stub_path, skipped = _aot.build(module_name)
+
+    assert source_path.name == "aot_sample_compclasses.py" and stub_path.name == "aot_sample_compclasses.pyi"
+    assert set(skipped) == {"WithStatic"}
+    assert "staticmethod" in skipped["WithStatic"]
+
+    stub = stub_path.read_text()
+    ast.parse(stub)
+    assert "def p_scale(self, factor=2, *, offset=0.0) -> Any: ..." in stub
+    assert "async def p_fetch(self) -> Any: ..." in stub
+    assert "def __getitem__(self, key) -> Any: ..." in stub
+
+    module = importlib.reload(sys.modules[module_name])
+    artifact_name = f"{module_name}{_aot.ARTIFACT_SUFFIX}"
+    assert module.Composed.__dict__["p_scale"].__code__.co_filename == str(source_path)
+    assert module.Items.__dict__["__len__"].__module__ == artifact_name
+
+    p_scale = module.Composed.p_scale
+    assert (p_scale.__doc__, p_scale.__module__, p_scale.__name__) == ("Scales x", module_name, "p_scale")
+    assert p_scale.__wrapped__ is module.Point.scale
+    assert inspect.signature(p_scale) == inspect.signature(module.Point.scale)
+
+    obj = module.Composed(3)
+    assert (obj.p_x, obj.p_scale(), obj.p_scale(3, offset=1.0), obj.p_scale_default, len(obj)) == (3, 6, 10.0, 2, 2)
+    assert asyncio.run(obj.p_fetch()) == 3
+
+    items = module.Items()
+    items.append(1)
+    assert (len(items), items[0], list(items)) == (1, 1, [1])
+
+
+def test_outdated_artifact(sample):
+    """Test that artifacts generated from another delegation specification are ignored"""
+    module_name = sample(prefix="p_")
+    source_path, _, _ = _aot.build(module_name)
+
+    sample(prefix="q_")
+    module = importlib.reload(sys.modules[module_name])
+
+    assert module.Composed.__dict__["q_scale"].__code__.co_filename != str(source_path)
+    assert module.Composed(3).q_scale(offset=1.0) == 7.0
+
+
+def test_spec_hash():
+    """Test that the hash changes with the delegatee class members, and it is `None` if they are only known later"""
+
+    class Point:
+        """Delegatee class"""
+
+        def scale(self, factor):
+            """Returns factor"""
+            return factor
+
+    class Other:
+        """Delegatee class with a different signature"""
+
+        def scale(self, factor=2):
+            """Returns factor, with a default"""
+            return factor
+
+    digest = _aot.spec_hash({"_p": delegatee(Point, ("scale",))}, compiled=True)
+    assert digest == _aot.spec_hash({"_p": delegatee(Point, ("scale",))}, compiled=True)
+    assert digest != _aot.spec_hash({"_p": delegatee(Point, ("scale",))}, compiled=False)
+    assert digest != _aot.spec_hash({"_p": delegatee(Other, ("scale",))}, compiled=True)
+
+    assert _aot.spec_hash({"_p": delegatee(Point, ("*",), lazy=True)}, compiled=False) is None
+    assert _aot.spec_hash({"_p": delegatee(Point, ("scale",), fanout=True)}, compiled=False) is None
+
+
+def test_spec_hash_flatten():
+    """Test that the hash of flattened names changes with the delegation of the inner composed class"""
+
+    class Point:
+        """Delegatee class"""
+
+        def scale(self, factor):
+            """Returns factor"""
+            return factor
+
+    def middle(delegate_name: str) -> type:
+        """Returns a composed class forwarding `scale` to its delegate `delegate_name`"""
+
+        @compclass(delegates={delegate_name: delegatee(Point, ("scale",))})
+        class Middle:
+            """Composed delegatee class"""
+
+        return Middle
+
+    def digest(middle_cls: type, flatten: bool = True) -> str:
+        """Returns the hash of a delegation to `middle_cls`"""
+        return _aot.spec_hash({"_m": delegatee(middle_cls, ("scale",), flatten=flatten)}, compiled=True)
+
+    flattened, other_delegate = middle("_point"), middle("_other")
+    assert digest(flattened) == digest(middle("_point"))
+    assert digest(flattened) != digest(other_delegate)
+    assert digest(flattened, flatten=False) == digest(other_delegate, flatten=False)
+
+    source, _ = _aot._emit("scale", "_m", delegatee(flattened, ("scale",), flatten=True), "scale", lambda self: None)
+    assert "self._m._point.scale" in "\n".join(source)
+
+
+def test_main(sample, capsys):
+    """Test the command line entry point"""
+    assert main(["build", sample()]) == 0
+
+    captured = capsys.readouterr()
+    assert "aot_sample: generated" in captured.out
+    assert "WithStatic is not prebuilt" in captured.err
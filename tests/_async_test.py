@@ -0,0 +1,141 @@
+import asyncio
+import inspect
+
+import pytest
+
+from compclasses import CompclassMeta, acall_all, compclass, delegatee
+from compclasses._async import is_async_method
+from compclasses._attribute import DelegatedAttribute
+
+
+class Service:
+    """Delegatee class with coroutine methods and async protocols"""
+
+    def __init__(self, value: int = 1):
+        self.value = value
+        self.entered = False
+
+    async def fetch(self, x: int, *, scale: int = 1) -> int:
+        """Coroutine method with a keyword-only argument"""
+        await asyncio.sleep(0)
+        return (self.value + x) * scale
+
+    def sync_fetch(self, x: int) -> int:
+        """Plain method"""
+        return self.value + x
+
+    async def __aenter__(self):
+        self.entered = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.entered = False
+
+    def __aiter__(self):
+        self._remaining = list(range(self.value))
+        return self
+
+    async def __anext__(self):
+        if not self._remaining:
+            raise StopAsyncIteration
+        return self._remaining.pop(0)
+
+
+DELEGATES = {
+    "_service": delegatee(Service, ("fetch", "sync_fetch", "__aenter__", "__aexit__", "__aiter__", "__anext__"))
+}
+
+
+@pytest.mark.parametrize(
+    "attr_name, expected",
+    [("fetch", True), ("sync_fetch", False), ("__aenter__", True), ("__aiter__", True), ("value", False)],
+)
+def test_is_async_method(attr_name, expected):
+    """Test for is_async_method function"""
+    assert is_async_method(Service, attr_name) is expected
+    assert is_async_method(None, attr_name) is False
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_async_forwarders(compiled: bool):
+    """Test that coroutine methods are forwarded by native coroutine functions, also without compiled mode"""
+
+    @compclass(delegates=DELEGATES, verbose=False, compiled=compiled)
+    class Composed:
+        """Composed class forwarding coroutine methods"""
+
+        def __init__(self, service: Service):
+            self._service = service
+
+    assert inspect.iscoroutinefunction(Composed.__dict__["fetch"])
+    assert inspect.signature(Composed.fetch) == inspect.signature(Service.fetch)
+    assert isinstance(Composed.__dict__["sync_fetch"], DelegatedAttribute) is not compiled
+
+    obj = Composed(Service(value=2))
+    assert asyncio.run(obj.fetch(1, scale=10)) == 30
+    assert obj.sync_fetch(1) == 3
+
+
+def test_async_protocols():
+    """Test async context manager and async iterator protocols"""
+
+    class Composed(metaclass=CompclassMeta, delegates=DELEGATES, verbose=False):
+        """Composed class forwarding async protocols"""
+
+        def __init__(self, service: Service):
+            self._service = service
+
+    async def main():
+        """Enters and iterates over composed instances"""
+        service = Service(value=3)
+        async with Composed(service) as entered:
+            assert entered is service
+            assert service.entered
+        assert not service.entered
+
+        return [x async for x in Composed(service)]
+
+    assert asyncio.run(main()) == [0, 1, 2]
+
+
+def test_async_fanout():
+    """Test that coroutine methods of fan-out delegates are awaited concurrently"""
+
+    @compclass(delegates={"services": delegatee(Service, ("fetch",), fanout=True, reduce=sum)}, verbose=False)
+    class Pool:
+        """Composed class forwarding a coroutine method to every service"""
+
+        def __init__(self, services):
+            self.services = services
+
+    pool = Pool([Service(1), Service(2)])
+    assert inspect.iscoroutinefunction(Pool.fetch)
+    assert asyncio.run(pool.fetch(1)) == 5
+
+
+def test_acall_all():
+    """Test for acall_all function"""
+
+    @compclass(delegates=DELEGATES, verbose=False)
+    class Composed:
+        """Composed class forwarding coroutine methods"""
+
+        def __init__(self, service: Service):
+            self._service = service
+
+    objs = [Composed(Service(value=i)) for i in range(3)]
+    assert asyncio.run(acall_all(objs, "fetch", 1, scale=2)) == (2, 4, 6)
+
+    class Failing:
+        """Class whose coroutine method always raises"""
+
+        async def fetch(self, x):
+            """Raises ValueError"""
+            raise ValueError(x)
+
+    results = asyncio.run(acall_all([*objs, Failing()], "fetch", 1, return_exceptions=True))
+    assert results[:3] == (1, 2, 3)
+    assert isinstance(results[3], ValueError)
+
+    with pytest.raises(ValueError):
+        asyncio.run(acall_all([Failing()], "fetch", 1))
@@ -0,0 +1,76 @@
+import tracemalloc
+
+import pytest
+
+from compclasses import compclass, delegatee
+from compclasses._attribute import DelegatedAttribute, delegated_attribute
+from compclasses._core import property_from_delegator
+
+
+class Point:
+    """Delegatee class"""
+
+    def __init__(self, x: float):
+        self.x = x
+
+
+@pytest.mark.parametrize("writable", [True, False])
+def test_delegated_attribute(writable: bool):
+    """Test get, set and delete forwarding, unless read-only"""
+
+    class Composed:
+        """Class forwarding an attribute of its Point delegate"""
+
+        p_x = delegated_attribute("_point", "x", writable=writable)
+
+        def __init__(self, x: float):
+            self._point = Point(x)
+
+    obj = Composed(1.0)
+    assert obj.p_x == 1.0
+    assert isinstance(Composed.p_x, DelegatedAttribute)
+
+    if writable:
+        obj.p_x = 2.0
+        assert obj._point.x == 2.0
+        del obj.p_x
+        assert not hasattr(obj._point, "x")
+    else:
+        with pytest.raises(AttributeError, match="'_point.x' of 'Composed' object is read-only"):
+            obj.p_x = 2.0
+        with pytest.raises(AttributeError, match="is read-only"):
+            del obj.p_x
+
+
+def test_interning():
+    """Test that identical descriptors are shared by classes, whatever their prefix"""
+    delegates = {"_point": delegatee(Point, ("x",))}
+    First = compclass(type("First", (), {}), delegates=delegates)
+    Second = compclass(type("Second", (), {}), delegates={"_point": delegatee(Point, ("x",), prefix="p_")})
+
+    assert First.__dict__["x"] is Second.__dict__["p_x"] is delegated_attribute("_point", "x")
+    assert delegated_attribute("_point", "x", writable=False) is not delegated_attribute("_point", "x")
+    assert delegated_attribute("_point", "y") is not delegated_attribute("_point", "x")
+
+
+def _traced_size(factory, n_classes: int, n_names: int) -> int:
+    """Returns the memory allocated to create the forwarding descriptors of `n_classes` classes"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        descriptors = [[factory(f"attr_{j}") for j in range(n_names)] for _ in range(n_classes)]
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(descriptors) == n_classes
+    return size
+
+
+def test_memory():
+    """Test that interned descriptors allocate a fraction of the memory of properties and closures"""
+    n_classes, n_names = 50, 300
+
+    properties = _traced_size(lambda name: property_from_delegator("_point", name, name), n_classes, n_names)
+    attributes = _traced_size(lambda name: delegated_attribute("_point", name), n_classes, n_names)
+
+    assert attributes * 10 < properties
@@ -0,0 +1,129 @@
+import pytest
+
+from compclasses import call_all, compclass, delegatee, gather, reset_stats, scatter, stats
+from compclasses._batch import _delegate_path
+
+
+class Point:
+    """Delegatee class"""
+
+    def __init__(self, x: float, label: str = ""):
+        self.x = x
+        self.label = label
+
+    def scale(self, factor: float) -> float:
+        """Returns x multiplied by factor"""
+        return self.x * factor
+
+
+DELEGATES = {"_point": delegatee(Point, ("x", "label", "scale"), prefix="p_", readonly=("label",))}
+
+
+def make_cls(**options):
+    """Creates a class composed over Point"""
+
+    @compclass(delegates=DELEGATES, **options)
+    class Composed:
+        """Composed class forwarding names of Point"""
+
+        def __init__(self, x: float, label: str = ""):
+            self._point = Point(x, label)
+
+    return Composed
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("compiled", [True, False])
+def test_delegate_path(lazy: bool, compiled: bool):
+    """Test that names are resolved to their delegate source only for a single composed class"""
+    Composed = make_cls(lazy=lazy, compiled=compiled)
+    objs = [Composed(1.0), Composed(2.0)]
+
+    assert _delegate_path(objs, "p_x", ("attribute", "property")) == ("_point", "x")
+    assert _delegate_path(objs, "p_scale", ("method",)) == ("_point", "scale")
+    assert _delegate_path(objs, "p_scale", ("attribute", "property")) is None
+    assert _delegate_path(objs, "unknown", ("attribute", "property")) is None
+    assert _delegate_path([*objs, make_cls()(3.0)], "p_x", ("attribute", "property")) is None
+
+    class Overridden(Composed):
+        """Subclass overriding a forwarded name"""
+
+        @property
+        def p_x(self):
+            return -1
+
+    assert _delegate_path([Overridden(1.0)], "p_x", ("attribute", "property")) is None
+    assert gather([Overridden(1.0)], "p_x", as_array=False) == [-1]
+
+
+def test_delegate_path_instrumented():
+    """Test that instrumented classes go through their descriptors, so that stats are recorded"""
+    Composed = make_cls(instrument=True)
+    objs = [Composed(1.0), Composed(2.0)]
+
+    reset_stats()
+    assert _delegate_path(objs, "p_x", ("attribute", "property")) is None
+    assert gather(objs, "p_x", as_array=False) == [1.0, 2.0]
+    assert sum(call_stats.calls for key, call_stats in stats().items() if key[2] == "x") == 2
+
+
+def test_gather_scatter_call_all():
+    """Test batched access, both for a single class and for mixed objects"""
+    Composed, Other = make_cls(), make_cls()
+    objs = [Composed(1.0, "a"), Composed(2.0, "b")]
+
+    assert gather(objs, "p_x", as_array=False) == [1.0, 2.0]
+    assert gather(iter(objs), "p_label") == ["a", "b"]
+    assert call_all(objs, "p_scale", 2) == (2.0, 4.0)
+    assert call_all(objs, "p_scale", factor=3) == (3.0, 6.0)
+
+    scatter(objs, "p_x", (10.0, 20.0))
+    assert [obj._point.x for obj in objs] == [10.0, 20.0]
+
+    mixed = [Composed(1.0), Other(2.0)]
+    scatter(mixed, "p_x", iter([3.0, 4.0]))
+    assert gather(mixed, "p_x", as_array=False) == [3.0, 4.0]
+    assert call_all(mixed, "p_scale", 2) == (6.0, 8.0)
+
+
+@pytest.mark.parametrize(
+    "name, values, context",
+    [
+        ("p_x", [1.0], pytest.raises(ValueError, match="Got 2 objects but 1 values")),
+        ("p_label", ["a", "b"], pytest.raises(AttributeError, match="is read-only")),
+    ],
+)
+def test_scatter_raise(name, values, context):
+    """Test scatter errors"""
+    Composed = make_cls()
+    with context:
+        scatter([Composed(1.0), Composed(2.0)], name, values)
+
+
+def test_gather_array():
+    """Test that NumPy arrays are returned for numeric values, if NumPy is installed"""
+    np = pytest.importorskip("numpy")
+
+    Composed = make_cls()
+    objs = [Composed(1.0, "a"), Composed(2.0, "b")]
+
+    values = gather(objs, "p_x")
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == [1.0, 2.0]
+    assert gather(objs, "p_label") == ["a", "b"]
+    assert isinstance(gather(objs, "p_label", as_array=True), np.ndarray)
+
+    scatter(objs, "p_x", values * 2)
+    assert gather(objs, "p_x").tolist() == [2.0, 4.0]
+
+
+def test_gather_without_numpy(monkeypatch):
+    """Test that lists are returned if NumPy is not installed, unless arrays are explicitly requested"""
+    monkeypatch.setattr("compclasses._batch.np", None)
+
+    Composed = make_cls()
+    objs = [Composed(1.0), Composed(2.0)]
+
+    assert gather(objs, "p_x") == [1.0, 2.0]
+    with pytest.raises(ImportError, match="NumPy is required"):
+        gather(objs, "p_x", as_array=True)
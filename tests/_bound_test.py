@@ -0,0 +1,139 @@
+import copy
+import pickle
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, reset_stats, stats
+from compclasses._bound import BoundMethodCache
+
+
+class Counter:
+    """Delegatee class with a mutable state"""
+
+    def __init__(self, start: int = 0):
+        self.value = start
+
+    def increment(self, step: int = 1) -> int:
+        """Increments the value by step and returns it"""
+        self.value += step
+        return self.value
+
+    def __len__(self) -> int:
+        return self.value
+
+
+DELEGATES = {"_counter": delegatee(Counter, ("increment", "value", "__len__"), cache_bound=True)}
+
+
+@compclass(delegates=DELEGATES, pickling={"_counter": "copy"})
+class Picklable:
+    """Composed class copying its cached delegate when pickled"""
+
+    def __init__(self, counter: Counter):
+        self._counter = counter
+
+
+def test_cache_bound_fanout():
+    """Test that cache_bound is not supported with fanout"""
+    with pytest.raises(ValueError, match="cache_bound and protocols parameters are not supported with fanout=True"):
+        delegatee(Counter, ("increment",), fanout=True, cache_bound=True)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("lazy", [True, False])
+def test_cache_bound(compiled: bool, lazy: bool):
+    """Test that bound methods are cached per instance, while attributes and dunders are forwarded as usual"""
+
+    @compclass(delegates=DELEGATES, compiled=compiled, lazy=lazy)
+    class Composed:
+        """Composed class caching the bound methods of its delegate"""
+
+        def __init__(self, counter: Counter):
+            self._counter = counter
+
+    obj = Composed(Counter())
+
+    assert obj.increment() == 1
+    assert isinstance(Composed.__dict__["increment"], BoundMethodCache)
+    assert "increment" in vars(obj)
+    assert obj.increment is obj.increment  # no new bound method is allocated
+    assert obj.increment(2) == obj.value == len(obj) == 3
+
+    other = Composed(Counter(10))
+    assert other.increment() == 11
+    assert obj.increment() == 4
+
+
+@pytest.mark.parametrize("slots", [True, False])
+def test_cache_bound_invalidation(slots: bool):
+    """Test that cached bound methods are dropped when the delegate is reassigned or deleted"""
+
+    class Composed(metaclass=CompclassMeta, delegates=DELEGATES, slots=slots):
+        """Composed class caching the bound methods of its delegate"""
+
+        def __init__(self, counter: Counter):
+            self._counter = counter
+
+    obj = Composed(Counter())
+    assert obj.increment() == 1
+
+    obj._counter = Counter(100)
+    assert obj.increment() == 101
+    assert obj.increment.__self__ is obj._counter
+
+    del obj._counter
+    with pytest.raises(AttributeError):
+        obj.increment()
+
+
+def test_cache_bound_custom_setattr():
+    """Test that the invalidation hooks fall back to the ones defined by the class"""
+
+    @compclass(delegates=DELEGATES)
+    class Composed:
+        """Composed class defining its own __setattr__"""
+
+        def __init__(self, counter: Counter):
+            self._counter = counter
+
+        def __setattr__(self, name, value):
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, "last_set", name)
+
+    obj = Composed(Counter())
+    assert obj.increment() == 1
+
+    obj._counter = Counter(5)
+    assert obj.last_set == "_counter"
+    assert obj.increment() == 6
+
+
+def test_cache_bound_instrument():
+    """Test that instrumented cached bound methods record each call"""
+
+    @compclass(delegates=DELEGATES, instrument=True)
+    class Instrumented:
+        """Instrumented composed class caching the bound methods of its delegate"""
+
+        def __init__(self, counter: Counter):
+            self._counter = counter
+
+    reset_stats()
+    obj = Instrumented(Counter())
+    for _ in range(3):
+        obj.increment()
+
+    key = (f"{__name__}.test_cache_bound_instrument.<locals>.Instrumented", "_counter", "increment", "call")
+    assert stats()[key].calls == 3
+
+
+def test_cache_bound_pickling():
+    """Test that cached bound methods are not serialised, and are resolved against the copied delegate"""
+    obj = Picklable(Counter())
+    obj.increment()
+
+    for clone in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj)):
+        assert "increment" not in vars(clone)
+        assert clone.increment() == 2
+        assert clone.increment.__self__ is clone._counter
+        assert obj.value == 1
@@ -0,0 +1,87 @@
+from unittest import mock
+
+import pytest
+
+from compclasses import CompclassMeta, cache_info, clear_cache, compclass, delegatee
+from compclasses._cache import CacheInfo, LRUCache
+
+
+def test_lru_cache():
+    """Test LRUCache hits, misses and eviction"""
+    cache = LRUCache(maxsize=2)
+    func = mock.Mock(side_effect=lambda: object())
+
+    first = cache.get_or_compute("a", func)
+    assert cache.get_or_compute("a", func) is first
+    cache.get_or_compute("b", func)
+    cache.get_or_compute("a", func)  # "a" becomes the most recently used
+    cache.get_or_compute("c", func)  # evicts "b"
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert func.call_count == 3
+    assert cache.info() == CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test_lru_cache_maxsize(maxsize: int):
+    """Test LRUCache raises for non positive maxsize"""
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=maxsize)
+
+
+def test_lru_cache_unhashable_and_errors():
+    """Test that unhashable keys and failing computations are not cached"""
+    cache = LRUCache()
+
+    assert cache.get_or_compute(["unhashable"], lambda: 1) == 1
+    assert len(cache) == 0
+
+    with pytest.raises(KeyError):
+        cache.get_or_compute("key", mock.Mock(side_effect=KeyError))
+    assert "key" not in cache
+
+
+def test_delegatee_cache(foo_cls):
+    """Test that parsing and validation run once per (delegatee_cls, attrs)"""
+    clear_cache()
+
+    parse_patch = mock.patch.object(delegatee, "_parse_attrs", return_value=("a",))
+    validate_patch = mock.patch.object(delegatee, "_validate_delegatee_methods", return_value=None)
+
+    with parse_patch as parse_mock, validate_patch as validate_mock:
+        for _ in range(3):
+            delegatee(foo_cls, ("*",), validate=True)
+
+    assert parse_mock.call_count == 1
+    assert validate_mock.call_count == 1
+    assert cache_info()["attrs"].hits == 2
+    assert cache_info()["validation"].hits == 2
+
+
+def test_descriptors_cache(foo_cls, bar_cls):
+    """Test that composed classes with the same delegates share the generated descriptors"""
+    clear_cache()
+    delegates = {"foo": delegatee(foo_cls, ("*", "__len__"), prefix="pfx_")}
+
+    @compclass(delegates=delegates, verbose=False)
+    class Baz1:
+        """Baz1 class"""
+
+    class Baz2(metaclass=CompclassMeta, delegates=delegates, verbose=False):
+        """Baz2 class"""
+
+    assert Baz1.__dict__["pfx_get_foo"] is Baz2.__dict__["pfx_get_foo"]
+    assert cache_info()["descriptors"] == CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+    # Different prefix => different descriptors
+    @compclass(delegates={"foo": delegatee(foo_cls, ("*", "__len__"), prefix="other_")}, verbose=False)
+    class Baz3:
+        """Baz3 class"""
+
+    assert cache_info()["descriptors"].misses == 2
+
+    clear_cache()
+    assert all(info.currsize == 0 for info in cache_info().values())
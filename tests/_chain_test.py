@@ -0,0 +1,203 @@
+import asyncio
+import dis
+import inspect
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee
+from compclasses._attribute import DelegatedAttribute
+from compclasses._chain import Chain, flatten_chain
+
+
+class Engine:
+    """Innermost delegatee class"""
+
+    def __init__(self, power: int = 100):
+        self.power = power
+
+    def start(self, gear: int, *, boost: bool = False) -> str:
+        """Returns the power, the gear and whether boosted"""
+        return f"{self.power}:{gear}:{boost}"
+
+    async def astart(self) -> int:
+        """Returns the power"""
+        return self.power
+
+    @property
+    def double(self) -> int:
+        return self.power * 2
+
+
+ATTRS = ("power", "start", "astart", "double")
+
+
+def make_chain(depth: int, **options) -> type:
+    """Creates `depth` composed classes, each delegating `ATTRS` to the previous one (the first to `Engine`)"""
+    inner = Engine
+    for level in range(depth):
+
+        def __init__(self, inner=inner):
+            self._inner = inner()
+
+        inner = compclass(
+            type(f"Level{level}", (), {"__init__": __init__}),
+            delegates={"_inner": delegatee(inner, ATTRS, flatten=True)},
+            **options,
+        )
+    return inner
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("depth", [2, 3, 5])
+def test_flattened(depth: int, compiled: bool):
+    """Test that outermost descriptors forward to the innermost delegate directly"""
+    cls = make_chain(depth, compiled=compiled)
+    path = ".".join(["_inner"] * depth)
+
+    power = cls.__dict__["power"]
+    assert isinstance(power, DelegatedAttribute)
+    assert (power.delegatee_name, power.attr_name) == (path, "power")
+
+    start = cls.__dict__["start"]
+    if compiled:
+        assert [i.argval for i in dis.get_instructions(start) if i.argval in ("_inner", "start")] == [
+            *(["_inner"] * depth),
+            "start",
+        ]
+        assert inspect.iscoroutinefunction(cls.__dict__["astart"])
+    else:
+        assert start.delegatee_name == path
+
+    obj = cls()
+    assert (obj.power, obj.start(1, boost=True), obj.double) == (100, "100:1:True", 200)
+    assert asyncio.run(obj.astart()) == 100
+
+    obj.power = 1
+    assert (obj.double, obj._inner.power) == (2, 1)
+    del obj.power
+    assert not hasattr(obj, "power")
+
+
+def test_opt_in():
+    """Test that chains are flattened only with `flatten=True`, the delegate of a runtime subclass being bypassed"""
+    middle = make_chain(1)
+
+    class Turbo(middle):
+        """Subclass of the middle class overriding a forwarded name"""
+
+        @property
+        def power(self):
+            return 0
+
+    @compclass(delegates={"_middle": delegatee(middle, ("power",))})
+    class Plain:
+        """Composed class whose chain is not flattened"""
+
+        def __init__(self):
+            self._middle = Turbo()
+
+    @compclass(delegates={"_middle": delegatee(middle, ("power",), flatten=True)})
+    class Flattened:
+        """Composed class whose chain is flattened"""
+
+        def __init__(self):
+            self._middle = Turbo()
+
+    assert Plain.__dict__["power"].delegatee_name == "_middle"
+    assert Plain().power == 0
+    assert Flattened.__dict__["power"].delegatee_name == "_middle._inner"
+    assert Flattened().power == 100  # `Turbo.power` is bypassed, the delegate must be a `Level0` exactly
+
+
+def test_metaclass():
+    """Test that classes composed with `CompclassMeta` are flattened as well"""
+
+    class Car(metaclass=CompclassMeta, delegates={"_engine": delegatee(Engine, ATTRS)}):
+        """Composed class forwarding names of Engine"""
+
+        def __init__(self):
+            self._engine = Engine()
+
+    class Driver(metaclass=CompclassMeta, delegates={"_car": delegatee(Car, ("power",), prefix="car_", flatten=True)}):
+        """Composed class forwarding a name through Car"""
+
+        def __init__(self):
+            self._car = Car()
+
+    assert Driver.__dict__["car_power"].delegatee_name == "_car._engine"
+    assert Driver().car_power == 100
+
+
+def test_readonly():
+    """Test that flattened attributes are read-only if any hop is"""
+
+    @compclass(delegates={"_engine": delegatee(Engine, ("power",), readonly=True)})
+    class Car:
+        """Composed class forwarding a read-only attribute of Engine"""
+
+        def __init__(self):
+            self._engine = Engine()
+
+    @compclass(delegates={"_car": delegatee(Car, ("power",), flatten=True)})
+    class Driver:
+        """Composed class forwarding the attribute through Car"""
+
+        def __init__(self):
+            self._car = Car()
+
+    with pytest.raises(AttributeError, match="'_car._engine.power' of 'Driver' object is read-only"):
+        Driver().power = 1
+
+
+def test_max_depth():
+    """Test that the path of flattened forwarders is bounded"""
+    cls = make_chain(4)
+
+    assert flatten_chain("_inner", cls, "power", max_depth=1) == Chain("_inner", cls, "power", True)
+    chain = flatten_chain("_inner", cls, "power", max_depth=3)
+    assert chain.delegatee_name == "_inner._inner._inner"
+    assert chain.delegatee_cls.__name__ == "Level1"
+
+
+def test_cycle():
+    """Test that a class forwarding a name to a delegate of its own type stops the chain"""
+
+    class Node:
+        """Class forwarding a name to a delegate of its own type"""
+
+        value = 0
+
+    Node = compclass(Node, delegates={"_next": delegatee(Node, ("value",))})
+
+    assert flatten_chain("_node", Node, "value") == Chain("_node", Node, "value", True)
+
+    Linked = compclass(type("Linked", (), {}), delegates={"_node": delegatee(Node, ("value",), flatten=True)})
+    assert Linked.__dict__["value"].delegatee_name == "_node"
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"instrument": True}, {"lazy": True}, {"delegates": {"_inner": delegatee(Engine, ATTRS, fanout=True)}}],
+)
+def test_not_flattened(options):
+    """Test that names not forwarded through plain generated descriptors are not flattened"""
+    options = dict(options)
+    delegates = options.pop("delegates", {"_inner": delegatee(Engine, ATTRS)})
+    middle = compclass(type("Middle", (), {}), delegates=delegates, **options)
+
+    assert flatten_chain("_middle", middle, "power") == Chain("_middle", middle, "power", True)
+
+
+def test_overridden():
+    """Test that names overridden by a plain subclass of a composed class are not flattened"""
+    middle = make_chain(1)
+
+    class Overridden(middle):
+        """Subclass of the middle class overriding a forwarded name"""
+
+        @property
+        def power(self):
+            return 0
+
+    assert flatten_chain("_middle", Overridden, "power") == Chain("_middle", Overridden, "power", True)
+    assert flatten_chain("_middle", Overridden, "start").delegatee_name == "_middle._inner"
@@ -0,0 +1,204 @@
+import logging
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, resolve, update
+from compclasses._conflicts import Dispatcher, conflict_index
+
+
+class Primary:
+    """Delegatee class"""
+
+    def __init__(self):
+        self.value = "primary"
+
+    def hello(self) -> str:
+        """Says hello from primary"""
+        return "Hello from primary"
+
+    def __len__(self):
+        return 1
+
+
+class Secondary:
+    """Delegatee class"""
+
+    def __init__(self):
+        self.value = "secondary"
+
+    def hello(self) -> str:
+        """Says hello from secondary"""
+        return "Hello from secondary"
+
+    def __len__(self):
+        return 2
+
+
+DELEGATES = {
+    "_primary": delegatee(Primary, ("value", "hello", "__len__")),
+    "_secondary": delegatee(Secondary, ("value", "hello", "__len__")),
+}
+
+
+def compose(conflicts, use_meta: bool, lazy: bool, compiled: bool = False) -> type:
+    """Composes a class over `DELEGATES`, with the decorator or the metaclass"""
+
+    if use_meta:
+
+        class Composed(metaclass=CompclassMeta, delegates=DELEGATES, lazy=lazy, conflicts=conflicts, compiled=compiled):
+            """Composed class whose delegates forward the same names"""
+
+            def __init__(self):
+                self._primary, self._secondary = Primary(), Secondary()
+
+        return Composed
+
+    @compclass(delegates=DELEGATES, lazy=lazy, conflicts=conflicts, compiled=compiled)
+    class Composed:
+        """Composed class whose delegates forward the same names"""
+
+        def __init__(self):
+            self._primary, self._secondary = Primary(), Secondary()
+
+    return Composed
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("use_meta", [True, False])
+@pytest.mark.parametrize(
+    "conflicts, expected",
+    [
+        ("first", "primary"),
+        ("last", "secondary"),
+        (["_secondary"], "secondary"),
+        (("_primary", "_secondary"), "primary"),
+        ("dispatch", "primary"),
+    ],
+)
+def test_policies(conflicts, expected: str, use_meta: bool, lazy: bool):
+    """Test that colliding names are forwarded to the delegate selected by the policy"""
+    cls = compose(conflicts, use_meta, lazy)
+    obj = cls()
+
+    assert obj.value == expected
+    assert obj.hello() == f"Hello from {expected}"
+    assert len(obj) == {"primary": 1, "secondary": 2}[expected]
+    assert resolve(cls, "value").delegatee_name == f"_{expected}"
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_default(caplog, lazy: bool):
+    """Test that by default the last delegate wins and collisions are reported"""
+    with caplog.at_level(logging.WARNING, logger="compclasses"):
+        obj = compose(None, use_meta=False, lazy=lazy)()
+        assert obj.value == "secondary"
+
+    records = [record for record in caplog.records if hasattr(record, "collisions")]
+    assert records
+    assert records[-1].collisions["value" if lazy else "hello"] == ("_primary", "_secondary")
+
+
+@pytest.mark.parametrize("use_meta", [True, False])
+def test_error(use_meta: bool):
+    """Test that collisions raise with `conflicts="error"`, before the class is modified"""
+    with pytest.raises(ValueError, match="forwarded names collide across delegates"):
+        compose("error", use_meta, lazy=False)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("lazy", [True, False])
+def test_dispatch(lazy: bool, compiled: bool):
+    """Test that dispatched names fall back to the next delegate, also when methods are compiled"""
+    cls = compose("dispatch", use_meta=False, lazy=lazy, compiled=compiled)
+    obj = cls()
+    del obj._primary
+
+    assert (obj.value, obj.hello()) == ("secondary", "Hello from secondary")
+    assert isinstance(cls.__dict__["value"], Dispatcher)
+
+    obj.value = "updated"
+    assert obj._secondary.value == "updated"
+    update(obj, value="again")
+    assert obj._secondary.value == "again"
+
+    del obj._secondary
+    with pytest.raises(AttributeError, match="'Composed' object has no attribute 'hello'"):
+        obj.hello
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_dispatch_missing_method(compiled: bool):
+    """Test that dispatched methods fall back to the next delegate when the first one lacks the method"""
+
+    class A:
+        """Delegatee class"""
+
+        def m(self) -> str:
+            """Returns the name of the class"""
+            return "A"
+
+    class B:
+        """Delegatee class"""
+
+        def m(self) -> str:
+            """Returns the name of the class"""
+            return "B"
+
+    @compclass(
+        delegates={"a": delegatee(A, ("m",)), "b": delegatee(B, ("m",))}, conflicts="dispatch", compiled=compiled
+    )
+    class C:
+        """Composed class dispatching m to its delegates"""
+
+        def __init__(self, a):
+            self.a, self.b = a, B()
+
+    obj = C(object())
+    assert (C(A()).m(), obj.m()) == ("A", "B")
+    del obj.a
+    assert obj.m() == "B"
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_shadowing(caplog, lazy: bool):
+    """Test that forwarded names replacing the ones defined in the class body are reported, or raise"""
+
+    class Composed:
+        """Class defining names which are then forwarded"""
+
+        def value(self):
+            """Own method"""
+            return "own"
+
+        def __len__(self):
+            return 0
+
+    with caplog.at_level(logging.WARNING, logger="compclasses"):
+        compclass(Composed, {"_primary": delegatee(Primary, ("value", "__len__"))}, lazy=lazy)
+
+    (record,) = caplog.records
+    assert record.shadowed == (("__len__",) if lazy else ("value", "__len__"))
+
+    with pytest.raises(ValueError, match=r"shadow names defined in the class \['hello'\]"):
+        compclass(type("Other", (), {"hello": None}), {"_primary": delegatee(Primary, ("hello",))}, conflicts="error")
+
+
+@pytest.mark.parametrize(
+    "conflicts, match",
+    [("unknown", "must be one of"), (["_primary", "_other"], r"not delegates: \['_other'\]")],
+)
+def test_invalid_policy(conflicts, match: str):
+    """Test that invalid policies raise"""
+    with pytest.raises(ValueError, match=match):
+        compose(conflicts, use_meta=False, lazy=False)
+
+
+def test_conflict_index():
+    """Test the index of colliding names"""
+    injected = [("a", "_x", "a"), ("p_a", "_y", "a"), ("a", "_y", "a"), ("b", "_z", "b"), ("a", "_z", "a")]
+    index = conflict_index(injected, "dispatch", defined=("b", "c"))
+
+    assert index.collisions == {"a": ("_x", "_y", "_z")}
+    assert index.sources == {"a": (("_x", "a"), ("_y", "a"), ("_z", "a"))}
+    assert index.shadowed == ("b",)
+    assert conflict_index(injected, ["_z", "_y"]).sources == {"a": (("_z", "a"),)}
@@ -0,0 +1,176 @@
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee
+from compclasses._attribute import ClassLevelAttribute
+from compclasses._core import descriptor_from_kind
+
+
+class Config:
+    """Class with every kind of attribute"""
+
+    MAX_SIZE = 10
+    SHADOWED = "class"
+
+    def __init__(self):
+        self.SHADOWED = "instance"
+        self._level = 1
+
+    @staticmethod
+    def double(value: int) -> int:
+        """Static method"""
+        return 2 * value
+
+    @classmethod
+    def name(cls) -> str:
+        """Class method"""
+        return cls.__name__
+
+    @property
+    def level(self) -> int:
+        """Level property"""
+        return self._level
+
+    @level.setter
+    def level(self, value: int):
+        self._level = value
+
+    @level.deleter
+    def level(self):
+        del self._level
+
+    @property
+    def read_only(self) -> int:
+        """Read only property"""
+        return 2 * self._level
+
+
+@pytest.mark.parametrize(
+    "attr_name, kind",
+    [
+        ("double", ClassLevelAttribute),
+        ("name", ClassLevelAttribute),
+        ("level", property),
+        ("read_only", property),
+        ("MAX_SIZE", ClassLevelAttribute),
+        ("SHADOWED", type(None)),
+        ("_level", type(None)),
+    ],
+)
+def test_descriptor_from_kind(attr_name, kind):
+    """Test that the descriptor created depends on the kind of the attribute"""
+    assert isinstance(descriptor_from_kind(Config, "config", attr_name), kind)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("lazy", [True, False])
+def test_compclass_kinds(compiled: bool, lazy: bool):
+    """Test forwarding of staticmethods, classmethods, constants and properties"""
+
+    @compclass(delegates={"config": delegatee(Config, ("*", "MAX_SIZE", "SHADOWED"))}, compiled=compiled, lazy=lazy)
+    class Service:
+        """Composed class forwarding every kind of attribute of Config"""
+
+        def __init__(self):
+            self.config = Config()
+
+    service = Service()
+    assert service.double(3) == 6
+    assert service.name() == "Config"
+    assert service.MAX_SIZE == 10
+    assert service.SHADOWED == "instance"
+
+    # staticmethods, classmethods and constants are available from the composed class itself (once materialised)
+    assert Service.double(2) == 4
+    assert Service.name() == "Config"
+    assert Service.MAX_SIZE == 10
+
+    assert service.level == 1
+    service.level = 5
+    assert service.level == service.config.level == 5
+    assert service.read_only == 10
+    del service.level
+    assert not hasattr(service.config, "_level")
+
+    with pytest.raises(AttributeError):
+        service.read_only = 1
+
+    assert Service.__dict__["level"].__doc__ == "Level property"
+
+
+def test_meta_kinds():
+    """Test forwarding by kind with CompclassMeta"""
+
+    class Service(metaclass=CompclassMeta, delegates={"config": delegatee(Config, ("double", "name", "MAX_SIZE"))}):
+        """Composed class forwarding a staticmethod, a classmethod and a constant"""
+
+        def __init__(self):
+            self.config = Config()
+
+    assert Service.double(2) == 4
+    assert Service.name() == "Config"
+    assert Service.MAX_SIZE == Service().MAX_SIZE == 10
+
+
+def test_constant_captured_at_creation():
+    """Test that class level constants are captured by value for the composed class, while instances read and write
+    the attribute of their delegate"""
+
+    class Settings:
+        """Delegatee class with a class level constant"""
+
+        LIMIT = 1
+
+    @compclass(delegates={"settings": delegatee(Settings, ("LIMIT",))})
+    class Service:
+        """Composed class forwarding the constant"""
+
+        def __init__(self):
+            self.settings = Settings()
+
+    Settings.LIMIT = 2
+    service = Service()
+    assert (Service.LIMIT, service.LIMIT) == (1, 2)
+
+    service.LIMIT = 3
+    assert service.settings.LIMIT == 3
+    assert "LIMIT" not in vars(service)
+
+    del service.LIMIT
+    assert service.LIMIT == 2
+
+
+class CustomConfig(Config):
+    """Subclass of `Config` overriding every kind of attribute"""
+
+    MAX_SIZE = 20
+
+    @staticmethod
+    def double(value: int) -> int:
+        """Static method"""
+        return 3 * value
+
+    @classmethod
+    def name(cls) -> str:
+        """Class method"""
+        return f"Custom{cls.__name__}"
+
+    @property
+    def read_only(self) -> int:
+        """Read only property"""
+        return -self._level
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_runtime_delegate_type(compiled: bool):
+    """Test that instances resolve names on the runtime type of the delegate, and the class on the delegatee class"""
+
+    @compclass(delegates={"config": delegatee(Config, ("double", "name", "read_only", "MAX_SIZE"))}, compiled=compiled)
+    class Service:
+        """Composed class forwarding names of Config"""
+
+        def __init__(self, config: Config):
+            self.config = config
+
+    service = Service(CustomConfig())
+    assert (service.double(2), service.name(), service.read_only, service.MAX_SIZE) == (6, "CustomCustomConfig", -1, 20)
+    assert (Service.double(2), Service.name(), Service.MAX_SIZE) == (4, "Config", 10)
@@ -1,5 +1,6 @@
 import pytest
 
+from compclasses._attribute import DelegatedAttribute
 from compclasses._core import generate_properties
 from compclasses._delegatee import delegatee
 
@@ -33,15 +34,22 @@ def test_generate_properties(capsys, foo_cls, attrs, pfx, sfx):
         },
         verbose=verbose,
         log_func=log_func,
+        cls_name="Baz",
     )
 
+    new_attr_names = []
     for new_attr_name, _to_inject in property_generator:
-        assert isinstance(_to_inject, property)
+        assert isinstance(_to_inject, DelegatedAttribute)
 
         if not delegatee._is_dunder_method(new_attr_name):
             assert new_attr_name.startswith(pfx) and new_attr_name.endswith(sfx)
         else:
             assert new_attr_name.startswith("__") and new_attr_name.endswith("__")
 
-        sys_out = capsys.readouterr().out
-        assert f"Setting {new_attr_name}" in sys_out
+        # Injected names are reported once, after the last one is generated
+        assert capsys.readouterr().out == ""
+        new_attr_names.append(new_attr_name)
+
+    sys_out = capsys.readouterr().out
+    assert sys_out.count("\n") == 1 and sys_out.startswith("Baz: setting ")
+    assert all(f"{new_attr_name} from foo." in sys_out for new_attr_name in new_attr_names)
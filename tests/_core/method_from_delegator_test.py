@@ -0,0 +1,221 @@
+import inspect
+
+import pytest
+
+from compclasses._attribute import ClassLevelAttribute, DelegatedAttribute
+from compclasses._core import generate_properties, method_from_delegator
+from compclasses._delegatee import delegatee
+
+
+@pytest.mark.parametrize(
+    "attr_name, pfx, sfx, method_args",
+    [
+        ("__len__", "", "", tuple()),
+        ("get_foo", "", "", tuple()),
+        ("get_foo", "", "_from_foo_cls", tuple()),
+        ("hello_from_foo", "", "_from_foo_cls", ("GitHub",)),
+    ],
+)
+def test_method_from_delegator(foo_cls, bar_cls, baz_cls, attr_name, pfx, sfx, method_args):
+    """Test for method_from_delegator function"""
+    foo_obj = foo_cls(value=111)
+    bar_obj = bar_cls()
+
+    new_attr_name = f"{pfx}{attr_name}{sfx}"
+    original = foo_cls.__dict__[attr_name]
+    _method_to_inject = method_from_delegator("foo", attr_name, new_attr_name, original)
+
+    assert inspect.isfunction(_method_to_inject)
+    assert _method_to_inject.__name__ == new_attr_name
+    assert _method_to_inject.__wrapped__ is original
+    assert _method_to_inject.__doc__ == original.__doc__
+    assert inspect.signature(_method_to_inject) == inspect.signature(original)
+
+    Baz = baz_cls
+    setattr(Baz, new_attr_name, _method_to_inject)
+    baz_obj = Baz(foo_obj, bar_obj)
+
+    assert getattr(baz_obj, new_attr_name)(*method_args) == getattr(foo_obj, attr_name)(*method_args)
+
+
+def test_method_from_delegator_kwargs(foo_cls, bar_cls, baz_cls):
+    """Test that keyword arguments (including one called `self`) are forwarded as-is"""
+
+    class Foo(foo_cls):
+        """Foo subclass with a method accepting arbitrary keyword arguments"""
+
+        def echo(self, /, **kwargs):
+            """Return kwargs"""
+            return kwargs
+
+    Baz = baz_cls
+    Baz.echo = method_from_delegator("foo", "echo", "echo", Foo.echo)
+    baz_obj = Baz(Foo(value=1), bar_cls())
+
+    assert baz_obj.echo(self=1, other=2) == {"self": 1, "other": 2}
+
+
+class Signatures:
+    """Class with methods covering every kind of parameter"""
+
+    def positional(self, a, b=2):
+        """Positional parameters with a default"""
+        return (a, b)
+
+    def positional_only(self, a, /, b, c=3):
+        """Positional-only parameters"""
+        return (a, b, c)
+
+    def keyword_only(self, a, *, b, c=3):
+        """Keyword-only parameters"""
+        return (a, b, c)
+
+    def var_positional(self, a, *args, b=2):
+        """Variadic positional parameters followed by a keyword-only one"""
+        return (a, args, b)
+
+    def var_keyword(self, a=1, **kwargs):
+        """Variadic keyword parameters"""
+        return (a, kwargs)
+
+    def shadowing_self(this, self, _self=None):
+        """Parameters named self and _self, with a differently named first one"""
+        return (self, _self)
+
+    def everything(self, a, /, b, *args, c, d=4, **kwargs):
+        """Every kind of parameter"""
+        return (a, b, args, c, d, kwargs)
+
+    def required(self, a, /, b, *args, c, **kwargs):
+        """Every kind of parameter, without defaults"""
+        return (a, b, args, c, kwargs)
+
+    def positional_only_default(self, a, /, b=2):
+        """Default following the last positional-only parameter"""
+        return (a, b)
+
+    def only_self_default(self, /, b=2):
+        """Default following a positional-only first parameter"""
+        return b
+
+    def positional_only_with_default(self, a, b=2, /, *args, c, **kwargs):
+        """Positional-only parameter with a default, followed by every other kind of parameter"""
+        return (a, b, args, c, kwargs)
+
+    def positional_only_var_positional(self, a, /, *args, b=2, **kwargs):
+        """Variadic positional parameters following positional-only ones, then a keyword-only default"""
+        return (a, args, b, kwargs)
+
+    def positional_only_keyword_only(self, a, /, *, b, c=3):
+        """Keyword-only parameters following positional-only ones"""
+        return (a, b, c)
+
+
+@pytest.mark.parametrize(
+    "attr_name, args, kwargs",
+    [
+        ("positional", (1,), {}),
+        ("positional", (1,), {"b": 5}),
+        ("positional_only", (1, 2), {}),
+        ("positional_only", (1,), {"b": 2, "c": 5}),
+        ("keyword_only", (1,), {"b": 2}),
+        ("var_positional", (1, 2, 3), {"b": 5}),
+        ("var_keyword", (), {"x": 1}),
+        ("shadowing_self", (1,), {"_self": 2}),
+        ("everything", (1, 2, 3), {"c": 4, "e": 5}),
+        ("required", (1, 2, 3), {"c": 4, "e": 5}),
+        ("positional_only_default", (1,), {}),
+        ("positional_only_default", (1, 5), {}),
+        ("positional_only_default", (1,), {"b": 5}),
+        ("only_self_default", (), {}),
+        ("only_self_default", (5,), {}),
+        ("positional_only_with_default", (1, 5, 6), {"c": 4}),
+        ("positional_only_with_default", (1,), {"c": 4, "e": 5}),
+        ("positional_only_var_positional", (1, 2, 3), {"b": 4, "e": 5}),
+        ("positional_only_keyword_only", (1,), {"b": 2}),
+    ],
+)
+def test_method_from_delegator_signature(attr_name, args, kwargs):
+    """Test that generated forwarders reproduce the original signature, and its parameters up to the first default"""
+    original = Signatures.__dict__[attr_name]
+
+    class Composed:
+        """Composed class holding a Signatures delegate"""
+
+        def __init__(self):
+            self.sig = Signatures()
+
+    setattr(Composed, attr_name, method_from_delegator("sig", attr_name, attr_name, original))
+    forwarder = getattr(Composed(), attr_name)
+
+    assert forwarder(*args, **kwargs) == getattr(Signatures(), attr_name)(*args, **kwargs)
+    assert inspect.signature(forwarder) == inspect.signature(getattr(Signatures(), attr_name))
+
+    def arg_counts(code):
+        return (code.co_argcount, code.co_posonlyargcount, code.co_kwonlyargcount, code.co_flags & 0x0C)
+
+    if not (original.__defaults__ or original.__kwdefaults__):
+        assert arg_counts(forwarder.__code__) == arg_counts(original.__code__)
+
+
+def test_method_from_delegator_defaults():
+    """Test that defaults are the ones of the actual delegate, e.g. an instance of a subclass overriding them"""
+
+    class Sub(Signatures):
+        """Signatures subclass overriding the defaults of a method"""
+
+        def positional(self, a, b=10, c=0):
+            """Positional parameters with different defaults"""
+            return ("Sub", a, b, c)
+
+    class Composed:
+        """Composed class holding a Signatures delegate"""
+
+        def __init__(self, sig):
+            self.sig = sig
+
+    Composed.positional = method_from_delegator("sig", "positional", "positional", Signatures.positional)
+    obj = Composed(Sub())
+
+    assert obj.positional(1) == ("Sub", 1, 10, 0)
+    assert obj.positional(1, c=5) == ("Sub", 1, 10, 5)
+    assert Composed(Signatures()).positional(1) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "attrs, expected_functions",
+    [
+        (("a", "_foo"), set()),
+        (("a", "get_foo", "__len__"), {"get_foo", "__len__"}),
+        (("*",), {"get_foo", "hello_from_foo"}),
+    ],
+)
+def test_generate_properties_compiled(foo_cls, attrs, expected_functions):
+    """Test that only methods are compiled, while attributes are still forwarded via descriptors"""
+
+    injected = dict(generate_properties({"foo": delegatee(foo_cls, attrs)}, verbose=False, compiled=True))
+
+    forwarded = {name: obj for name, obj in injected.items() if not isinstance(obj, ClassLevelAttribute)}
+
+    assert {name for name, obj in forwarded.items() if inspect.isfunction(obj)} == expected_functions
+    assert all(
+        isinstance(forwarded[name], (DelegatedAttribute, property)) for name in set(forwarded) - expected_functions
+    )
+
+
+def test_generate_properties_compiled_unknown_cls():
+    """Test that without `delegatee_cls` every name is forwarded via a descriptor"""
+
+    injected = dict(generate_properties({"foo": ("get_foo", "__len__")}, verbose=False, compiled=True))
+    assert all(isinstance(obj, DelegatedAttribute) for obj in injected.values())
+
+
+def test_generate_properties_compiled_positional_only():
+    """Test that composing with compiled forwarders accepts every signature of `Signatures`"""
+    names = tuple(name for name in vars(Signatures) if not name.startswith("_"))
+    injected = dict(generate_properties({"sig": delegatee(Signatures, names)}, verbose=False, compiled=True))
+
+    assert all(inspect.isfunction(injected[name]) for name in names)
+    assert inspect.signature(injected["positional_only_default"]) == inspect.signature(
+        Signatures.positional_only_default
+    )
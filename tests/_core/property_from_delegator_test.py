@@ -34,3 +34,27 @@ def test_property_from_delegator(foo_cls, bar_cls, baz_cls, attr_name, pfx, sfx,
     delattr(Baz, new_attr_name)  # can't delete from instance, only from class!!!
 
     assert not hasattr(baz_obj, new_attr_name)
+
+
+@pytest.mark.parametrize("writable", [True, False])
+def test_property_from_delegator_write(foo_cls, bar_cls, baz_cls, writable: bool):
+    """Test that writes go to the source attribute of the delegate, even with prefix/suffix, unless read-only"""
+    foo_obj = foo_cls(value=111)
+
+    Baz = baz_cls
+    Baz.foo_value_attr = property_from_delegator("foo", "_foo", "foo_value_attr", writable=writable)
+    baz_obj = Baz(foo_obj, bar_cls())
+
+    if not writable:
+        with pytest.raises(AttributeError):
+            baz_obj.foo_value_attr = 1
+        with pytest.raises(AttributeError):
+            del baz_obj.foo_value_attr
+        return
+
+    baz_obj.foo_value_attr = 222
+    assert foo_obj._foo == baz_obj.foo_value_attr == 222
+    assert not hasattr(foo_obj, "foo_value_attr")
+
+    del baz_obj.foo_value_attr
+    assert not hasattr(foo_obj, "_foo")
@@ -4,6 +4,7 @@ from typing import Callable, Tuple, Type
 import pytest
 
 from compclasses import compclass, delegatee
+from compclasses._attribute import DelegatedAttribute
 
 
 def has_all_attrs(cls: Type, attrs: Tuple[str], prefix: str, suffix: str):
@@ -98,3 +99,20 @@ def test_compclass(
 
     has_all_attrs(baz_obj, foo_attrs, foo_prefix, foo_suffix)
     has_all_attrs(baz_obj, bar_attrs, bar_prefix, bar_suffix)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_compclass_compiled(foo_cls, bar_cls, baz_cls, compiled: bool):
+    """Test for compclass decorator with and without compiled forwarders"""
+    delegates = {"foo": delegatee(foo_cls, ("__len__", "a", "get_foo", "hello_from_foo"), prefix="pfx_")}
+    Baz_composed: Type = compclass(baz_cls, delegates=delegates, compiled=compiled)  # type: ignore
+
+    assert isinstance(Baz_composed.__dict__["pfx_get_foo"], DelegatedAttribute) is not compiled
+    assert isinstance(Baz_composed.__dict__["pfx_a"], DelegatedAttribute)
+
+    baz_obj = Baz_composed(foo_cls(value=111), bar_cls())
+
+    assert len(baz_obj) == 123
+    assert baz_obj.pfx_a == 1
+    assert baz_obj.pfx_get_foo() == 111
+    assert baz_obj.pfx_hello_from_foo(name="GitHub") == "Hello GitHub, this is Foo!"
@@ -80,8 +80,11 @@ def test_is_dunder_method(attr_name: str, expected: bool):
     [
         (("__len__",), ("__len__",)),
         (("__len__", "get_foo"), ("__len__", "get_foo")),
-        (("__len__", "*"), ("__len__", "a", "_foo", "get_foo", "hello_from_foo")),
-        (("*",), ("a", "_foo", "get_foo", "hello_from_foo")),
+        (
+            ("__len__", "*"),
+            ("__len__", "a", "_foo", "get_foo", "hello_from_foo", "static_foo", "from_str", "foo_value"),
+        ),
+        (("*",), ("a", "_foo", "get_foo", "hello_from_foo", "static_foo", "from_str", "foo_value")),
     ],
 )
 def test_parse_attrs(foo_cls, attrs: Iterable[str], expected: Tuple[str, ...]):
@@ -114,3 +117,24 @@ def test_iter(foo_cls):
     attrs = ("__len__", "a", "get_foo", "hello_from_foo")
     d = delegatee(foo_cls, attrs=attrs)
     assert list(d) == list(attrs)
+
+
+@pytest.mark.parametrize(
+    "readonly, expected",
+    [
+        (False, {"a": True, "_foo": True}),
+        (True, {"a": False, "_foo": False}),
+        (("_foo",), {"a": True, "_foo": False}),
+    ],
+)
+def test_is_writable(foo_cls, readonly, expected):
+    """Test for delegatee `_is_writable` method"""
+    _delegatee = delegatee(foo_cls, ("a", "_foo"), readonly=readonly)
+
+    assert {attr_name: _delegatee._is_writable(attr_name) for attr_name in expected} == expected
+
+
+def test_readonly_unknown(foo_cls):
+    """Test that read-only names must be listed in attrs"""
+    with pytest.raises(ValueError, match="Read-only names"):
+        delegatee(foo_cls, ("a",), readonly=("_foo",))
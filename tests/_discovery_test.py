@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+from functools import wraps
+from typing import Tuple, Type
+
+import pytest
+
+from compclasses import clear_cache, delegatee, register_discoverer
+from compclasses._discovery import (
+    _discoverers,
+    annotations_attrs,
+    dataclass_attrs,
+    discover_attrs,
+    init_attrs,
+    slots_attrs,
+)
+
+
+def create_parent_cls() -> Type:
+    """Define Parent class"""
+
+    class Parent:
+        """Parent class"""
+
+        def __init__(self):
+            self.parent_attr = 1
+
+    return Parent
+
+
+def create_child_cls(parent_cls: Type) -> Type:
+    """Define Child class"""
+
+    class Child(parent_cls):
+        """Child class"""
+
+        annotated: int
+
+        def __init__(this, value):
+            """Uses a different name for self and has false positives in strings and comments"""
+            super().__init__()
+            # self.in_comment = 1
+            this.value = this.other = value
+            this.closure = lambda: this.value
+            other = object()
+            other.not_self = "self.in_string = 1"
+
+    return Child
+
+
+def test_init_attrs():
+    """Test that only `STORE_ATTR` on the first argument are discovered"""
+    Child = create_child_cls(create_parent_cls())
+    assert init_attrs(Child) == ("value", "other", "closure")
+
+
+def test_init_attrs_no_code():
+    """Test that classes without a python __init__ yield no attributes"""
+    assert init_attrs(object) == tuple()
+    assert init_attrs(dict) == tuple()
+
+
+def test_init_attrs_wrapped():
+    """Test that decorated __init__ methods are unwrapped"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    class Foo:
+        """Class whose __init__ is decorated"""
+
+        @decorator
+        def __init__(self):
+            self.a = 1
+
+    assert init_attrs(Foo) == ("a",)
+
+
+def test_slots_dataclass_annotations_attrs():
+    """Test for slots, dataclass and annotations discoverers"""
+
+    class Slotted:
+        """Class with a tuple of slots"""
+
+        __slots__ = ("x", "y")
+
+    class SingleSlot:
+        """Class with a single slot as string"""
+
+        __slots__ = "x"
+
+    @dataclass(frozen=True)
+    class Data:
+        """Frozen dataclass with annotated fields"""
+
+        a: int
+        b: str = "b"
+
+    assert slots_attrs(Slotted) == ("x", "y")
+    assert slots_attrs(SingleSlot) == ("x",)
+    assert dataclass_attrs(Data) == ("a", "b")
+    assert dataclass_attrs(Slotted) == tuple()
+    assert annotations_attrs(Data) == ("a", "b")
+    assert discover_attrs(Data) == ("a", "b")
+
+
+@pytest.mark.parametrize(
+    "mro, expected",
+    [
+        (False, ("value", "other", "closure", "annotated")),
+        (True, ("value", "other", "closure", "annotated", "parent_attr")),
+    ],
+)
+def test_discover_attrs(mro: bool, expected: Tuple[str, ...]):
+    """Test discover_attrs with and without walking the MRO"""
+    Child = create_child_cls(create_parent_cls())
+    assert discover_attrs(Child, mro=mro) == expected
+
+
+def test_discover_attrs_without_source(foo_cls):
+    """Test that attributes are discovered even if the source code is not available"""
+    Foo = foo_cls
+    Foo.__init__.__code__ = Foo.__init__.__code__.replace(co_filename="<frozen>")
+
+    assert "_foo" in discover_attrs(Foo)
+    assert "_foo" in delegatee._parse_attrs(Foo, ("*",))
+
+
+def test_register_discoverer(foo_cls):
+    """Test for register_discoverer, including failing discoverers"""
+
+    @register_discoverer
+    def custom(cls):
+        return getattr(cls, "_custom_fields", ())
+
+    @register_discoverer
+    def failing(cls):
+        raise RuntimeError("boom")
+
+    try:
+        Foo = foo_cls
+        Foo._custom_fields = ("custom",)
+        assert discover_attrs(Foo)[-1] == "custom"
+        delegatee(Foo, ("custom",), validate=True)
+    finally:
+        _discoverers.remove(custom)
+        _discoverers.remove(failing)
+        clear_cache()
@@ -0,0 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from compclasses import compclass, delegatee
+from compclasses._fanout import property_from_fanout
+
+
+class Worker:
+    """Member class of the fan-out delegate"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def add(self, x: int) -> int:
+        """Adds x to the value"""
+        return self.value + x
+
+    def is_zero(self) -> bool:
+        """Whether the value is zero"""
+        return self.value == 0
+
+
+class Pool:
+    """Class holding a collection of workers"""
+
+    def __init__(self, workers):
+        self.workers = workers
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_fanout_call(compiled: bool):
+    """Test that method calls are forwarded to every member, preserving order"""
+    Composed = compclass(
+        Pool, delegates={"workers": delegatee(Worker, ("add",), fanout=True)}, verbose=False, compiled=compiled
+    )
+    pool = Composed([Worker(1), Worker(2), Worker(3)])
+
+    assert pool.add(10) == (11, 12, 13)
+    assert pool.add(x=0) == (1, 2, 3)
+    assert Composed([]).add(1) == tuple()
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize(
+    "attr, reduce, expected",
+    [
+        ("add", sum, 36),
+        ("is_zero", any, False),
+        ("value", sum, 6),
+        ("value", max, 3),
+    ],
+)
+def test_fanout_reduce(compiled: bool, attr, reduce, expected):
+    """Test that results are reduced when `reduce` is provided"""
+    Composed = compclass(
+        Pool,
+        delegates={"workers": delegatee(Worker, (attr,), fanout=True, reduce=reduce)},
+        verbose=False,
+        compiled=compiled,
+    )
+    pool = Composed([Worker(1), Worker(2), Worker(3)])
+
+    result = getattr(pool, attr)
+    assert (result(10) if attr == "add" else result() if callable(result) else result) == expected
+
+
+def test_fanout_executor():
+    """Test that method calls can be dispatched to an executor"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        Composed = compclass(
+            Pool, delegates={"workers": delegatee(Worker, ("add",), fanout=True, executor=executor)}, verbose=False
+        )
+        pool = Composed([Worker(i) for i in range(5)])
+
+        assert pool.add(1) == (1, 2, 3, 4, 5)
+
+
+def test_fanout_attribute():
+    """Test get/set/del of an attribute on every member"""
+    Composed = compclass(Pool, delegates={"workers": delegatee(Worker, ("value",), fanout=True)}, verbose=False)
+    workers = [Worker(1), Worker(2)]
+    pool = Composed(workers)
+
+    assert pool.value == (1, 2)
+
+    pool.value = 7
+    assert [w.value for w in workers] == [7, 7]
+
+    del pool.value
+    assert all(not hasattr(w, "value") for w in workers)
+
+
+def test_fanout_unknown_class():
+    """Test that, if the members class is unknown, callables on the first member are forwarded as methods"""
+    Pool.add = property_from_fanout("workers", "add", "add")
+    Pool.value = property_from_fanout("workers", "value", "value")
+    try:
+        pool = Pool([Worker(1), Worker(2)])
+        assert pool.add(1) == (2, 3)
+        assert pool.value == (1, 2)
+    finally:
+        del Pool.add, Pool.value
+
+
+@pytest.mark.parametrize("kwargs", [{"reduce": sum}, {"executor": ThreadPoolExecutor(max_workers=1)}])
+def test_fanout_options_require_fanout(kwargs):
+    """Test that `reduce` and `executor` require `fanout=True`"""
+    with pytest.raises(ValueError, match="require fanout=True"):
+        delegatee(Worker, ("add",), **kwargs)
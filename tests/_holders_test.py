@@ -0,0 +1,152 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee
+from compclasses._holders import DelegateHolder
+
+
+class Client:
+    """Delegatee class"""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def fetch(self, path: str) -> str:
+        """Returns the url of path"""
+        return f"{self.url}/{path}"
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("lazy", [True, False])
+def test_lazy_factory(compiled: bool, lazy: bool):
+    """Test that the delegate is built on first forwarded access only, unless set before"""
+    calls = []
+
+    def factory(obj):
+        calls.append(obj)
+        return Client(obj.url)
+
+    @compclass(
+        delegates={"_client": delegatee(Client, ("url", "fetch"), prefix="c_", lazy_factory=factory)},
+        compiled=compiled,
+        lazy=lazy,
+    )
+    class Service:
+        """Composed class building its client on first access"""
+
+        def __init__(self, url: str):
+            self.url = url
+
+    service = Service("db")
+    assert calls == []
+    assert service.c_fetch("users") == "db/users"
+    assert service.c_url == "db"
+    assert calls == [service]
+    assert isinstance(Service.__dict__["_client"], DelegateHolder)
+
+    other = Service("other")
+    other._client = Client("explicit")
+    assert other.c_url == "explicit"
+    assert calls == [service]
+
+    del other._client
+    assert other.c_url == "other"
+
+
+def test_lazy_factory_once():
+    """Test that concurrent first accesses call the factory once per instance"""
+    barrier = Barrier(8)
+    calls = []
+
+    class Composed(
+        metaclass=CompclassMeta,
+        delegates={"_client": delegatee(Client, ("url",), lazy_factory=lambda obj: calls.append(obj) or Client("x"))},
+    ):
+        """Composed class building its client on first access"""
+
+    def access(obj):
+        barrier.wait()
+        return obj._client
+
+    objs = [Composed(), Composed()]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        delegates = list(pool.map(access, objs * 4))
+
+    assert len(calls) == 2
+    assert {id(d) for d in delegates} == {id(objs[0]._client), id(objs[1]._client)}
+
+
+def test_weak():
+    """Test that weak delegates are not kept alive by the composed instance"""
+
+    @compclass(delegates={"_client": delegatee(Client, ("fetch",), weak=True)})
+    class Service:
+        """Composed class holding its client by weak reference"""
+
+        def __init__(self, client: Client):
+            self._client = client
+
+    client = Client("db")
+    service = Service(client)
+    assert service.fetch("users") == "db/users"
+    assert service._client is client
+
+    del client
+    gc.collect()
+
+    with pytest.raises(ReferenceError, match="Delegate '_client' of 'Service' object has been garbage collected"):
+        service.fetch("users")
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_weak_repeated_access(compiled: bool):
+    """Test that repeatedly forwarded methods do not keep a weak delegate alive"""
+
+    @compclass(delegates={"_client": delegatee(Client, ("fetch",), weak=True)}, compiled=compiled)
+    class Service:
+        """Composed class holding its client by weak reference"""
+
+        def __init__(self, client: Client):
+            self._client = client
+
+    client = Client("db")
+    service = Service(client)
+    for _ in range(3):
+        assert service.fetch("users") == "db/users"
+    assert "fetch" not in vars(service)
+
+    del client
+    gc.collect()
+
+    with pytest.raises(ReferenceError):
+        service.fetch("users")
+
+
+@pytest.mark.parametrize(
+    "factory, context",
+    [
+        (
+            lambda: delegatee(Client, ("url",), weak=True, lazy_factory=Client),
+            pytest.raises(ValueError, match="mutually exclusive"),
+        ),
+        (
+            lambda: delegatee(Client, ("fetch",), weak=True, cache_bound=True),
+            pytest.raises(ValueError, match="weak and cache_bound parameters are mutually exclusive"),
+        ),
+        (
+            lambda: compclass(type("Slotted", (), {}), {"_c": delegatee(Client, ("url",), weak=True)}, slots=True),
+            pytest.raises(ValueError, match="not supported by slots"),
+        ),
+        (
+            lambda: compclass(type("Dotted", (), {}), {"_a._c": delegatee(Client, ("url",), weak=True)}),
+            pytest.raises(ValueError, match="must be plain attribute names"),
+        ),
+    ],
+)
+def test_raise(factory, context):
+    """Test invalid weak and lazy_factory options"""
+    with context:
+        factory()
@@ -0,0 +1,111 @@
+import pytest
+
+from compclasses import CompclassMeta, Delegation, compclass, delegated_names, delegatee, resolve
+from compclasses._inheritance import DELEGATES_ATTR, diff_delegates
+
+
+def test_diff_delegates(foo_cls, bar_cls):
+    """Test extend, override, reuse and remove semantics"""
+    inherited = {"foo": delegatee(foo_cls, ("a",)), "bar": ("b",), "baz": ("c",)}
+
+    generated, merged, replaced = diff_delegates(
+        inherited,
+        {"foo": delegatee(foo_cls, ("a",)), "bar": ("b", "__bool__"), "baz": None, "qux": ("d",)},
+    )
+    assert generated == {"bar": ("b", "__bool__"), "qux": ("d",)}
+    assert list(merged) == ["foo", "bar", "qux"] and merged["bar"] == ("b", "__bool__")
+    assert replaced == ("bar", "baz")
+
+    with pytest.raises(ValueError, match="Cannot remove delegate 'qux'"):
+        diff_delegates({}, {"qux": None})
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_meta_inheritance(foo_cls, bar_cls, lazy: bool):
+    """Test that subclasses inherit delegates, and only generate the new ones"""
+
+    class Base(metaclass=CompclassMeta, delegates={"foo": delegatee(foo_cls, ("a", "get_foo", "__len__"))}):
+        """Composed base class"""
+
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+    class Child(Base, lazy=lazy):
+        """Subclass inheriting the delegates"""
+
+    class GrandChild(Child, delegates={"bar": delegatee(bar_cls, ("b",))}, lazy=lazy):
+        """Subclass adding a delegate"""
+
+    assert getattr(Child, DELEGATES_ATTR) == getattr(Base, DELEGATES_ATTR)
+    assert not {"a", "get_foo", "__len__"} & set(vars(GrandChild))
+    assert delegated_names(GrandChild) == ("__len__", "a", "get_foo", "b")
+
+    obj = GrandChild(foo_cls(value=1), bar_cls())
+    assert (obj.a, obj.get_foo(), len(obj), obj.b) == (1, 1, 123, 0.1)
+
+
+def test_meta_override_remove(foo_cls, bar_cls):
+    """Test that overridden and removed delegates mask the inherited names"""
+
+    class Base(
+        metaclass=CompclassMeta,
+        delegates={"foo": delegatee(foo_cls, ("a", "get_foo", "__len__")), "bar": delegatee(bar_cls, ("b",))},
+    ):
+        """Composed base class"""
+
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+    class Child(Base, delegates={"foo": delegatee(foo_cls, ("get_foo",), prefix="foo_"), "bar": None}):
+        """Subclass overriding foo and removing bar"""
+
+        def a(self):
+            """Own method, shadowing the name forwarded by the base class"""
+            return "own"
+
+    obj = Child(foo_cls(value=1), bar_cls())
+    assert obj.foo_get_foo() == 1
+    assert obj.a() == "own"
+
+    for name in ("get_foo", "b"):
+        assert not hasattr(obj, name)
+        assert not hasattr(Child, name)
+        assert resolve(Child, name) is None
+
+    with pytest.raises(TypeError):
+        len(obj)
+
+    assert delegated_names(Child) == ("foo_get_foo",)
+    assert resolve(Child, "foo_get_foo") == Delegation("foo", "get_foo", "method")
+    assert list(getattr(Child, DELEGATES_ATTR)) == ["foo"]
+
+
+def test_compclass_inheritance(foo_cls, bar_cls):
+    """Test that compclass merges delegates of composed base classes as well"""
+
+    @compclass(delegates={"foo": delegatee(foo_cls, ("a", "get_foo"))})
+    class Base:
+        """Composed base class"""
+
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+    @compclass(delegates={"foo": None, "bar": ("b",)})
+    class Child(Base):
+        """Subclass removing foo and adding bar"""
+
+    obj = Child(foo_cls(value=1), bar_cls())
+    assert obj.b == 0.1
+    assert not hasattr(obj, "a")
+    assert delegated_names(Child) == ("b",)
+
+
+def test_meta_missing_delegates():
+    """Test that delegates are required, unless inherited"""
+    with pytest.raises(ValueError, match="`delegates` param cannot be `None`"):
+
+        class Base(metaclass=CompclassMeta):
+            """Class composed without delegates"""
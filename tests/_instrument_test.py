@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, reset_stats, stats
+from compclasses._instrument import instrument_descriptor
+
+
+def _cls_stats(cls):
+    """Returns the statistics of `cls`, as nested dictionaries."""
+    return stats().as_dict()[f"{cls.__module__}.{cls.__qualname__}"]
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_instrument_compclass(foo_cls, bar_cls, baz_cls, lazy: bool):
+    """Test that calls, time and errors are recorded per (class, delegate, attr, operation)"""
+    reset_stats()
+    delegates = {"foo": delegatee(foo_cls, ("a", "get_foo", "__len__")), "bar": ("b",)}
+    Baz = compclass(baz_cls, delegates=delegates, verbose=False, compiled=True, lazy=lazy, instrument=True)
+    baz_obj = Baz(foo_cls(value=111), bar_cls())
+
+    for _ in range(3):
+        assert baz_obj.get_foo() == 111
+    assert len(baz_obj) == 123
+    assert baz_obj.b == 0.1
+
+    baz_obj.bar = None
+    with pytest.raises(AttributeError):
+        baz_obj.b
+
+    baz_stats = _cls_stats(Baz)
+    assert baz_stats["foo"]["get_foo"]["call"]["calls"] == 3
+    assert baz_stats["foo"]["get_foo"]["call"]["seconds"] > 0
+    assert baz_stats["foo"]["__len__"]["call"]["calls"] == 1
+    # Until finalized, a lazy class retries a materialised name whose descriptor raised `AttributeError` (the lookup
+    # could have missed the descriptor while another thread was installing it), hence failing accesses count twice.
+    expected = {"calls": 2 + lazy, "seconds": pytest.approx(0, abs=1), "errors": 1 + lazy}
+    assert baz_stats["bar"]["b"]["get"] == expected
+
+    reset_stats()
+    assert _cls_stats(Baz)["foo"]["get_foo"]["call"]["calls"] == 0
+
+
+def test_instrument_meta(foo_cls):
+    """Test instrumentation of classes created via CompclassMeta, and that other classes are not instrumented"""
+    delegates = {"foo": delegatee(foo_cls, ("get_foo",))}
+
+    class Instrumented(metaclass=CompclassMeta, delegates=delegates, verbose=False, instrument=True):
+        """Instrumented composed class"""
+
+        def __init__(self, foo):
+            self.foo = foo
+
+    class Plain(metaclass=CompclassMeta, delegates=delegates, verbose=False):
+        """Composed class, not instrumented"""
+
+        def __init__(self, foo):
+            self.foo = foo
+
+    assert Plain.__dict__["get_foo"] is not Instrumented.__dict__["get_foo"]
+
+    Instrumented(foo_cls(value=1)).get_foo()
+    Plain(foo_cls(value=1)).get_foo()
+
+    assert _cls_stats(Instrumented)["foo"]["get_foo"]["get"]["calls"] == 1
+    assert f"{Plain.__module__}.{Plain.__qualname__}" not in stats().as_dict()
+
+
+def test_instrument_coroutine():
+    """Test that coroutine functions are timed until awaited"""
+
+    async def forwarded(self):
+        """Coroutine function raising once awaited"""
+        await asyncio.sleep(0)
+        raise ValueError
+
+    wrapped = instrument_descriptor(forwarded, "mod.Composed", "_service", "fetch")
+    assert asyncio.iscoroutinefunction(wrapped)
+
+    with pytest.raises(ValueError):
+        asyncio.run(wrapped(None))
+
+    assert stats()[("mod.Composed", "_service", "fetch", "call")].errors == 1
+
+
+def test_to_prometheus():
+    """Test Prometheus text exposition format"""
+    instrument_descriptor(lambda self: None, "mod.Prom", "_foo", "method")(None)
+
+    text = stats().to_prometheus()
+    assert "# TYPE compclasses_forwarded_calls_total counter" in text
+    assert 'compclasses_forwarded_calls_total{cls="mod.Prom",delegate="_foo",attr="method",op="call"} 1' in text
+    assert 'compclasses_forwarded_errors_total{cls="mod.Prom",delegate="_foo",attr="method",op="call"} 0' in text
@@ -0,0 +1,131 @@
+from unittest import mock
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, finalize
+from compclasses._attribute import DelegatedAttribute
+from compclasses._lazy import LAZY_SPEC_ATTR
+
+
+def test_lazy_delegatee(foo_cls):
+    """Test that parsing and validation are deferred until the delegatee is finalized"""
+    with mock.patch.object(delegatee, "_parse_attrs", return_value=("get_foo",)) as parse_mock:
+        d = delegatee(foo_cls, ("*",), lazy=True)
+        assert parse_mock.call_count == 0
+
+        assert list(d) == ["get_foo"]
+        assert d.finalize() is d
+        assert parse_mock.call_count == 1
+
+
+def test_lazy_delegatee_validation(foo_cls):
+    """Test that validation errors are raised on finalize, and on every later attempt"""
+    d = delegatee(foo_cls, ("some_fake_method",), lazy=True)
+
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            d.finalize()
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_lazy_compclass(foo_cls, bar_cls, baz_cls, compiled: bool):
+    """Test that forwarded names are installed on first instance access, dunders are installed eagerly"""
+    delegates = {"foo": delegatee(foo_cls, ("*", "__len__"), prefix="pfx_", lazy=True)}
+    Baz = compclass(baz_cls, delegates=delegates, verbose=False, lazy=True, compiled=compiled)
+
+    assert "__len__" in Baz.__dict__
+    assert "pfx_get_foo" not in Baz.__dict__
+
+    baz_obj = Baz(foo_cls(value=111), bar_cls())
+    assert len(baz_obj) == 123
+    assert baz_obj.pfx_get_foo() == 111
+    assert "pfx_get_foo" in Baz.__dict__
+    assert "pfx_hello_from_foo" not in Baz.__dict__
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        baz_obj.missing
+
+    finalize(Baz)
+    assert "pfx_hello_from_foo" in Baz.__dict__
+    assert not any(hook in Baz.__dict__ for hook in ("__getattr__", "__setattr__", "__delattr__"))
+    assert LAZY_SPEC_ATTR not in Baz.__dict__
+    assert baz_obj.pfx_a == 1
+
+
+def test_lazy_compclass_set_before_get(foo_cls, bar_cls, baz_cls):
+    """Test that setting/deleting a forwarded attribute before reading it writes to the delegate"""
+    Baz = compclass(baz_cls, delegates={"foo": ("a", "_foo")}, verbose=False, lazy=True)
+    foo_obj = foo_cls(value=111)
+    baz_obj = Baz(foo_obj, bar_cls())
+
+    baz_obj.a = 2
+    assert foo_obj.a == 2
+    assert "a" not in vars(baz_obj)
+
+    del baz_obj._foo
+    assert not hasattr(foo_obj, "_foo")
+
+
+def test_lazy_compclass_fallback_getattr(foo_cls, bar_cls):
+    """Test that the class own `__getattr__` is used as fallback and restored on finalize"""
+
+    @compclass(delegates={"foo": delegatee(foo_cls, ("get_foo",))}, verbose=False, lazy=True)
+    class Baz:
+        """Baz class"""
+
+        def __init__(self, foo):
+            self.foo = foo
+
+        def __getattr__(self, name):
+            return f"fallback {name}"
+
+    baz_obj = Baz(foo_cls(value=111))
+    assert baz_obj.get_foo() == 111
+    assert baz_obj.missing == "fallback missing"
+
+    finalize(Baz)
+    assert baz_obj.missing == "fallback missing"
+    assert Baz.__dict__["__getattr__"].__name__ == "__getattr__"
+    assert Baz.__dict__["__getattr__"].__qualname__.endswith("Baz.__getattr__")
+
+
+def test_lazy_compclass_deferred_validation(foo_cls, bar_cls, baz_cls):
+    """Test that validation errors surface on first access (or finalize), not at class creation"""
+    delegates = {"foo": delegatee(foo_cls, ("get_foo", "some_fake_method"), lazy=True), "bar": ("b",)}
+    Baz = compclass(baz_cls, delegates=delegates, verbose=False, lazy=True)
+    baz_obj = Baz(foo_cls(value=111), bar_cls())
+
+    with pytest.raises(AttributeError, match="some_fake_method"):
+        baz_obj.get_foo
+
+    with pytest.raises(AttributeError, match="some_fake_method"):
+        finalize(Baz)
+
+
+def test_lazy_meta(foo_cls, bar_cls):
+    """Test lazy CompclassMeta, including class level access"""
+
+    class Baz(
+        metaclass=CompclassMeta,
+        delegates={"foo": delegatee(foo_cls, ("*", "__len__"), lazy=True)},
+        verbose=False,
+        lazy=True,
+    ):
+        """Baz composed class using metaclass"""
+
+        def __init__(self, foo):
+            self.foo = foo
+
+    assert "get_foo" not in Baz.__dict__
+    assert isinstance(Baz.get_foo, DelegatedAttribute)
+    assert "get_foo" in Baz.__dict__
+
+    with pytest.raises(AttributeError, match="type object 'Baz' has no attribute 'missing'"):
+        Baz.missing
+
+    baz_obj = Baz(foo_cls(value=111))
+    assert baz_obj.hello_from_foo("GitHub") == "Hello GitHub, this is Foo!"
+    assert len(baz_obj) == 123
+
+    assert finalize(Baz) is Baz
+    assert "a" in Baz.__dict__
@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, finalize
+from compclasses._logging import is_reporting, log_injection, logger
+
+
+def test_logger():
+    """Test that the library logger is not the root logger and it is not configured at import"""
+    assert logger.name == "compclasses"
+    assert all(isinstance(handler, logging.NullHandler) for handler in logger.handlers)
+
+
+def test_is_reporting(caplog):
+    """Test for is_reporting function"""
+    assert not is_reporting(False, print)
+    assert is_reporting(True, print)
+
+    with caplog.at_level(logging.WARNING, logger="compclasses"):
+        assert not is_reporting(True, None)
+
+    with caplog.at_level(logging.INFO, logger="compclasses"):
+        assert is_reporting(True, None)
+
+
+def test_log_injection(caplog):
+    """Test that injected names are logged as a single structured record"""
+    with caplog.at_level(logging.INFO, logger="compclasses"):
+        log_injection("mod.Baz", [("a", "foo", "a"), ("pfx_b", "foo", "b")])
+        log_injection("mod.Empty", [])
+
+    (record,) = caplog.records
+    assert record.getMessage() == "mod.Baz: setting a from foo.a, pfx_b from foo.b"
+    assert record.compclass == "mod.Baz"
+    assert record.injected == {"a": "foo.a", "pfx_b": "foo.b"}
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_verbose_compclass(caplog, foo_cls, baz_cls, lazy: bool):
+    """Test that one record per class is emitted if verbose, none by default"""
+    delegates = {"foo": delegatee(foo_cls, ("a", "get_foo", "__len__"))}
+
+    with caplog.at_level(logging.INFO, logger="compclasses"):
+        compclass(baz_cls, delegates=delegates, lazy=lazy)
+        assert caplog.records == []
+
+        Baz = finalize(compclass(baz_cls, delegates=delegates, verbose=True, lazy=lazy))
+
+    # Lazy classes report dunders (injected eagerly) and then every materialised batch
+    assert len(caplog.records) == (2 if lazy else 1)
+    assert all(record.compclass == f"{Baz.__module__}.{Baz.__qualname__}" for record in caplog.records)
+    injected = {name: source for record in caplog.records for name, source in record.injected.items()}
+    assert injected == {"a": "foo.a", "get_foo": "foo.get_foo", "__len__": "foo.__len__"}
+
+
+def test_verbose_meta(caplog, foo_cls):
+    """Test that one record per class is emitted by CompclassMeta if verbose"""
+    with caplog.at_level(logging.INFO, logger="compclasses"):
+
+        class Baz(metaclass=CompclassMeta, delegates={"foo": delegatee(foo_cls, ("a", "get_foo"))}, verbose=True):
+            """Composed class logging the injected names"""
+
+    (record,) = caplog.records
+    assert record.compclass == f"{Baz.__module__}.{Baz.__qualname__}"
+    assert record.injected == {"a": "foo.a", "get_foo": "foo.get_foo"}
+
+
+def test_verbose_disabled_logger(caplog, foo_cls, baz_cls):
+    """Test that nothing is formatted if the logger is not enabled for INFO records"""
+    with caplog.at_level(logging.WARNING, logger="compclasses"):
+        compclass(baz_cls, delegates={"foo": delegatee(foo_cls, ("a",))}, verbose=True)
+
+    assert caplog.records == []
@@ -1,3 +1,4 @@
+import inspect
 from typing import Any, Tuple
 
 import pytest
@@ -77,3 +78,28 @@ def test_meta(
 
     has_all_attrs(baz_obj, foo_attrs, foo_prefix, foo_suffix)
     has_all_attrs(baz_obj, bar_attrs, bar_prefix, bar_suffix)
+
+
+def test_meta_compiled(foo_cls, bar_cls):
+    """Test for CompclassMeta metaclass with compiled forwarders"""
+
+    class Baz_composed(
+        metaclass=CompclassMeta,
+        delegates={"foo": delegatee(foo_cls, ("__len__", "a", "get_foo", "hello_from_foo"))},
+        compiled=True,
+    ):
+        """Baz composed class using metaclass"""
+
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+    assert inspect.isfunction(Baz_composed.__dict__["get_foo"])
+    assert inspect.isfunction(Baz_composed.__dict__["__len__"])
+
+    baz_obj = Baz_composed(foo_cls(value=111), bar_cls())
+
+    assert len(baz_obj) == 123
+    assert baz_obj.a == 1
+    assert baz_obj.get_foo() == 111
+    assert baz_obj.hello_from_foo("GitHub") == "Hello GitHub, this is Foo!"
@@ -0,0 +1,165 @@
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from compclasses import CompclassMeta, RebuildPolicy, SharePolicy, compclass, delegatee
+
+
+class Foo:
+    """Delegatee class"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def get_value(self) -> int:
+        """Returns the value"""
+        return self.value
+
+
+def make_foo() -> Foo:
+    """Factory of the rebuilt Foo delegates"""
+    return Foo(value=-1)
+
+
+DELEGATES = {"foo": delegatee(Foo, ("get_value",)), "data": ("hex",)}
+
+
+@compclass(delegates=DELEGATES, pickling={"foo": "share"})
+class Shared:
+    """Composed class sharing its foo delegate"""
+
+    def __init__(self, foo, data):
+        self.foo = foo
+        self.data = data
+        self.other = [1, 2]
+
+
+@compclass(delegates=DELEGATES, pickling={"foo": RebuildPolicy(Foo, args=lambda foo: (foo.value * 10,))}, slots=True)
+class Rebuilt:
+    """Composed class with slots, rebuilding its foo delegate from its value"""
+
+    __slots__ = ("other",)
+
+    def __init__(self, foo, data):
+        self.foo = foo
+        self.data = data
+        self.other = [1, 2]
+
+
+class Meta(metaclass=CompclassMeta, delegates=DELEGATES, pickling={"foo": RebuildPolicy(make_foo)}, lazy=True):
+    """Lazily composed class rebuilding its foo delegate from a factory"""
+
+    def __init__(self, foo, data):
+        self.foo = foo
+        self.data = data
+
+
+@compclass(delegates=DELEGATES, pickling={})
+class Copied:
+    """Composed class copying its delegates"""
+
+    def __init__(self, foo, data):
+        self.foo = foo
+        self.data = data
+
+
+WEAK_DELEGATES = {"foo": delegatee(Foo, ("get_value",), weak=True), "data": ("hex",)}
+
+
+@compclass(delegates=WEAK_DELEGATES, pickling={"foo": "share"})
+class Weak:
+    """Composed class holding foo by weak reference, sharing it when pickled"""
+
+
+class WeakMeta(metaclass=CompclassMeta, delegates=WEAK_DELEGATES, pickling={"foo": "share"}):
+    """Composed class holding foo by weak reference, sharing it when pickled, via the metaclass"""
+
+
+def test_share_policy():
+    """Test that shared delegates are pickled by reference, while other attributes are copied"""
+    obj = Shared(Foo(value=1), b"abc")
+    with pytest.raises(pickle.PicklingError, match="is not registered"):
+        pickle.dumps(obj)
+
+    SharePolicy.register(obj.foo)
+    for clone in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj), copy.copy(obj)):
+        assert clone.foo is obj.foo
+        assert clone.other == obj.other
+        assert clone.get_value() == 1
+        assert clone.hex() == b"abc".hex()
+
+    assert copy.deepcopy(obj).other is not obj.other
+
+    dumped = pickle.dumps(obj)
+    SharePolicy.release(obj.foo)
+    with pytest.raises(pickle.UnpicklingError, match="is not registered"):
+        pickle.loads(dumped)
+
+
+def test_rebuild_policy():
+    """Test that delegates with rebuild policy are not serialised but created by the factory"""
+    obj = Rebuilt(Foo(value=2), b"abc")
+    clone = pickle.loads(pickle.dumps(obj))
+
+    assert not hasattr(clone, "__dict__")
+    assert clone.get_value() == 20
+    assert clone.other == [1, 2]
+
+    meta_clone = copy.deepcopy(Meta(Foo(value=2), b"abc"))
+    assert meta_clone.get_value() == -1
+
+
+@pytest.mark.parametrize("data", [b"abc", bytearray(b"abc"), array("i", [1, 2, 3])])
+def test_out_of_band_buffers(data):
+    """Test that bytes-like delegates are transferred out-of-band with protocol 5"""
+    obj = Copied(Foo(value=3), data)
+
+    buffers = []
+    dumped = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert bytes(data) not in dumped
+
+    clone = pickle.loads(dumped, buffers=buffers)
+    assert type(clone.data) is type(data)
+    assert clone.data == data
+    assert clone.get_value() == 3
+
+    # In-band with protocol 5 and older protocols
+    assert pickle.loads(pickle.dumps(obj, protocol=5)).data == data
+    assert pickle.loads(pickle.dumps(obj, protocol=4)).data == data
+
+
+@pytest.mark.parametrize("cls", [Weak, WeakMeta])
+def test_weak_delegates(cls):
+    """Test that delegates held by weak reference are serialised dereferenced, and stored back weakly"""
+    obj, foo = cls(), Foo(value=4)
+    obj.foo, obj.data = foo, b"abc"
+    SharePolicy.register(foo)
+
+    for clone in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj), copy.copy(obj)):
+        assert clone.foo is foo
+        assert clone.get_value() == 4
+        assert vars(clone)["foo"]() is foo  # held by weak reference again
+
+    SharePolicy.release(foo)
+    with pytest.raises(ValueError, match="held by weak reference and cannot be copied"):
+        compclass(type("Copied", (), {}), delegates=WEAK_DELEGATES, pickling={"foo": "copy"})
+    with pytest.raises(ValueError, match="held by weak reference and cannot be copied"):
+        compclass(type("Copied", (), {}), delegates=WEAK_DELEGATES, pickling={"data": "copy"})
+
+
+def test_pickling_errors(foo_cls, baz_cls):
+    """Test invalid pickling policies"""
+    delegates = {"foo": delegatee(foo_cls, ("get_foo",))}
+
+    with pytest.raises(ValueError, match="not a delegate"):
+        compclass(baz_cls, delegates=delegates, pickling={"bar": "share"})
+
+    with pytest.raises(ValueError, match="Unknown pickling policy"):
+        compclass(baz_cls, delegates=delegates, pickling={"foo": "deep"})
+
+    baz_cls.__reduce__ = lambda self: (baz_cls, ())
+    with pytest.raises(ValueError, match="already defines __reduce__"):
+        compclass(baz_cls, delegates=delegates, pickling={"foo": "share"})
@@ -0,0 +1,224 @@
+import inspect
+from contextlib import nullcontext
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee
+from compclasses._protocols import _TEMPLATES, PROTOCOLS, dunder_from_protocol, protocol_dunders
+
+
+def test_templates():
+    """Test that every dunder of the protocol groups has a template"""
+    assert {dunder for dunders in PROTOCOLS.values() for dunder in dunders} == set(_TEMPLATES)
+
+
+@pytest.mark.parametrize(
+    "delegatee_cls, protocols, expected",
+    [
+        (None, ("container",), ("__len__", "__iter__", "__contains__")),
+        (list, ("container", "sequence"), PROTOCOLS["sequence"]),
+        (tuple, ("sequence",), ("__len__", "__iter__", "__contains__", "__getitem__")),
+        (int, ("context", "callable"), ()),
+        (tuple, ("inplace",), ("__iadd__", "__imul__")),
+    ],
+)
+def test_protocol_dunders(delegatee_cls, protocols, expected):
+    """Test that only the dunders implemented by the delegatee class are forwarded"""
+    assert set(protocol_dunders(delegatee_cls, protocols)) == set(expected)
+
+
+def test_dunder_from_protocol():
+    """Test generated dunders, as well as dunders marked as not available"""
+    assert dunder_from_protocol(list, "_d", "__hash__") is None
+
+    getitem = dunder_from_protocol(list, "_d", "__getitem__")
+    assert inspect.isfunction(getitem)
+    assert getitem.__name__ == "__getitem__"
+
+
+@pytest.mark.parametrize(
+    "protocols, context",
+    [
+        (("sequence",), nullcontext()),
+        (("unknown",), pytest.raises(ValueError, match="Unknown protocols")),
+    ],
+)
+def test_delegatee_protocols(protocols, context):
+    """Test delegatee protocols validation, in which case attrs can be empty"""
+    with context:
+        d = delegatee(list, (), protocols=protocols)
+        assert tuple(d)[: len(d._protocol_dunders())] == d._protocol_dunders()
+
+    with pytest.raises(ValueError, match="not supported with fanout=True"):
+        delegatee(list, ("append",), fanout=True, protocols=("container",))
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("slots", [True, False])
+def test_sequence(lazy: bool, slots: bool):
+    """Test container, sequence and comparison protocols"""
+
+    @compclass(
+        delegates={"_items": delegatee(list, ("append",), protocols=("sequence", "comparison"))},
+        lazy=lazy,
+        slots=slots,
+    )
+    class Items:
+        """Composed class behaving as its list delegate"""
+
+        def __init__(self, items):
+            self._items = items
+
+    items = Items([1, 2, 3])
+    items.append(4)
+
+    assert len(items) == 4
+    assert items[0] == 1
+    assert items[1:3] == [2, 3]
+    assert list(items) == [1, 2, 3, 4]
+    assert list(reversed(items)) == [4, 3, 2, 1]
+    assert 3 in items
+    assert items == [1, 2, 3, 4]
+    assert items < [2]
+
+    items[0] = 0
+    del items[-1]
+    assert items._items == [0, 2, 3]
+
+    with pytest.raises(TypeError):
+        hash(items)  # list.__hash__ is None
+
+
+def test_number():
+    """Test number and comparison protocols, including reflected operators"""
+
+    class Value(metaclass=CompclassMeta, delegates={"_v": delegatee(int, (), protocols=("number", "comparison"))}):
+        """Composed class behaving as its int delegate"""
+
+        def __init__(self, value: int):
+            self._v = value
+
+    three = Value(3)
+
+    assert (three + 1, 1 + three, three - 1, 1 - three) == (4, 4, 2, -2)
+    assert (three * 3, three**2, pow(three, 2, 5), divmod(three, 2)) == (9, 9, 4, (1, 1))
+    assert (-three, abs(Value(-3)), ~three, three & 1, 1 | three) == (-3, 3, -4, 1, 3)
+    assert (int(three), float(three), round(three), [0, 1, 2, 3][three]) == (3, 3.0, 3, 3)
+    assert not Value(0)
+    assert three == 3 and three < 4 and hash(three) == hash(3)
+
+
+def test_not_implemented():
+    """Test that binary operators return NotImplemented only if the delegate does, so that the reflected operator of
+    the other operand is tried, while other errors of the delegate propagate"""
+
+    class Money:
+        """Operand supporting reflected operators with any left operand"""
+
+        def __radd__(self, other):
+            return ("radd", other)
+
+        def __gt__(self, other):
+            return ("gt", other)
+
+    class Value(metaclass=CompclassMeta, delegates={"_v": delegatee(int, (), protocols=("number", "comparison"))}):
+        """Composed class behaving as its int delegate"""
+
+        def __init__(self, value: int):
+            self._v = value
+
+    class Strict:
+        """Delegatee class whose operator raises TypeError itself"""
+
+        calls = 0
+
+        def __add__(self, other):
+            Strict.calls += 1
+            raise TypeError("rejected by Strict")
+
+    class Wrapper(metaclass=CompclassMeta, delegates={"_s": delegatee(Strict, (), protocols=("number",))}):
+        """Composed class behaving as its Strict delegate"""
+
+        def __init__(self):
+            self._s = Strict()
+
+    three, money = Value(3), Money()
+    assert three.__add__("a") is NotImplemented
+    assert three + money == ("radd", three)
+    assert (three < money) == ("gt", three)
+    with pytest.raises(TypeError, match="unsupported operand"):
+        three + "a"
+    with pytest.raises(TypeError, match="unsupported operand"):
+        three * three  # as for hand-written wrappers, the reflected operator of the same type is not tried
+
+    with pytest.raises(TypeError, match="rejected by Strict"):
+        Wrapper() + money
+    assert Strict.calls == 1
+
+
+def test_inplace():
+    """Test that in-place operators replace the delegate, keeping the composed instance"""
+
+    @compclass(delegates={"_items": delegatee(list, (), protocols=("sequence", "inplace"))})
+    class Items:
+        """Composed class extending its list delegate in place"""
+
+        def __init__(self, items):
+            self._items = items
+
+    class Value(metaclass=CompclassMeta, delegates={"_v": delegatee(int, (), protocols=("inplace",))}):
+        """Composed class replacing its int delegate in place"""
+
+        def __init__(self, value: int):
+            self._v = value
+
+    obj = items = Items([1])
+    obj += [9]
+    obj *= 2
+    assert obj is items and type(obj) is Items
+    assert obj._items == [1, 9, 1, 9]
+
+    value = Value(3)
+    value += 2
+    value **= 2
+    assert type(value) is Value
+    assert value._v == 25
+
+    with pytest.raises(TypeError):
+        value += "a"
+
+
+def test_context_callable():
+    """Test context and callable protocols"""
+
+    class Resource:
+        """Context manager and callable delegatee class"""
+
+        def __init__(self):
+            self.events = []
+
+        def __enter__(self):
+            self.events.append("enter")
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            self.events.append(exc_type)
+            return True
+
+        def __call__(self, *args, **kwargs):
+            return args, kwargs
+
+    @compclass(delegates={"res": delegatee(Resource, (), protocols=("context", "callable"))})
+    class Wrapper:
+        """Composed class behaving as its resource delegate"""
+
+        def __init__(self):
+            self.res = Resource()
+
+    wrapper = Wrapper()
+    with wrapper as res:
+        raise KeyError("suppressed by Resource.__exit__")
+
+    assert res is wrapper.res
+    assert res.events == ["enter", KeyError]
+    assert wrapper(1, a=2) == ((1,), {"a": 2})
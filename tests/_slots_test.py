@@ -0,0 +1,129 @@
+from operator import attrgetter
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee
+from compclasses._slots import add_slots, merge_slots, slot_getters
+
+
+@pytest.mark.parametrize(
+    "own_slots, names, expected",
+    [
+        (None, ("_foo", "_bar"), ("_foo", "_bar")),
+        ("x", ("_foo",), ("x", "_foo")),
+        (("x", "_foo"), ("_foo",), ("x", "_foo")),
+        (("x",), ("inherited",), ("x",)),
+    ],
+)
+def test_merge_slots(own_slots, names, expected):
+    """Test merge_slots with own and inherited slots"""
+
+    class Base:
+        """Base class with a slot"""
+
+        __slots__ = ("inherited",)
+
+    attrs = {} if own_slots is None else {"__slots__": own_slots}
+    assert merge_slots(attrs, (Base,), names)["__slots__"] == expected
+
+
+def test_merge_slots_invalid_name():
+    """Test that dotted delegate names cannot be used as slots"""
+    with pytest.raises(ValueError, match="not a valid identifier"):
+        merge_slots({}, (object,), ("_foo._bar",))
+
+
+def test_add_slots():
+    """Test add_slots creates an equivalent class with __slots__, preserving zero-arguments super()"""
+
+    class Base:
+        """Base class with empty slots"""
+
+        __slots__ = ()
+
+        def hello(self):
+            """Returns the name of the class"""
+            return "base"
+
+    class Foo(Base):
+        """Class calling super() without arguments"""
+
+        __slots__ = ("x",)
+
+        def __init__(self, foo):
+            self.foo = foo
+            self.x = 1
+
+        def hello(self):
+            """Returns the names of the class and of its base"""
+            return f"foo and {super().hello()}"
+
+    new_cls = add_slots(Foo, ("foo",))
+
+    assert new_cls is not Foo
+    assert new_cls.__qualname__ == Foo.__qualname__
+    assert new_cls.__slots__ == ("x", "foo")
+
+    obj = new_cls(foo=123)
+    assert not hasattr(obj, "__dict__")
+    assert obj.foo == 123 and obj.x == 1
+    assert obj.hello() == "foo and base"
+
+
+def test_slot_getters():
+    """Test that slot getters use member descriptors, with attrgetter as fallback"""
+
+    class Foo:
+        """Class with a slot"""
+
+        __slots__ = ("_foo",)
+
+    getters = slot_getters(Foo, ("_foo", "_bar"))
+    assert getters["_foo"] == Foo.__dict__["_foo"].__get__
+    assert isinstance(getters["_bar"], attrgetter)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("lazy", [True, False])
+def test_compclass_slots(foo_cls, bar_cls, baz_cls, compiled: bool, lazy: bool):
+    """Test compclass with slots"""
+    delegates = {"foo": delegatee(foo_cls, ("*", "__len__")), "bar": ("b",)}
+    Baz = compclass(baz_cls, delegates=delegates, verbose=False, compiled=compiled, lazy=lazy, slots=True)
+
+    assert Baz.__slots__ == ("foo", "bar")
+
+    baz_obj = Baz(foo_cls(value=111), bar_cls())
+    assert not hasattr(baz_obj, "__dict__")
+    assert len(baz_obj) == 123
+    assert baz_obj.get_foo() == 111
+    assert baz_obj.b == 0.1
+
+    baz_obj.a = 2
+    assert baz_obj.foo.a == 2
+
+
+def test_meta_slots(foo_cls, bar_cls):
+    """Test CompclassMeta with slots"""
+
+    class Baz(
+        metaclass=CompclassMeta,
+        delegates={"foo": delegatee(foo_cls, ("get_foo", "__len__")), "bar": ("b",)},
+        verbose=False,
+        slots=True,
+    ):
+        """Baz composed class using metaclass"""
+
+        __slots__ = ("other",)
+
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+            self.other = 1
+
+    assert Baz.__slots__ == ("other", "foo", "bar")
+
+    baz_obj = Baz(foo_cls(value=111), bar_cls())
+    assert not hasattr(baz_obj, "__dict__")
+    assert len(baz_obj) == 123
+    assert baz_obj.get_foo() == 111
+    assert baz_obj.b == 0.1
@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+
+from compclasses import (
+    Delegation,
+    compclass,
+    delegated_names,
+    delegatee,
+    resolve,
+)
+from compclasses._spec import SPEC_ATTR, SpecIndex, classify
+
+
+class Kinds:
+    """Class with an attribute of each kind"""
+
+    CONSTANT = 1
+
+    def __init__(self):
+        self.value = 0
+
+    def method(self):
+        """Method"""
+
+    @classmethod
+    def cls_method(cls):
+        """Class method"""
+
+    @staticmethod
+    def static_method():
+        """Static method"""
+
+    @property
+    def prop(self):
+        return self.value
+
+    def __len__(self):
+        return 0
+
+
+@pytest.mark.parametrize(
+    "delegatee_cls, attr_name, expected",
+    [
+        (Kinds, "CONSTANT", "attribute"),
+        (Kinds, "value", "attribute"),
+        (Kinds, "method", "method"),
+        (Kinds, "cls_method", "classmethod"),
+        (Kinds, "static_method", "staticmethod"),
+        (Kinds, "prop", "property"),
+        (Kinds, "__len__", "dunder"),
+        (list, "append", "method"),
+        (None, "method", "unknown"),
+        (None, "__len__", "dunder"),
+    ],
+)
+def test_classify(delegatee_cls, attr_name, expected):
+    """Test for classify function"""
+    assert classify(delegatee_cls, attr_name) == expected
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_compclass_spec(foo_cls, bar_cls, baz_cls, lazy: bool):
+    """Test the spec index attached by compclass"""
+    delegates = {
+        "foo": delegatee(foo_cls, ("a", "get_foo", "__len__"), prefix="pfx_", lazy=lazy),
+        "bar": ("b",),
+    }
+    Baz = compclass(baz_cls, delegates=delegates, lazy=lazy)
+
+    assert isinstance(Baz.__dict__[SPEC_ATTR], SpecIndex)
+    assert delegated_names(Baz) == ("__len__", "pfx_a", "pfx_get_foo", "b")
+    assert resolve(Baz, "pfx_get_foo") == Delegation("foo", "get_foo", "method")
+    assert resolve(Baz, "pfx_a") == Delegation("foo", "a", "attribute")
+    assert resolve(Baz, "__len__") == Delegation("foo", "__len__", "dunder")
+    assert resolve(Baz, "b") == Delegation("bar", "b", "unknown")
+    assert resolve(Baz, "get_foo") is None
+
+    baz_obj = Baz(foo_cls(value=1), bar_cls())
+    assert resolve(baz_obj, "b") == resolve(Baz, "b")
+
+
+def test_spec_is_lazy(foo_cls, baz_cls):
+    """Test that lazy delegatees are not parsed until the spec index is accessed"""
+    with mock.patch.object(delegatee, "_parse_attrs", return_value=("get_foo",)) as parse_mock:
+        Baz = compclass(baz_cls, delegates={"foo": delegatee(foo_cls, ("*",), lazy=True)}, lazy=True)
+        assert parse_mock.call_count == 0
+
+        assert delegated_names(Baz) == ("get_foo",)
+        assert parse_mock.call_count == 1
+
+
+def test_spec_inheritance(foo_cls, bar_cls):
+    """Test that spec indexes of composed base classes are merged, and that they are immutable"""
+
+    @compclass(delegates={"foo": delegatee(foo_cls, ("a", "get_foo"))})
+    class Base:
+        """Composed base class"""
+
+    @compclass(delegates={"bar": delegatee(bar_cls, ("b",)), "other": ("get_foo",)})
+    class Child(Base):
+        """Composed subclass"""
+
+    assert delegated_names(Base) == ("a", "get_foo")
+    assert delegated_names(Child) == ("a", "get_foo", "b")
+    assert resolve(Child, "get_foo") == Delegation("other", "get_foo", "unknown")
+    assert resolve(Child, "a") == resolve(Base, "a")
+
+    with pytest.raises(TypeError):
+        Child.__compclass_spec__["a"] = None  # type: ignore
+
+
+def test_not_composed():
+    """Test query helpers on classes which are not composed"""
+    assert resolve(Kinds, "method") is None
+    assert delegated_names(Kinds()) == tuple()
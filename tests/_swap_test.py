@@ -0,0 +1,290 @@
+import sys
+from threading import Event, Thread
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegated_names, delegatee, rebind, resolve, swap_delegate
+from compclasses._bound import BoundMethodCache
+from compclasses._cache import VERSION_ATTR
+from compclasses._inheritance import DELEGATES_ATTR
+from compclasses._spec import SPEC_ATTR
+
+
+class Pool:
+    """Delegatee class"""
+
+    def __init__(self, size: int = 1):
+        self.size = size
+
+    def acquire(self) -> str:
+        """Acquires from the pool"""
+        return f"acquired from {self.size}"
+
+    def release(self) -> str:
+        """Releases to the pool"""
+        return f"released to {self.size}"
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class Cache:
+    """Delegatee class exposing some of the names of `Pool`"""
+
+    def __init__(self):
+        self.size = -1
+
+    def release(self) -> str:
+        """Releases the cache"""
+        return "released cache"
+
+
+def compose(use_meta: bool, **options) -> type:
+    """Composes a class forwarding names to a `Pool`, with the decorator or the metaclass"""
+    delegates = {"_pool": delegatee(Pool, ("size", "acquire", "__len__"), **options.pop("delegatee_options", {}))}
+
+    if use_meta:
+
+        class Service(metaclass=CompclassMeta, delegates=delegates, **options):
+            """Composed class forwarding names of Pool"""
+
+            def __init__(self, pool: Pool):
+                self._pool = pool
+
+        return Service
+
+    @compclass(delegates=delegates, **options)
+    class Service:
+        """Composed class forwarding names of Pool"""
+
+        def __init__(self, pool: Pool):
+            self._pool = pool
+
+    return Service
+
+
+@pytest.mark.parametrize("cache_bound", [True, False])
+@pytest.mark.parametrize("compiled", [True, False])
+def test_swap_delegate(compiled: bool, cache_bound: bool):
+    """Test that swapped delegates are used by every forwarder, including cached bound methods"""
+    cls = compose(False, compiled=compiled, delegatee_options={"cache_bound": cache_bound})
+    obj, pool = cls(Pool(1)), Pool(2)
+    assert obj.acquire() == "acquired from 1"
+
+    assert swap_delegate(obj, "_pool", pool).size == 1
+    assert obj._pool is pool
+    assert (obj.acquire(), obj.size, len(obj)) == ("acquired from 2", 2, 2)
+
+    with pytest.raises(ValueError, match="'_other' is not a delegate of 'Service'"):
+        swap_delegate(obj, "_other", pool)
+
+
+@pytest.mark.parametrize("options", [{"weak": True}, {"lazy_factory": lambda self: Pool(3)}])
+def test_swap_delegate_holders(options: dict):
+    """Test that swapping a held delegate neither calls its factory nor returns the weak reference"""
+
+    @compclass(delegates={"_pool": delegatee(Pool, ("acquire",), **options)})
+    class Service:
+        """Composed class with a held delegate"""
+
+    obj, pool, other = Service(), Pool(4), Pool(5)
+    assert swap_delegate(obj, "_pool", pool) is None
+    assert swap_delegate(obj, "_pool", other) is pool
+    assert obj.acquire() == "acquired from 5"
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("use_meta", [True, False])
+def test_rebind(use_meta: bool, compiled: bool, lazy: bool):
+    """Test that rebinding forwards the new names only, in place"""
+    cls = compose(use_meta, compiled=compiled, lazy=lazy)
+    obj = cls(Pool(1))
+    assert obj.acquire() == "acquired from 1"
+
+    assert rebind(cls, "_pool", ("acquire", "release", "__len__")) is cls
+
+    assert (obj.acquire(), obj.release(), len(obj)) == ("acquired from 1", "released to 1", 1)
+    assert sorted(delegated_names(cls)) == ["__len__", "acquire", "release"]
+    assert resolve(obj, "release") == ("_pool", "release", "method")
+    assert resolve(cls, "size") is None
+    assert getattr(cls, VERSION_ATTR) == 1
+    with pytest.raises(AttributeError):
+        obj.size
+
+
+def test_rebind_delegatee():
+    """Test that iterables keep the options of the current delegatee, which a new delegatee replaces"""
+    cls = compose(False, delegatee_options={"prefix": "pool_"})
+    obj = cls(Pool(1))
+
+    rebind(cls, "_pool", ("release",))
+    assert obj.pool_release() == "released to 1"
+    assert not hasattr(obj, "pool_acquire")
+
+    rebind(cls, "_pool", delegatee(Pool, ("release",), suffix="_now"))
+    assert obj.release_now() == "released to 1"
+    assert not hasattr(obj, "pool_release")
+
+
+def test_rebind_cache_bound():
+    """Test that bound methods cached by replaced descriptors are dropped once the delegate is reassigned or swapped"""
+    cls = compose(False)
+    obj, other = cls(Pool(1)), cls(Pool(1))
+    rebind(cls, "_pool", delegatee(Pool, ("acquire", "release"), cache_bound=True))
+
+    for instance in (obj, other):
+        assert (instance.acquire(), instance.release()) == ("acquired from 1", "released to 1")
+    assert isinstance(cls.__dict__["release"], BoundMethodCache)
+    assert "release" in vars(obj)
+
+    rebind(cls, "_pool", delegatee(Pool, ("acquire",), cache_bound=True, prefix="pool_"))
+    assert "release" not in delegated_names(cls)
+
+    obj._pool = Pool(2)
+    swap_delegate(other, "_pool", Pool(3))
+    for instance in (obj, other):
+        assert "release" not in vars(instance)
+        with pytest.raises(AttributeError):
+            instance.release
+    assert (obj.pool_acquire(), other.pool_acquire()) == ("acquired from 2", "acquired from 3")
+
+
+@pytest.mark.parametrize("conflicts, expected", [("first", "released to 1"), ("dispatch", "released to 1")])
+def test_rebind_conflicts(conflicts, expected: str):
+    """Test that names colliding with other delegates are resolved again"""
+
+    @compclass(delegates={"_pool": ("release",), "_cache": ("release", "size")}, conflicts=conflicts)
+    class Service:
+        """Composed class whose delegates forward the same name"""
+
+        def __init__(self):
+            self._pool, self._cache = Pool(1), Cache()
+
+    obj, size = Service(), Service.__dict__["size"]
+    assert obj.release() == expected
+
+    rebind(Service, "_pool", ("acquire",))
+    assert obj.release() == "released cache"
+    assert Service.__dict__["size"] is size  # descriptors of names not forwarded to `_pool` are left untouched
+    assert resolve(Service, "release").delegatee_name == "_cache"
+
+    rebind(Service, "_cache", ("size",))
+    assert not hasattr(obj, "release")
+
+
+def test_rebind_chain():
+    """Test that classes forwarding names through a rebound class are rebound as well"""
+
+    @compclass(delegates={"_pool": delegatee(Pool, ("size", "acquire"))})
+    class Inner:
+        """Composed class forwarding names of Pool"""
+
+        def __init__(self):
+            self._pool = Pool(7)
+
+    @compclass(delegates={"_inner": delegatee(Inner, ("size", "acquire"), validate=False, flatten=True)})
+    class Outer:
+        """Composed class forwarding names through Inner"""
+
+        def __init__(self):
+            self._inner = Inner()
+
+    obj = Outer()
+    assert Outer.__dict__["size"].delegatee_name == "_inner._pool"  # flattened
+    assert obj.acquire() == "acquired from 7"
+
+    rebind(Inner, "_pool", ("acquire",))
+    assert obj.acquire() == "acquired from 7"
+    with pytest.raises(AttributeError):
+        obj.size
+    assert getattr(Outer, VERSION_ATTR) == 1
+
+
+def test_rebind_inherited():
+    """Test that rebinding a subclass masks the names it no longer forwards, leaving the base class untouched"""
+    base = compose(False)
+    child = type("Child", (base,), {})
+
+    rebind(child, "_pool", ("acquire",))
+    assert base(Pool(1)).size == 1
+    with pytest.raises(AttributeError):
+        child(Pool(1)).size
+    with pytest.raises(TypeError):
+        len(child(Pool(1)))
+
+
+def test_rebind_subclasses():
+    """Test that composed subclasses inheriting the rebound delegate record the new names, unless they override it"""
+    base = compose(False)
+
+    @compclass(delegates={"_cache": ("release",)})
+    class Sub(base):
+        """Composed subclass adding a delegate"""
+
+    class Plain(Sub):
+        """Plain subclass"""
+
+    @compclass(delegates={"_other": ("acquire",)})
+    class Deep(Plain):
+        """Composed subclass of a plain subclass"""
+
+    @compclass(delegates={"_pool": ("acquire",)})
+    class Overriding(base):
+        """Composed subclass overriding the rebound delegate"""
+
+    rebind(base, "_pool", ("acquire", "release", "__len__"))
+
+    assert "__len__" in delegated_names(Sub) and "size" not in delegated_names(Sub)
+    assert resolve(Sub, "release").delegatee_name == "_cache"  # forwarded by `Sub` itself
+    assert resolve(Deep, "acquire").delegatee_name == "_other"
+    assert resolve(Deep, "size") is None and resolve(Deep, "__len__").delegatee_name == "_pool"
+    assert getattr(Deep, DELEGATES_ATTR)["_pool"] is getattr(base, DELEGATES_ATTR)["_pool"]
+    assert delegated_names(Overriding) == ("acquire",)
+
+
+@pytest.mark.skipif(not getattr(sys, "_is_gil_enabled", lambda: True)(), reason="publication relies on the GIL")
+def test_rebind_concurrent_reads():
+    """Test that threads reading the class namespace see either the names forwarded before a rebind or after it"""
+    cls = compose(False)
+    before, after = ("size", "acquire", "__len__"), ("acquire", "release")
+    done, snapshots = Event(), []
+
+    def read():
+        while not done.is_set():
+            namespace = dict(vars(cls))  # a single read of the whole namespace
+            snapshots.append(({"size", "__len__", "release"} & set(namespace), namespace[SPEC_ATTR]))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    readers = [Thread(target=read) for _ in range(4)]
+    try:
+        for reader in readers:
+            reader.start()
+        for idx in range(200):
+            rebind(cls, "_pool", after if idx % 2 == 0 else before)
+    finally:
+        done.set()
+        for reader in readers:
+            reader.join()
+        sys.setswitchinterval(interval)
+
+    assert getattr(cls, VERSION_ATTR) == 200
+    for names, spec in snapshots:
+        assert names in ({"size", "__len__"}, {"release"})
+        assert names == set(spec).intersection(("size", "__len__", "release"))
+
+
+def test_rebind_errors():
+    """Test that invalid rebinds raise, leaving the class untouched"""
+    cls = compose(False)
+
+    with pytest.raises(ValueError, match="'_other' is not a delegate of 'Service'"):
+        rebind(cls, "_other", ("acquire",))
+    with pytest.raises(ValueError, match="cannot change how the delegate is held"):
+        rebind(cls, "_pool", delegatee(Pool, ("acquire",), weak=True))
+    with pytest.raises(AttributeError, match="has no attribute nor method 'missing'"):
+        rebind(cls, "_pool", ("acquire", "missing"))
+
+    assert delegated_names(cls) == ("__len__", "size", "acquire")
+    assert cls(Pool(1)).size == 1
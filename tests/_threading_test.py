@@ -0,0 +1,148 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, reset_stats, stats
+
+
+class Point:
+    """Delegatee class"""
+
+    def __init__(self, x: float):
+        self.x = x
+
+    def scale(self, factor: float) -> float:
+        """Returns x multiplied by factor"""
+        return self.x * factor
+
+    def __len__(self):
+        return 2
+
+
+DELEGATES = {"_point": delegatee(Point, ("x", "scale", "__len__"), prefix="p_")}
+NAMES = ("p_x", "p_scale", "__len__")
+
+
+@pytest.fixture
+def switch_often():
+    """Makes the interpreter switch threads as often as possible, to expose races"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def build(index: int):
+    """Composes a new class over Point, alternating decorator/metaclass and options"""
+    options = {"lazy": index % 3 == 0, "slots": index % 5 == 0, "compiled": index % 2 == 0}
+
+    if index % 4 == 0:
+
+        class Composed(metaclass=CompclassMeta, delegates=DELEGATES, **options):
+            """Composed class forwarding names of Point"""
+
+            def __init__(self, x: float):
+                self._point = Point(x)
+
+    else:
+
+        @compclass(delegates=DELEGATES, **options)
+        class Composed:
+            """Composed class forwarding names of Point"""
+
+            def __init__(self, x: float):
+                self._point = Point(x)
+
+    return Composed
+
+
+@pytest.mark.usefixtures("switch_often")
+def test_concurrent_construction():
+    """Test that thousands of classes composed concurrently are complete, and share their cached descriptors"""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        classes = list(pool.map(build, range(2000)))
+
+    def check(cls):
+        obj = cls(2.0)
+        return obj.p_x, obj.p_scale(3), len(obj)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert set(pool.map(check, classes)) == {(2.0, 6.0, 2)}
+
+    plain = [cls for index, cls in enumerate(classes) if index % 60 in (1, 7)]  # decorated, eager, not slotted
+    assert all(cls.__dict__[name] is plain[0].__dict__[name] for cls in plain for name in NAMES)
+
+
+@pytest.mark.usefixtures("switch_often")
+def test_concurrent_instrumentation():
+    """Test that concurrent calls of an instrumented forwarder are all counted"""
+
+    @compclass(delegates=DELEGATES, instrument=True, compiled=True)
+    class Instrumented:
+        """Instrumented composed class"""
+
+        def __init__(self, x: float):
+            self._point = Point(x)
+
+    reset_stats()
+    obj = Instrumented(1.0)
+
+    def call(_):
+        for _ in range(1000):
+            obj.p_scale(2)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(call, range(8)))
+
+    key = (f"{__name__}.test_concurrent_instrumentation.<locals>.Instrumented", "_point", "scale", "call")
+    assert stats()[key].calls == 8000
+
+
+@pytest.mark.usefixtures("switch_often")
+def test_concurrent_materialization():
+    """Test that concurrent first accesses to a lazy class install each descriptor exactly once"""
+    Composed = build(3)
+    objs = [Composed(float(i)) for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(lambda obj: obj.p_scale(2), objs)) == [2.0 * i for i in range(64)]
+    assert "p_scale" in Composed.__dict__
+
+
+def test_materialization_missed_lookup():
+    """Test that a lookup which missed the descriptor before another thread installed it still resolves the name"""
+    Composed = build(3)
+    obj = Composed(1.0)
+    assert obj.p_scale(2) == 2.0
+
+    # Interleaving of a thread whose class lookup ran before the descriptor was installed: `__getattr__` is called
+    # once the name is no longer pending.
+    assert Composed.__getattr__(obj, "p_scale")(3) == 3.0
+    assert Composed.__getattr__(obj, "p_x") == 1.0
+    with pytest.raises(AttributeError):
+        Composed.__getattr__(obj, "unknown")
+
+
+@pytest.mark.parametrize(
+    "delegates, pickling, context",
+    [
+        (
+            {**DELEGATES, "_other": delegatee(Point, ("missing",), lazy=True)},
+            None,
+            pytest.raises(AttributeError),
+        ),
+        (DELEGATES, {"unknown": "copy"}, pytest.raises(ValueError, match="not a delegate")),
+    ],
+)
+def test_failure_publishes_nothing(delegates, pickling, context):
+    """Test that a class is left untouched if composing it fails"""
+
+    class Existing:
+        """Class failing to be composed"""
+
+    before = dict(Existing.__dict__)
+    with context:
+        compclass(Existing, delegates=delegates, pickling=pickling)
+
+    assert dict(Existing.__dict__) == before
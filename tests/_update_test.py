@@ -0,0 +1,99 @@
+import pytest
+
+from compclasses import CompclassMeta, compclass, delegatee, update
+
+
+class Settings:
+    """Delegatee class with settable attributes"""
+
+    def __init__(self):
+        self.timeout = 1
+        self.retries = 0
+        self.name = "default"
+
+    def connect(self):
+        """Returns the timeout"""
+        return self.timeout
+
+
+class Pool:
+    """Delegatee class of fan-out members"""
+
+    def __init__(self):
+        self.size = 1
+
+
+DELEGATES = {
+    "_settings": delegatee(Settings, ("timeout", "retries", "name", "connect"), prefix="cfg_", readonly=("name",)),
+    "_workers": delegatee(Pool, ("size",), fanout=True),
+}
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_update(lazy: bool):
+    """Test that update writes every forwarded attribute to the source attribute of its delegate"""
+
+    @compclass(delegates=DELEGATES, lazy=lazy)
+    class Service:
+        """Composed class with settings and fan-out delegates"""
+
+        def __init__(self):
+            self._settings = Settings()
+            self._workers = [Pool(), Pool()]
+
+    service = Service()
+    update(service, cfg_timeout=10, cfg_retries=3, size=4)
+
+    assert (service._settings.timeout, service._settings.retries) == (10, 3)
+    assert (service.cfg_timeout, service.cfg_retries) == (10, 3)
+    assert not hasattr(service._settings, "cfg_timeout")
+    assert service.size == (4, 4)
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"cfg_timeout": 10, "cfg_name": "new"}, "is read-only"),
+        ({"cfg_timeout": 10, "cfg_connect": None}, "has no forwarded attribute 'cfg_connect'"),
+        ({"cfg_timeout": 10, "unknown": None}, "has no forwarded attribute 'unknown'"),
+    ],
+)
+def test_update_raise(kwargs, match):
+    """Test that update validates every name before writing any of them"""
+
+    class Service(metaclass=CompclassMeta, delegates=DELEGATES):
+        """Composed class with settings and fan-out delegates"""
+
+        def __init__(self):
+            self._settings = Settings()
+            self._workers = []
+
+    service = Service()
+    with pytest.raises(AttributeError, match=match):
+        update(service, **kwargs)
+
+    assert service.cfg_timeout == 1
+
+
+def test_readonly():
+    """Test that read-only attributes cannot be set nor deleted, while the others are written to the delegate"""
+
+    @compclass(delegates=DELEGATES)
+    class Service:
+        """Composed class with a read-only forwarded attribute"""
+
+        def __init__(self):
+            self._settings = Settings()
+            self._workers = []
+
+    service = Service()
+    assert service.cfg_name == "default"
+
+    with pytest.raises(AttributeError):
+        service.cfg_name = "new"
+    with pytest.raises(AttributeError):
+        del service.cfg_name
+
+    service.cfg_retries = 5
+    assert service._settings.retries == 5
+    assert not hasattr(service._settings, "cfg_retries")
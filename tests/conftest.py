@@ -27,7 +27,20 @@ def create_foo_cls() -> Type:
             """Custom foo len method"""
             return 123
 
-        # TODO: add staticmethod's, classmethod's, property's to test
+        @staticmethod
+        def static_foo(value: int) -> int:
+            """Static method"""
+            return 2 * value
+
+        @classmethod
+        def from_str(cls, value: str):
+            """Class method"""
+            return cls(int(value))
+
+        @property
+        def foo_value(self) -> int:
+            """Property of _foo attribute"""
+            return self._foo
 
     return Foo
 